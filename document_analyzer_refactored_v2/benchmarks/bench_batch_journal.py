@@ -0,0 +1,101 @@
+"""
+일괄 분석 작업 기록(이어서 분석하기) 벤치마크
+일괄 분석이 --stop 개 파일에서 중단된 뒤 다시 실행할 때의 소요 시간 비교
+- 기존: 작업 기록 없음 → 모든 파일 다시 분석
+- 현재: BatchJournal 로 끝난 파일은 저장된 결과를 쓰고 나머지만 분석
+또한 기록 --entries 줄짜리 작업 기록을 읽어 완료 상태를 복원하는 시간을 측정한다.
+
+로컬에 Ollama 를 흉내 내는 서버(bench_llm_dispatcher.SlotOllamaHandler)를 띄워 측정한다.
+
+사용법:
+    python benchmarks/bench_batch_journal.py [--docs 40] [--stop 30] [--entries 100000]
+"""
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_llm_dispatcher import MODEL, SAMPLE, SlotOllamaHandler
+
+from core.batch_journal import BatchJournal
+from core.ollama_client import configure_ollama_client
+from threads.batch_thread import BatchAnalysisThread
+
+
+def run(paths, journal=None, stop: int = 0):
+    """일괄 분석 1회 (stop 개 파일이 끝나면 취소), (완료 파일 수, 시간) 반환"""
+    thread = BatchAnalysisThread(paths, MODEL, use_llm_cache=False, journal=journal)
+    finished = []
+
+    def on_finished(*args):
+        finished.append(args[0])
+        if stop and len(finished) >= stop:
+            thread.cancel()
+
+    thread.file_finished.connect(on_finished)
+    start = time.perf_counter()
+    thread.run()
+    return len(finished), time.perf_counter() - start
+
+
+def measure_load(journal_dir: str, entries: int) -> float:
+    """entries 줄짜리 작업 기록의 완료 상태 복원 시간 (초)"""
+    paths = [f"/data/share/doc{i}.pdf" for i in range(entries)]
+    journal = BatchJournal(paths, MODEL, journal_dir=journal_dir)
+    journal.path.mkdir(parents=True)
+    with open(journal.path / BatchJournal.JOURNAL_FILE, 'w', encoding='utf-8') as f:
+        for i, path in enumerate(paths):
+            f.write(json.dumps({'path': path, 'status': 'done', 'size': 1024, 'mtime_ns': i,
+                                'hash': f"{i:064x}", 'offset': i * 512, 'length': 512}) + '\n')
+
+    start = time.perf_counter()
+    completed = BatchJournal(paths, MODEL, journal_dir=journal_dir).completed_count()
+    elapsed = time.perf_counter() - start
+    assert completed == entries
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일괄 분석 작업 기록 벤치마크")
+    parser.add_argument('--docs', type=int, default=40, help="문서 수")
+    parser.add_argument('--stop', type=int, default=30, help="중단 시점 (완료 파일 수)")
+    parser.add_argument('--delay', type=float, default=0.2, help="LLM 요청당 처리 시간 (초)")
+    parser.add_argument('--entries', type=int, default=100000, help="복원 시간 측정용 기록 줄 수")
+    args = parser.parse_args()
+
+    SlotOllamaHandler.slots = threading.Semaphore(4)
+    SlotOllamaHandler.delay = args.delay
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlotOllamaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    configure_ollama_client(base_url=f"http://127.0.0.1:{server.server_address[1]}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.docs):
+            path = Path(tmp) / f"doc{i}.txt"
+            path.write_text(f"[문서 {i}]\n" + SAMPLE * 5, encoding='utf-8')
+            paths.append(str(path))
+        journal_dir = str(Path(tmp) / 'jobs')
+
+        # 중단된 작업 (작업 기록 남김)
+        run(paths, BatchJournal(paths, MODEL, journal_dir=journal_dir), stop=args.stop)
+        legacy_count, legacy_time = run(paths)
+        resumed_count, resumed_time = run(paths, BatchJournal(paths, MODEL, journal_dir=journal_dir))
+        load_time = measure_load(str(Path(tmp) / 'load'), args.entries)
+    server.shutdown()
+
+    print(f"문서 {args.docs}개, {args.stop}개 완료 후 중단, LLM 요청당 {args.delay:.2f}초")
+    print(f"{'방식':<16} {'전송 파일':>10} {'시간(초)':>10}")
+    print(f"{'처음부터 다시':<16} {legacy_count:>10} {legacy_time:>10.3f}")
+    print(f"{'이어서 분석':<16} {resumed_count:>10} {resumed_time:>10.3f}")
+    print(f"작업 기록 {args.entries}줄 복원: {load_time * 1000:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
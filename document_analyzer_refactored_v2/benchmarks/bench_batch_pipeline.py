@@ -0,0 +1,117 @@
+"""
+일괄 분석 파이프라인 벤치마크
+파일 여러 개를 일괄 분석할 때 기존 방식과 BatchPipeline 의 총 소요 시간 비교
+- 기존: 한 스레드에서 파일마다 추출 → 탐지 후 LLM 은 디스패처로 (추출/탐지는 CPU 코어 1개)
+- 현재: 추출 / 탐지 작업 프로세스 풀 + LLM 디스패처, 단계 사이 제한된 대기열
+
+로컬에 Ollama 를 흉내 내는 서버(bench_llm_dispatcher.SlotOllamaHandler)를 띄워 측정한다.
+문서는 DOCX 로 만들어 실제 추출 비용이 들도록 한다. CPU 코어가 많을수록 차이가 크다.
+
+사용법:
+    python benchmarks/bench_batch_pipeline.py [--docs 32] [--workers 0] [--delay 0.2]
+"""
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import docx
+
+from bench_llm_dispatcher import MODEL, SAMPLE, SlotOllamaHandler
+
+from core.analyzer import LocalLLMAnalyzer
+from core.batch_pipeline import BatchPipeline, shutdown_pools
+from core.document_processor import DocumentProcessor
+from core.llm_dispatcher import LLMDispatcher
+from core.ollama_client import configure_ollama_client
+from utils.constants import BATCH_PREFETCH
+
+
+def run_legacy(analyzer: LocalLLMAnalyzer, paths, concurrency: int):
+    """기존 방식: 추출 / 탐지는 한 스레드에서 차례로, LLM 만 동시 요청 (입력 순서로 결과)"""
+    processor = DocumentProcessor()
+    results = []
+    pending = deque()
+    with LLMDispatcher(concurrency) as dispatcher:
+        for path in paths:
+            while pending and (len(pending) >= concurrency + BATCH_PREFETCH or pending[0][3].done()):
+                text, detection, analysis, future = pending.popleft()
+                results.append(analyzer.finish_analysis(text, detection, analysis, future.result()))
+            text, boundaries = processor.extract_text_with_boundaries(path)
+            detection, analysis = analyzer.prepare_analysis(text, boundaries)
+            pending.append((text, detection, analysis,
+                            dispatcher.submit(analyzer.run_llm_analysis, text, detection)))
+        while pending:
+            text, detection, analysis, future = pending.popleft()
+            results.append(analyzer.finish_analysis(text, detection, analysis, future.result()))
+    return results
+
+
+def run_pipeline(analyzer: LocalLLMAnalyzer, paths, concurrency: int, workers: int):
+    """현재 방식: BatchPipeline (LLM 이 끝난 순서로 결과)"""
+    with LLMDispatcher(concurrency) as dispatcher:
+        pipeline = BatchPipeline(analyzer, dispatcher, extract_workers=workers, detect_workers=workers)
+        return [(item.result, item.detected) for item in pipeline.run(paths)]
+
+
+def write_docx(path: Path, index: int, paragraphs: int):
+    document = docx.Document()
+    for i in range(paragraphs):
+        document.add_paragraph(f"[문서 {index} / {i}] " + SAMPLE)
+    document.save(str(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일괄 분석 파이프라인 벤치마크")
+    parser.add_argument('--docs', type=int, default=32, help="문서 수")
+    parser.add_argument('--paragraphs', type=int, default=200, help="문서당 문단 수")
+    parser.add_argument('--workers', type=int, default=0,
+                        help="단계별 작업 프로세스 수 (0 이면 CPU 코어 수 기준 자동)")
+    parser.add_argument('--slots', type=int, default=4, help="서버 동시 처리 슬롯 (OLLAMA_NUM_PARALLEL)")
+    parser.add_argument('--delay', type=float, default=0.2, help="LLM 요청당 처리 시간 (초)")
+    args = parser.parse_args()
+
+    SlotOllamaHandler.slots = threading.Semaphore(args.slots)
+    SlotOllamaHandler.delay = args.delay
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlotOllamaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    configure_ollama_client(base_url=f"http://127.0.0.1:{server.server_address[1]}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.docs):
+            path = Path(tmp) / f"doc{i}.docx"
+            write_docx(path, i, args.paragraphs)
+            paths.append(str(path))
+
+        analyzer = LocalLLMAnalyzer(MODEL, use_llm_cache=False)
+
+        start = time.perf_counter()
+        legacy = run_legacy(analyzer, paths, args.slots)
+        legacy_time = time.perf_counter() - start
+
+        # 작업 프로세스 기동 비용은 첫 일괄 분석에만 들므로 한 번 돌린 뒤 측정
+        run_pipeline(analyzer, paths[:2], args.slots, args.workers)
+        start = time.perf_counter()
+        pipelined = run_pipeline(analyzer, paths, args.slots, args.workers)
+        pipeline_time = time.perf_counter() - start
+    shutdown_pools()
+    server.shutdown()
+
+    same = sorted(len(detected) for _, detected in legacy) == sorted(len(detected) for _, detected in pipelined)
+    print(f"문서 {args.docs}개 (DOCX, 문단 {args.paragraphs}개), 서버 슬롯 {args.slots}개, "
+          f"요청당 {args.delay:.2f}초")
+    print(f"{'방식':<12} {'총 시간(초)':>12} {'문서/초':>10}")
+    for name, elapsed in (('기존', legacy_time), ('파이프라인', pipeline_time)):
+        print(f"{name:<12} {elapsed:>12.3f} {args.docs / elapsed:>10.2f}")
+    print(f"속도 향상: {legacy_time / pipeline_time:.2f}배, 결과 일치: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+명령줄 일괄 분석 시작 비용 벤치마크
+새 프로세스의 실행 시간(인터프리터 시작 포함) / 최대 메모리(RSS) 비교
+- GUI: main.py 와 같이 QApplication + 메인 윈도우 생성 (창을 띄우기까지)
+- CLI: python -m cli 로 작은 문서 1개를 규칙 기반 분석 (--no-llm, 현재 프로세스에서 처리)
+CLI 프로세스에 PyQt5 가 로드되었는지도 확인한다.
+
+화면이 없는 환경에서는 QT_QPA_PLATFORM=offscreen 으로 GUI 를 띄운다.
+
+사용법:
+    python benchmarks/bench_cli_startup.py [--repeat 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench_llm_dispatcher import SAMPLE
+
+# 측정 대상 코드 실행 후 (최대 RSS KB, PyQt5 로드 여부)를 JSON 으로 출력
+_MEASURE = '''
+import json, resource, sys
+{body}
+print(json.dumps([resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                  any(m.startswith('PyQt5') for m in sys.modules)]), file=sys.stderr)
+'''
+
+_GUI = '''
+from PyQt5.QtWidgets import QApplication
+from gui import DocumentAnalyzerGUI
+app = QApplication(sys.argv)
+window = DocumentAnalyzerGUI()
+window.show()
+app.processEvents()
+'''
+
+_CLI = '''
+import runpy
+sys.argv = ['cli', {path!r}, '--no-llm', '--workers', '1', '--quiet', '--output', {output!r}]
+try:
+    runpy.run_module('cli', run_name='__main__')
+except SystemExit:
+    pass
+'''
+
+
+def measure(body: str, cwd: str, env: dict):
+    """새 프로세스에서 1회 측정 (시간(초), 최대 RSS(MB), PyQt5 로드 여부)"""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-c', _MEASURE.format(body=body)],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True
+    )
+    elapsed = time.perf_counter() - start
+    rss_kb, qt = json.loads(proc.stderr.strip().splitlines()[-1])
+    return elapsed, rss_kb / 1024, qt
+
+
+def main():
+    parser = argparse.ArgumentParser(description="명령줄 일괄 분석 시작 비용 벤치마크")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 설정 / 로그 / 이력 파일은 임시 디렉토리에 생성
+        env = dict(os.environ, PYTHONPATH=str(ROOT), XDG_CONFIG_HOME=tmp,
+                   QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+        doc = Path(tmp) / 'doc.txt'
+        doc.write_text(SAMPLE, encoding='utf-8')
+        cli = _CLI.format(path=str(doc), output=str(Path(tmp) / 'out.jsonl'))
+
+        rows = []
+        for name, body in (('GUI 시작', _GUI), ('CLI 분석', cli)):
+            runs = [measure(body, tmp, env) for _ in range(args.repeat)]
+            rows.append((name, statistics.median(r[0] for r in runs),
+                         statistics.median(r[1] for r in runs), runs[0][2]))
+
+    print(f"{'방식':<10} {'시간(초)':>10} {'최대 RSS(MB)':>14} {'PyQt5':>6}")
+    for name, elapsed, rss, qt in rows:
+        print(f"{name:<10} {elapsed:>10.3f} {rss:>14.1f} {'예' if qt else '아니오':>6}")
+    gui, cli = rows
+    print(f"CLI / GUI: 시간 {cli[1] / gui[1]:.0%}, 메모리 {cli[2] / gui[2]:.0%}")
+
+
+if __name__ == '__main__':
+    main()
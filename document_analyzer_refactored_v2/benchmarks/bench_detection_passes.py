@@ -0,0 +1,100 @@
+"""
+탐지 실행 횟수 벤치마크
+comprehensive_analysis 1회당 규칙 기반 탐지(정규식 + 키워드) 실행 횟수와 소요 시간
+
+Ollama 에 접속할 수 없는 경우(LLM 실패 → 규칙 기반 대체 분석)를 측정한다.
+- 기존: 1~2단계 탐지 + 규칙 기반 분석 재탐지 + LLM 대체 분석 재탐지 = 3회
+- 현재: DetectionResult 공유 = 1회
+
+사용법:
+    python benchmarks/bench_detection_passes.py [--docs 20] [--size 50000]
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.analyzer import LocalLLMAnalyzer
+from core.ollama_client import configure_ollama_client
+
+# 접속 불가 주소 (연결 즉시 거부) → LLM 대체 분석 경로
+configure_ollama_client(base_url='http://127.0.0.1:9')
+
+
+def make_document(size: int, rng: random.Random) -> str:
+    """개인정보와 민감정보 키워드가 섞인 합성 문서 생성"""
+    pieces = [
+        "성명: 홍길동 주민등록번호 900101-1234567 ",
+        "연락처 010-1234-5678 이메일 hong@example.com ",
+        "환자: 김철수 진단 결과 당뇨 치료 중 ",
+        "서울특별시 강남구 테헤란로 123 ",
+        "회의록 일반 업무 내용입니다. 일정 조율 및 검토 ",
+        "카드번호 1234-5678-9012-3456 계좌번호 110-123-456789 ",
+    ]
+    parts = []
+    length = 0
+    while length < size:
+        piece = rng.choice(pieces)
+        parts.append(piece)
+        length += len(piece)
+    return ''.join(parts)[:size]
+
+
+class PassCounter:
+    """탐지 메서드 호출 횟수 계측"""
+
+    def __init__(self, analyzer: LocalLLMAnalyzer):
+        self.calls = 0
+        original = analyzer.detect_sensitive_info_regex
+
+        def counted(text):
+            self.calls += 1
+            return original(text)
+
+        analyzer.detect_sensitive_info_regex = counted
+
+
+def legacy_analysis(analyzer: LocalLLMAnalyzer, text: str):
+    """기존 흐름의 탐지 작업 재현 (단계마다 새로 탐지)"""
+    analyzer.detect_sensitive_info_regex(text)
+    analyzer.detect_sensitive_keywords(text)
+    analyzer._create_enhanced_analysis(text)
+    analyzer._create_enhanced_analysis(text)
+
+
+def measure(func, analyzer, docs):
+    counter = PassCounter(analyzer)
+    start = time.perf_counter()
+    for text in docs:
+        func(analyzer, text)
+    return time.perf_counter() - start, counter.calls / len(docs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="탐지 실행 횟수 벤치마크")
+    parser.add_argument('--docs', type=int, default=20, help="문서 수")
+    parser.add_argument('--size', type=int, default=50000, help="문서당 글자 수")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(42)
+    docs = [make_document(args.size, rng) for _ in range(args.docs)]
+
+    legacy_time, legacy_passes = measure(legacy_analysis, LocalLLMAnalyzer(), docs)
+    current_time, current_passes = measure(
+        lambda analyzer, text: analyzer.comprehensive_analysis(text), LocalLLMAnalyzer(), docs
+    )
+
+    print(f"{'방식':<10} {'문서당 탐지':>12} {'총 시간(초)':>12}")
+    print(f"{'기존':<10} {legacy_passes:>12.0f} {legacy_time:>12.3f}")
+    print(f"{'현재':<10} {current_passes:>12.0f} {current_time:>12.3f}")
+    print(f"탐지 횟수 {legacy_passes / current_passes:.0f}배 감소, "
+          f"시간 {legacy_time / current_time:.1f}배 단축")
+
+
+if __name__ == '__main__':
+    main()
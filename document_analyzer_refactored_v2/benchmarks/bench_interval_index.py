@@ -0,0 +1,93 @@
+"""
+구간 인덱스 벤치마크
+탐지 범위 중복 검사: 기존 목록 순회(O(n²)) vs IntervalIndex(O(n log n))
+
+사용법:
+    python benchmarks/bench_interval_index.py [--count 100000] [--naive-limit 20000]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.interval_index import IntervalIndex
+
+
+def make_matches(count: int, seed: int = 42) -> list:
+    """전화번호가 가득한 스프레드시트 형태의 합성 매치 생성 (일부 중복 포함)"""
+    rng = random.Random(seed)
+    matches = []
+    pos = 0
+    for _ in range(count):
+        length = rng.randint(11, 14)
+        matches.append((pos, pos + length))
+        # 10%는 직전 매치와 겹치는 후보 (다른 유형의 중복 매치)
+        if rng.random() < 0.1:
+            matches.append((pos + 4, pos + 4 + length))
+        pos += length + rng.randint(1, 30)
+    rng.shuffle(matches)
+    return matches[:count]
+
+
+def dedupe_naive(matches: list) -> int:
+    """기존 방식: 채택된 모든 범위와 비교"""
+    accepted = []
+    for start, end in matches:
+        if not any(not (end <= s or e <= start) for s, e in accepted):
+            accepted.append((start, end))
+    return len(accepted)
+
+
+def dedupe_indexed(matches: list) -> int:
+    """IntervalIndex 사용"""
+    index = IntervalIndex()
+    for start, end in matches:
+        if not index.overlaps(start, end):
+            index.add(start, end)
+    return len(index)
+
+
+def measure(func, matches: list):
+    start = time.perf_counter()
+    result = func(matches)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="구간 인덱스 벤치마크")
+    parser.add_argument('--count', type=int, default=100000, help="최대 매치 수")
+    parser.add_argument('--naive-limit', type=int, default=20000,
+                        help="기존 방식을 실제로 실행할 최대 매치 수 (초과 시 추정)")
+    args = parser.parse_args()
+
+    sizes = sorted({min(n, args.count) for n in (1000, 10000, args.count)})
+    last_naive = None
+
+    print(f"{'매치 수':>10} {'기존(초)':>12} {'인덱스(초)':>12} {'배율':>10}")
+    for size in sizes:
+        matches = make_matches(size)
+        indexed_time, indexed_count = measure(dedupe_indexed, matches)
+
+        if size <= args.naive_limit:
+            naive_time, naive_count = measure(dedupe_naive, matches)
+            assert naive_count == indexed_count, "결과 불일치"
+            last_naive = (size, naive_time)
+            naive_label = f"{naive_time:12.3f}"
+        elif last_naive:
+            # O(n²) 추정치
+            base_size, base_time = last_naive
+            naive_time = base_time * (size / base_size) ** 2
+            naive_label = f"{'~' + format(naive_time, '.1f'):>12}"
+        else:
+            naive_time = None
+            naive_label = f"{'-':>12}"
+
+        ratio = f"{naive_time / indexed_time:9.0f}x" if naive_time else f"{'-':>10}"
+        print(f"{size:>10} {naive_label} {indexed_time:12.3f} {ratio}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+LLM 분석 결과 캐시 벤치마크
+같은 문서 묶음을 두 번 분석할 때(일괄 분석 재실행, 이력에서 다시 열기)
+LLM 요청 수와 소요 시간 비교, 그리고 일부만 수정한 문서의 재분석 요청 수
+
+로컬에 Ollama 를 흉내 내는 서버(bench_llm_dispatcher.SlotOllamaHandler)를 띄워 측정하며,
+캐시는 임시 디렉토리를 사용한다.
+
+사용법:
+    python benchmarks/bench_llm_cache.py [--docs 8] [--delay 0.3] [--repeat 300]
+"""
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_llm_dispatcher import MODEL, SAMPLE, SlotOllamaHandler
+
+from core.analyzer import LocalLLMAnalyzer
+from core.llm_cache import LLMResultCache
+from core.ollama_client import configure_ollama_client
+
+
+class CountingHandler(SlotOllamaHandler):
+    """생성 요청 수를 세는 가짜 Ollama 서버"""
+
+    generate_requests = 0
+
+    def _reply_generate(self, body: dict):
+        CountingHandler.generate_requests += 1
+        super()._reply_generate(body)
+
+
+def measure(analyzer: LocalLLMAnalyzer, texts):
+    CountingHandler.generate_requests = 0
+    start = time.perf_counter()
+    for text in texts:
+        analyzer.analyze_with_llm(text)
+    return time.perf_counter() - start, CountingHandler.generate_requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 분석 결과 캐시 벤치마크")
+    parser.add_argument('--docs', type=int, default=8, help="문서 수")
+    parser.add_argument('--delay', type=float, default=0.3, help="LLM 요청당 처리 시간 (초)")
+    parser.add_argument('--repeat', type=int, default=300, help="문서당 샘플 반복 수")
+    args = parser.parse_args()
+
+    CountingHandler.slots = threading.Semaphore(4)
+    CountingHandler.delay = args.delay
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CountingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    configure_ollama_client(base_url=f"http://127.0.0.1:{server.server_address[1]}")
+
+    texts = [f"[문서 {i}]\n" + SAMPLE * args.repeat for i in range(args.docs)]
+    edited = [text + "추가된 문장: 연락처 010-9999-8888\n" for text in texts]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        analyzer = LocalLLMAnalyzer(MODEL)
+        analyzer.llm_cache = LLMResultCache(cache_dir)
+
+        rows = [
+            ('첫 분석', measure(analyzer, texts)),
+            ('재분석', measure(analyzer, texts)),
+            ('일부 수정', measure(analyzer, edited)),
+        ]
+        print(f"문서 {args.docs}개, 요청당 {args.delay:.2f}초, 캐시 {len(analyzer.llm_cache)}개 항목")
+    server.shutdown()
+
+    print(f"{'단계':<10} {'LLM 요청':>10} {'총 시간(초)':>12}")
+    for name, (elapsed, requests_count) in rows:
+        print(f"{name:<10} {requests_count:>10} {elapsed:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
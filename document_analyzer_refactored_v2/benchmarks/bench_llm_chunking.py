@@ -0,0 +1,67 @@
+"""
+LLM 구간 분할 분석 벤치마크
+문서 길이별로 LLM 이 실제로 보는 범위(분석 범위)와 분석 시간 비교
+- 기존: 앞 2000자만 전송 (text[:2000])
+- 현재: 토큰 예산 안에서 구간 분할 후 동시 분석 + 결과 합치기
+
+로컬에 Ollama 를 흉내 내는 서버(bench_llm_dispatcher.SlotOllamaHandler)를 띄워 측정한다.
+
+사용법:
+    python benchmarks/bench_llm_chunking.py [--slots 4] [--delay 0.5] [--budget 16000]
+"""
+import argparse
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_llm_dispatcher import MODEL, SAMPLE, SlotOllamaHandler
+
+from core.analyzer import LocalLLMAnalyzer
+from core.llm_chunking import estimate_tokens, plan_chunks
+from core.ollama_client import configure_ollama_client
+
+LEGACY_SAMPLE_CHARS = 2000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 구간 분할 분석 벤치마크")
+    parser.add_argument('--slots', type=int, default=4, help="서버 동시 처리 슬롯 (OLLAMA_NUM_PARALLEL)")
+    parser.add_argument('--delay', type=float, default=0.5, help="LLM 요청당 처리 시간 (초)")
+    parser.add_argument('--budget', type=int, default=16000, help="문서당 토큰 예산")
+    args = parser.parse_args()
+
+    SlotOllamaHandler.slots = threading.Semaphore(args.slots)
+    SlotOllamaHandler.delay = args.delay
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlotOllamaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    configure_ollama_client(
+        base_url=f"http://127.0.0.1:{server.server_address[1]}", pool_size=args.slots
+    )
+
+    analyzer = LocalLLMAnalyzer(MODEL, llm_token_budget=args.budget, use_llm_cache=False)
+
+    print(f"서버 슬롯 {args.slots}개, 요청당 {args.delay:.2f}초, 토큰 예산 {args.budget}")
+    print(f"{'문서(자)':>10} {'추정 토큰':>10} {'기존 범위':>10} {'구간 수':>8} "
+          f"{'현재 범위':>10} {'LLM 시간(초)':>13}")
+    for repeat in (10, 50, 200, 1000, 5000):
+        text = SAMPLE * repeat
+        chunks = plan_chunks(text, analyzer.llm_chunk_tokens, analyzer.llm_token_budget)
+        coverage = sum(end - start for start, end in chunks) / len(text)
+
+        start = time.perf_counter()
+        result = analyzer.analyze_with_llm(text)
+        elapsed = time.perf_counter() - start
+        assert 'recommendations' in result
+
+        print(f"{len(text):>10} {estimate_tokens(text):>10} "
+              f"{min(1.0, LEGACY_SAMPLE_CHARS / len(text)):>10.1%} {len(chunks):>8} "
+              f"{coverage:>10.1%} {elapsed:>13.3f}")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""
+일괄 분석 LLM 동시 요청 벤치마크
+문서 여러 개를 종합 분석할 때 순차 처리와 LLMDispatcher(동시 요청 + 다음 문서 탐지 선행)의
+총 소요 시간 비교
+
+로컬에 Ollama 를 흉내 내는 서버를 띄워 측정한다 (Ollama 설치 불필요).
+서버는 --slots 개 요청만 동시에 처리하고(OLLAMA_NUM_PARALLEL) 요청마다 --delay 초 걸린다.
+
+사용법:
+    python benchmarks/bench_llm_dispatcher.py [--docs 16] [--slots 4] [--delay 0.5]
+"""
+import argparse
+import json
+import socket
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.analyzer import LocalLLMAnalyzer
+from core.llm_dispatcher import LLMDispatcher
+from core.ollama_client import configure_ollama_client
+
+MODEL = 'llama3.2:3b'
+
+LLM_RESPONSE = json.dumps({
+    'detected_info': [],
+    'risk_level': '보통',
+    'risk_score': 50,
+    'reasoning': '벤치마크 응답',
+    'legal_violations': [],
+    'recommendations': ['암호화', '접근 통제', '보관 기간 준수'],
+}, ensure_ascii=False)
+
+SAMPLE = (
+    "담당자 홍길동 연락처 010-1234-5678, 이메일 hong@example.com\n"
+    "주민등록번호 900101-1234567, 계좌 110-123-456789 (신한은행)\n"
+    "본인은 당뇨 진단을 받아 치료 중이며 노동조합에 가입되어 있음\n"
+)
+
+
+class SlotOllamaHandler(BaseHTTPRequestHandler):
+    """동시 처리 슬롯이 제한된 /api/tags, /api/generate 응답"""
+
+    protocol_version = 'HTTP/1.1'
+    slots: threading.Semaphore = None
+    delay = 0.5
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _reply(self, body: bytes, content_type: str):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply(json.dumps({'models': [{'name': MODEL}]}).encode('utf-8'), 'application/json')
+
+    def _reply_loaded(self):
+        """모델 적재 요청(빈 프롬프트) 응답 - 벤치마크 서버는 항상 적재 상태"""
+        self._reply(json.dumps({'done': True, 'done_reason': 'load'}).encode('utf-8'),
+                    'application/json')
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        if not body.get('prompt'):
+            return self._reply_loaded()
+        self._reply_generate(body)
+
+    def _reply_generate(self, body: dict):
+        """생성 요청 응답 (슬롯 대기 + 처리 시간 후 NDJSON)"""
+        with self.slots:
+            time.sleep(self.delay)
+        lines = [
+            json.dumps({'response': LLM_RESPONSE, 'done': False}, ensure_ascii=False),
+            json.dumps({'response': '', 'done': True}),
+        ]
+        self._reply(('\n'.join(lines) + '\n').encode('utf-8'), 'application/x-ndjson')
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_sequential(analyzer: LocalLLMAnalyzer, texts):
+    """기존 방식: 문서마다 탐지 → LLM 대기 → 결과"""
+    return [analyzer.comprehensive_analysis(text) for text in texts]
+
+
+def run_dispatched(analyzer: LocalLLMAnalyzer, texts, concurrency: int, prefetch: int = 2):
+    """현재 방식: LLM 은 디스패처에서 동시 요청, 그동안 다음 문서 탐지"""
+    results = []
+    pending = deque()
+    with LLMDispatcher(concurrency) as dispatcher:
+        for text in texts:
+            while pending and (len(pending) >= concurrency + prefetch or pending[0][3].done()):
+                text_, detection, analysis, future = pending.popleft()
+                results.append(analyzer.finish_analysis(text_, detection, analysis, future.result()))
+            detection, analysis = analyzer.prepare_analysis(text)
+            pending.append((text, detection, analysis,
+                            dispatcher.submit(analyzer.run_llm_analysis, text, detection)))
+        while pending:
+            text_, detection, analysis, future = pending.popleft()
+            results.append(analyzer.finish_analysis(text_, detection, analysis, future.result()))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일괄 분석 LLM 동시 요청 벤치마크")
+    parser.add_argument('--docs', type=int, default=16, help="문서 수")
+    parser.add_argument('--slots', type=int, default=4, help="서버 동시 처리 슬롯 (OLLAMA_NUM_PARALLEL)")
+    parser.add_argument('--delay', type=float, default=0.5, help="LLM 요청당 처리 시간 (초)")
+    parser.add_argument('--repeat', type=int, default=20,
+                        help="문서당 샘플 반복 수 (기본값은 LLM 구간 1개 크기)")
+    args = parser.parse_args()
+
+    SlotOllamaHandler.slots = threading.Semaphore(args.slots)
+    SlotOllamaHandler.delay = args.delay
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlotOllamaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    configure_ollama_client(base_url=f"http://127.0.0.1:{server.server_address[1]}")
+
+    analyzer = LocalLLMAnalyzer(MODEL, use_llm_cache=False)
+    texts = [f"[문서 {i}]\n" + SAMPLE * args.repeat for i in range(args.docs)]
+
+    start = time.perf_counter()
+    sequential = run_sequential(analyzer, texts)
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dispatched = run_dispatched(analyzer, texts, args.slots)
+    dispatched_time = time.perf_counter() - start
+    server.shutdown()
+
+    same = all(
+        a[0]['risk_level'] == b[0]['risk_level'] and len(a[1]) == len(b[1])
+        for a, b in zip(sequential, dispatched)
+    )
+    print(f"문서 {args.docs}개, 서버 슬롯 {args.slots}개, 요청당 {args.delay:.2f}초")
+    print(f"{'방식':<12} {'총 시간(초)':>12} {'문서/초':>10}")
+    for name, elapsed in (('순차', sequential_time), ('디스패처', dispatched_time)):
+        print(f"{name:<12} {elapsed:>12.3f} {args.docs / elapsed:>10.2f}")
+    print(f"속도 향상: {sequential_time / dispatched_time:.2f}배, 결과 일치: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+LLM 검증 모드 프롬프트 크기 벤치마크
+문서 길이 / 개인정보 밀도별로 LLM 에 보내는 프롬프트 수와 토큰 수(추정) 비교
+- 전체 분석: 문서를 토큰 예산 안에서 구간으로 나누어 전송
+- 검증 모드: 규칙 기반 탐지 후보 주변 발췌 + 탐지 유형 요약만 전송
+
+LLM 호출 없이 프롬프트 생성까지만 측정한다.
+
+사용법:
+    python benchmarks/bench_llm_verify.py [--budget 16000]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.analyzer import LocalLLMAnalyzer
+from core.llm_chunking import estimate_tokens
+
+FILLER = "이 문서는 일반적인 업무 절차와 회의 내용을 정리한 것으로 별도의 개인정보는 포함하지 않는다.\n"
+RECORD = "담당자 연락처 010-{0:04d}-5678, 이메일 user{0}@example.com\n"
+
+
+def make_document(lines: int, every: int) -> str:
+    """lines 줄 문서, every 줄마다 개인정보 1줄"""
+    return ''.join(
+        RECORD.format(i) if every and i % every == 0 else FILLER
+        for i in range(lines)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 검증 모드 프롬프트 크기 벤치마크")
+    parser.add_argument('--budget', type=int, default=16000, help="문서당 토큰 예산")
+    args = parser.parse_args()
+
+    full = LocalLLMAnalyzer(llm_token_budget=args.budget, use_llm_cache=False, llm_verify=False)
+    verify = LocalLLMAnalyzer(llm_token_budget=args.budget, use_llm_cache=False, llm_verify=True)
+
+    print(f"{'문서(줄)':>8} {'개인정보':>8} {'후보':>6} "
+          f"{'전체 요청':>9} {'전체 토큰':>10} {'검증 요청':>9} {'검증 토큰':>10} "
+          f"{'후보 포함':>9} {'생성(ms)':>9}")
+    for lines, every in ((30, 10), (300, 50), (300, 5), (3000, 200), (3000, 20)):
+        text = make_document(lines, every)
+        detection = verify.detect(text)
+
+        full_prompts, _, _ = full._plan_prompts(text, detection)
+        start = time.perf_counter()
+        verify_prompts, coverage, _ = verify._plan_prompts(text, detection)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        print(f"{lines:>8} {'1/' + str(every):>8} {len(detection.merged()):>6} "
+              f"{len(full_prompts):>9} {sum(map(estimate_tokens, full_prompts)):>10} "
+              f"{len(verify_prompts):>9} {sum(map(estimate_tokens, verify_prompts)):>10} "
+              f"{coverage:>9.0%} {elapsed:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
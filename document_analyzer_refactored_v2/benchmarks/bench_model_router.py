@@ -0,0 +1,122 @@
+"""
+문서별 모델 라우팅 벤치마크
+일괄 분석 작업(대부분 깨끗하거나 규칙 기반으로 확실한 문서)에서
+- 기존: 모든 문서를 정확한 모델(큰 모델)로 분석
+- 현재: ModelRouter 로 문서마다 빠른 모델 / 정확한 모델 선택
+의 총 LLM 시간과 모델별 요청 수, 지연 시간 통계 비교
+
+로컬에 Ollama 를 흉내 내는 서버(bench_llm_dispatcher.SlotOllamaHandler)를 띄워 측정한다.
+요청 처리 시간은 모델별로 다르다 (--fast-delay, --accurate-delay).
+
+사용법:
+    python benchmarks/bench_model_router.py [--docs 40] [--ambiguous 0.2]
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_llm_dispatcher import LLM_RESPONSE, SlotOllamaHandler
+
+from core.analyzer import LocalLLMAnalyzer
+from core.model_router import ModelRouter, ModelLatencyStats
+from core.ollama_client import configure_ollama_client
+from utils.constants import LLM_FAST_MODEL, LLM_ACCURATE_MODEL
+
+CLEAN = "회의 안건: 다음 분기 매출 목표와 일정 조율, 담당 부서별 진행 현황 공유\n"
+CERTAIN = "담당자 연락처 010-1234-5678, 이메일 hong@example.com\n"
+AMBIGUOUS = (
+    "성명: 홍길동\n병력: 당뇨 진단\n" + "\n" * 80 +
+    "환자 김철수 전과 기록 있음\n" + "-" * 200 + "\n환자 이영희 종교 불교 신앙\n"
+)
+
+
+class ModelDelayHandler(SlotOllamaHandler):
+    """모델별 처리 시간이 다른 /api/generate 응답"""
+
+    delays = {}
+
+    def do_GET(self):
+        models = [{'name': name} for name in self.delays]
+        self._reply(json.dumps({'models': models}).encode('utf-8'), 'application/json')
+
+    def _reply_generate(self, body: dict):
+        with self.slots:
+            time.sleep(self.delays.get(body.get('model'), self.delay))
+        lines = [
+            json.dumps({'response': LLM_RESPONSE, 'done': False}, ensure_ascii=False),
+            json.dumps({'response': '', 'done': True}),
+        ]
+        self._reply(('\n'.join(lines) + '\n').encode('utf-8'), 'application/x-ndjson')
+
+
+def make_documents(count: int, ambiguous_ratio: float):
+    """깨끗한 문서 / 확실한 문서 / 애매한 문서 혼합"""
+    ambiguous = round(count * ambiguous_ratio)
+    docs = []
+    for i in range(count):
+        if i < ambiguous:
+            docs.append(AMBIGUOUS)
+        else:
+            docs.append((CLEAN if i % 2 else CERTAIN) * 5)
+    return [f"[문서 {i}]\n{doc}" for i, doc in enumerate(docs)]
+
+
+def run(analyzer: LocalLLMAnalyzer, texts):
+    """문서별 탐지 → LLM 분석, 총 LLM 시간과 사용 모델 목록 반환"""
+    analyzer.model_stats = ModelLatencyStats()
+    models = []
+    elapsed = 0.0
+    for text in texts:
+        detection, _ = analyzer.prepare_analysis(text)
+        start = time.perf_counter()
+        result = analyzer.run_llm_analysis(text, detection)
+        elapsed += time.perf_counter() - start
+        models.append(result.get('llm_model') if result else None)
+    return elapsed, models
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문서별 모델 라우팅 벤치마크")
+    parser.add_argument('--docs', type=int, default=40, help="문서 수")
+    parser.add_argument('--ambiguous', type=float, default=0.2, help="애매한 문서 비율")
+    parser.add_argument('--fast-delay', type=float, default=0.05, help="빠른 모델 요청당 처리 시간 (초)")
+    parser.add_argument('--accurate-delay', type=float, default=0.4, help="정확한 모델 요청당 처리 시간 (초)")
+    args = parser.parse_args()
+
+    ModelDelayHandler.slots = threading.Semaphore(1)
+    ModelDelayHandler.delays = {
+        LLM_FAST_MODEL: args.fast_delay, LLM_ACCURATE_MODEL: args.accurate_delay
+    }
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ModelDelayHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    configure_ollama_client(base_url=f"http://127.0.0.1:{server.server_address[1]}")
+
+    texts = make_documents(args.docs, args.ambiguous)
+    single = LocalLLMAnalyzer(LLM_ACCURATE_MODEL, use_llm_cache=False)
+    routed = LocalLLMAnalyzer(LLM_ACCURATE_MODEL, use_llm_cache=False, model_router=ModelRouter())
+
+    single_time, _ = run(single, texts)
+    routed_time, models = run(routed, texts)
+    server.shutdown()
+
+    print(f"문서 {args.docs}개 (애매한 문서 {args.ambiguous:.0%}), "
+          f"요청당 {LLM_FAST_MODEL} {args.fast_delay:.2f}초 / {LLM_ACCURATE_MODEL} {args.accurate_delay:.2f}초")
+    print(f"{'방식':<12} {'LLM 시간(초)':>13} {'문서/초':>10}")
+    for name, elapsed in (('정확한 모델', single_time), ('라우팅', routed_time)):
+        print(f"{name:<12} {elapsed:>13.3f} {args.docs / elapsed:>10.2f}")
+    print(f"속도 향상: {single_time / routed_time:.2f}배")
+    print("라우팅 결과: " + ", ".join(
+        f"{model} {models.count(model)}개" for model in dict.fromkeys(models)
+    ))
+    print("모델별 지연 시간:")
+    print(routed.model_stats.summary())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+모델 적재(warm-up) 벤치마크
+유휴 후 일괄 분석을 시작할 때 LLM 으로 분석된 문서 수와 소요 시간 비교
+- 기존: 첫 생성 요청이 모델 적재 시간까지 생성 타임아웃 안에 기다림 → 초과 시 규칙 기반 결과
+- 현재: 적재를 별도 요청 / 별도 한도(OLLAMA_LOAD_TIMEOUT)로 먼저 기다린 뒤 생성
+
+로컬에 Ollama 를 흉내 내는 서버(bench_llm_dispatcher.SlotOllamaHandler)를 띄워 측정한다.
+서버는 적재되지 않은 모델의 첫 요청에 --load 초를 더 쓴다. 실제 30초 타임아웃 대신
+--timeout 으로 생성 타임아웃을 줄여 같은 상황을 재현한다.
+
+사용법:
+    python benchmarks/bench_model_warmup.py [--docs 8] [--load 2.0] [--timeout 1.0]
+"""
+import argparse
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_llm_dispatcher import MODEL, SAMPLE, SlotOllamaHandler
+
+import core.analyzer as analyzer_module
+from core.analyzer import LocalLLMAnalyzer
+from core.ollama_client import OllamaClient
+
+
+class LoadingHandler(SlotOllamaHandler):
+    """적재되지 않은 모델은 첫 요청에 적재 시간이 걸리는 가짜 Ollama 서버"""
+
+    load_delay = 2.0
+    loaded = set()
+    load_lock = threading.Lock()
+
+    def _load(self, model: str):
+        with self.load_lock:
+            if model not in self.loaded:
+                time.sleep(self.load_delay)
+                self.loaded.add(model)
+
+    def _reply_loaded(self):
+        self._load(MODEL)
+        super()._reply_loaded()
+
+    def _reply_generate(self, body: dict):
+        self._load(body.get('model'))
+        super()._reply_generate(body)
+
+
+class QuietServer(ThreadingHTTPServer):
+    """타임아웃으로 끊긴 연결의 응답 쓰기 오류는 출력하지 않음"""
+
+    def handle_error(self, request, client_address):
+        pass
+
+
+class NoWarmupClient(OllamaClient):
+    """기존 방식 재현: 적재 상태를 확인하지 않고 바로 생성 요청"""
+
+    def is_warm(self, model: str) -> bool:
+        return True
+
+
+def run(analyzer: LocalLLMAnalyzer, texts):
+    """서버를 유휴(모델 미적재) 상태로 되돌린 뒤 문서별 분석, (LLM 분석 문서 수, 시간) 반환"""
+    LoadingHandler.loaded.clear()
+    analyzer.client.invalidate()
+    start = time.perf_counter()
+    analysed = 0
+    for text in texts:
+        detection, _ = analyzer.prepare_analysis(text)
+        result = analyzer.run_llm_analysis(text, detection)
+        analysed += bool(result and result.get('llm_model'))
+    return analysed, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모델 적재(warm-up) 벤치마크")
+    parser.add_argument('--docs', type=int, default=8, help="문서 수")
+    parser.add_argument('--load', type=float, default=2.0, help="모델 적재 시간 (초)")
+    parser.add_argument('--timeout', type=float, default=1.0, help="생성 타임아웃 (초, 실제 OLLAMA_TIMEOUT 대신)")
+    parser.add_argument('--delay', type=float, default=0.1, help="LLM 요청당 처리 시간 (초)")
+    args = parser.parse_args()
+
+    LoadingHandler.slots = threading.Semaphore(4)
+    LoadingHandler.delay = args.delay
+    LoadingHandler.load_delay = args.load
+    server = QuietServer(('127.0.0.1', 0), LoadingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    analyzer_module.OLLAMA_TIMEOUT = args.timeout
+
+    texts = [f"[문서 {i}]\n" + SAMPLE * 5 for i in range(args.docs)]
+    legacy = LocalLLMAnalyzer(MODEL, use_llm_cache=False)
+    legacy.client = NoWarmupClient(base_url)
+    current = LocalLLMAnalyzer(MODEL, use_llm_cache=False)
+    current.client = OllamaClient(base_url)
+
+    legacy_analysed, legacy_time = run(legacy, texts)
+    current_analysed, current_time = run(current, texts)
+    server.shutdown()
+
+    print(f"문서 {args.docs}개, 모델 적재 {args.load:.1f}초, 생성 타임아웃 {args.timeout:.1f}초")
+    print(f"{'방식':<10} {'LLM 분석 문서':>14} {'시간(초)':>10}")
+    print(f"{'기존':<10} {legacy_analysed:>11}/{args.docs} {legacy_time:>10.3f}")
+    print(f"{'현재':<10} {current_analysed:>11}/{args.docs} {current_time:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+숫자 구간 사전 필터 벤치마크
+숫자 패턴(주민등록번호, 전화번호 등)을 텍스트 전체에 실행할 때와
+숫자 구간에서만 실행할 때의 스캔 시간 비교
+
+사용법:
+    python benchmarks/bench_numeric_prefilter.py [--size 500000]
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core.pattern_engine as pattern_engine
+from core.analyzer import LocalLLMAnalyzer
+
+
+def make_prose(size: int, rng: random.Random) -> str:
+    """숫자가 드문 일반 문서"""
+    words = ["회의", "일정", "검토", "보고서", "프로젝트", "진행", "결과", "담당자", "2024년", "3분기"]
+    return ' '.join(rng.choice(words) for _ in range(size // 4))[:size]
+
+
+def make_mixed(size: int, rng: random.Random) -> str:
+    """개인정보가 섞인 문서"""
+    pieces = [
+        "성명: 홍길동 주민등록번호 900101-1234567 ",
+        "연락처 010-1234-5678 이메일 hong@example.com ",
+        "회의록 일반 업무 내용입니다. 일정 조율 및 검토 ",
+        "카드번호 1234-5678-9012-3456 계좌번호 110-123-456789 ",
+    ]
+    return ''.join(rng.choice(pieces) for _ in range(size // 30))[:size]
+
+
+def make_table(size: int, rng: random.Random) -> str:
+    """금액이 많은 재무제표형 문서"""
+    lines = []
+    length = 0
+    while length < size:
+        line = f"항목{rng.randint(1, 999)} {rng.randint(0, 999):,}원 {rng.randint(0, 99999999):,}원"
+        lines.append(line)
+        length += len(line) + 1
+    return '\n'.join(lines)[:size]
+
+
+def measure(scanner, text: str, span_ratio: float) -> float:
+    # 0 이면 숫자 구간 계산 후 항상 전체 스캔 (구간 계산 비용 포함)
+    pattern_engine.DENSE_SPAN_RATIO = span_ratio
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        list(scanner.scan(text))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="숫자 구간 사전 필터 벤치마크")
+    parser.add_argument('--size', type=int, default=500000, help="문서당 글자 수")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(42)
+    scanner = LocalLLMAnalyzer()._get_scanner()
+    default_ratio = pattern_engine.DENSE_SPAN_RATIO
+
+    print(f"{'문서':<10} {'전체 스캔(초)':>14} {'숫자 구간(초)':>14}")
+    for name, make in (('일반', make_prose), ('개인정보', make_mixed), ('재무제표', make_table)):
+        text = make(args.size, rng)
+        full = measure(scanner, text, 0.0)
+        prefiltered = measure(scanner, text, default_ratio)
+        print(f"{name:<10} {full:>14.3f} {prefiltered:>14.3f}")
+
+    pattern_engine.DENSE_SPAN_RATIO = default_ratio
+
+
+if __name__ == '__main__':
+    main()
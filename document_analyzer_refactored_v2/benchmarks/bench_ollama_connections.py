@@ -0,0 +1,108 @@
+"""
+Ollama 연결 재사용 / 상태 캐시 벤치마크
+일괄 분석처럼 문서마다 서버 상태 확인 2회(연결 확인 + LLM 분석 전 확인)와 LLM 호출을
+반복할 때 새로 맺는 TCP 연결 수, /api/tags 요청 수, 소요 시간 비교
+
+로컬에 Ollama 를 흉내 내는 HTTP/1.1 서버를 띄워 측정한다 (Ollama 설치 불필요).
+- 기존: requests.get / requests.post 호출마다 새 연결, 상태 확인마다 /api/tags 요청
+- 현재: OllamaClient 의 연결 풀 재사용 + 상태 캐시(probe)
+
+사용법:
+    python benchmarks/bench_ollama_connections.py [--docs 200]
+"""
+import argparse
+import json
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.ollama_client import OllamaClient
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    """/api/tags, /api/generate 응답 (keep-alive 지원)"""
+
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+    tags_requests = 0
+
+    def setup(self):
+        super().setup()
+        # Ollama(Go net/http) 서버와 같이 Nagle 알고리즘 비활성화
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        FakeOllamaHandler.connections += 1
+
+    def _reply(self, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        FakeOllamaHandler.tags_requests += 1
+        self._reply({'models': [{'name': 'llama3.2:3b'}]})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._reply({'response': '{"risk_level": "낮음"}'})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def legacy_calls(base_url: str, docs: int):
+    """기존 방식: 호출마다 새 연결"""
+    for _ in range(docs):
+        requests.get(f"{base_url}/api/tags", timeout=5)
+        requests.get(f"{base_url}/api/tags", timeout=2)
+        requests.post(f"{base_url}/api/generate", json={'prompt': 'x'}, timeout=30)
+
+
+def client_calls(base_url: str, docs: int):
+    """현재 방식: 공유 세션 + 상태 캐시"""
+    client = OllamaClient(base_url)
+    for _ in range(docs):
+        client.probe(timeout=5)
+        client.probe(timeout=2)
+        client.generate({'prompt': 'x'}, timeout=30)
+    client.close()
+
+
+def measure(func, base_url: str, docs: int):
+    FakeOllamaHandler.connections = 0
+    FakeOllamaHandler.tags_requests = 0
+    start = time.perf_counter()
+    func(base_url, docs)
+    return (time.perf_counter() - start, FakeOllamaHandler.connections,
+            FakeOllamaHandler.tags_requests)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ollama 연결 재사용 / 상태 캐시 벤치마크")
+    parser.add_argument('--docs', type=int, default=200, help="문서 수 (문서당 상태 확인 + LLM 호출)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeOllamaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    legacy = measure(legacy_calls, base_url, args.docs)
+    current = measure(client_calls, base_url, args.docs)
+    server.shutdown()
+
+    print(f"{'방식':<10} {'TCP 연결':>10} {'tags 요청':>10} {'총 시간(초)':>12}")
+    for name, (elapsed, connections, tags_requests) in (('기존', legacy), ('현재', current)):
+        print(f"{name:<10} {connections:>10} {tags_requests:>10} {elapsed:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+진행률 / 상태 메시지 보고 벤치마크
+일괄 분석(BatchAnalysisThread) 총 소요 시간과 UI 로 보낸 시그널 수 비교
+- 기존: 상태 메시지마다 화면에서 읽을 수 있도록 대기(time.sleep 0.2 ~ 0.8초) 후 바로 전송
+- 현재: 처리 단계 완료 기준 진행률 + 전송 간격 제한(PROGRESS_MIN_INTERVAL), 대기 없음
+
+기존 방식은 ProgressReporter 대신 상태 메시지마다 --pause 초 대기하는 보고기로 재현한다.
+로컬에 Ollama 를 흉내 내는 서버(bench_llm_dispatcher.SlotOllamaHandler)를 띄워 측정한다.
+
+사용법:
+    python benchmarks/bench_progress_overhead.py [--docs 8] [--pause 0.25] [--delay 0.1]
+"""
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_llm_dispatcher import MODEL, SAMPLE, SlotOllamaHandler
+
+import threads.batch_thread as batch_module
+from core.ollama_client import configure_ollama_client
+from core.progress import ProgressReporter
+from threads.batch_thread import BatchAnalysisThread
+
+
+class PacedReporter(ProgressReporter):
+    """기존 방식 재현: 상태 메시지마다 대기 후 전송, 진행률은 제한 없이 전송"""
+
+    pause = 0.25
+
+    def __init__(self, *args, **kwargs):
+        kwargs['min_interval'] = 0.0
+        super().__init__(*args, **kwargs)
+
+    def status(self, message: str):
+        super().status(message)
+        time.sleep(self.pause)
+
+
+def run(reporter_class, paths):
+    """일괄 분석 1회, (총 시간, 상태 메시지 수, 진행률 시그널 수) 반환"""
+    batch_module.ProgressReporter = reporter_class
+    thread = BatchAnalysisThread(paths, MODEL, use_llm_cache=False)
+    counts = {'status': 0, 'progress': 0}
+    thread.status_message.connect(lambda _: counts.__setitem__('status', counts['status'] + 1))
+    thread.detailed_progress.connect(lambda _: counts.__setitem__('progress', counts['progress'] + 1))
+    start = time.perf_counter()
+    thread.run()
+    return time.perf_counter() - start, counts['status'], counts['progress']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="진행률 / 상태 메시지 보고 벤치마크")
+    parser.add_argument('--docs', type=int, default=8, help="문서 수")
+    parser.add_argument('--pause', type=float, default=0.25, help="기존 방식의 상태 메시지당 대기 (초)")
+    parser.add_argument('--delay', type=float, default=0.1, help="LLM 요청당 처리 시간 (초)")
+    args = parser.parse_args()
+
+    SlotOllamaHandler.slots = threading.Semaphore(4)
+    SlotOllamaHandler.delay = args.delay
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlotOllamaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    configure_ollama_client(base_url=f"http://127.0.0.1:{server.server_address[1]}")
+    PacedReporter.pause = args.pause
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.docs):
+            path = Path(tmp) / f"doc{i}.txt"
+            path.write_text(f"[문서 {i}]\n" + SAMPLE * 5, encoding='utf-8')
+            paths.append(str(path))
+
+        legacy = run(PacedReporter, paths)
+        current = run(ProgressReporter, paths)
+    server.shutdown()
+
+    print(f"문서 {args.docs}개, 기존 상태 메시지당 대기 {args.pause:.2f}초, LLM 요청당 {args.delay:.2f}초")
+    print(f"{'방식':<10} {'시간(초)':>10} {'상태 시그널':>12} {'진행률 시그널':>14}")
+    for name, (elapsed, status, progress) in (('기존', legacy), ('현재', current)):
+        print(f"{name:<10} {elapsed:>10.3f} {status:>12} {progress:>14}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+증분 재검사 색인 벤치마크
+파일 --files 개 중 --changed 비율이 바뀐 폴더를 다시 검사할 때 바뀐 파일을 찾는 시간 비교
+- 해시 전체: 모든 파일의 내용 해시를 계산해 색인과 비교
+- 현재: ScanIndex.finished_entry (stat 먼저, 크기는 같고 수정 시각만 다를 때만 해시)
+
+분석 결과 대신 작은 결과를 기록해 색인 확인 비용만 측정한다.
+
+사용법:
+    python benchmarks/bench_scan_index.py [--files 20000] [--size 65536] [--changed 0.01]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.batch_journal import file_fingerprint, file_hash
+from core.scan_index import ScanIndex
+
+MODEL = 'llama3.2:3b'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="증분 재검사 색인 벤치마크")
+    parser.add_argument('--files', type=int, default=20000, help="파일 수")
+    parser.add_argument('--size', type=int, default=64 * 1024, help="파일 크기 (바이트)")
+    parser.add_argument('--changed', type=float, default=0.01, help="바뀐 파일 비율")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / 'share'
+        root.mkdir()
+        paths = []
+        block = os.urandom(args.size)
+        for i in range(args.files):
+            path = root / f"doc{i}.txt"
+            path.write_bytes(str(i).encode() + block)
+            paths.append(str(path))
+
+        index = ScanIndex(MODEL, index_dir=str(Path(tmp) / 'index'))
+        for path in paths:
+            index.record_done(path, file_fingerprint(path), {'risk_level': '낮음'}, [], '')
+
+        # 바뀐 파일: 절반은 크기 변경, 절반은 크기 유지 + 내용 변경 (수정 시각도 바뀜)
+        changed = set(random.Random(0).sample(paths, int(args.files * args.changed)))
+        for n, path in enumerate(sorted(changed)):
+            data = Path(path).read_bytes()
+            Path(path).write_bytes(data + b'x' if n % 2 else b'#' + data[1:])
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        hashes = {path: entry['hash'] for path, entry in index._load().items()}
+        start = time.perf_counter()
+        full = {path for path in paths if file_hash(path) != hashes[os.path.abspath(path)]}
+        full_time = time.perf_counter() - start
+
+        # 색인을 디스크에서 다시 읽는 시간 포함
+        start = time.perf_counter()
+        index = ScanIndex(MODEL, index_dir=str(Path(tmp) / 'index'))
+        found = {path for path in paths if index.finished_entry(path) is None}
+        index_time = time.perf_counter() - start
+
+    print(f"파일 {args.files}개 ({args.size // 1024}KB), 바뀐 파일 {len(changed)}개")
+    print(f"{'방식':<12} {'시간(초)':>10} {'바뀐 파일':>10}")
+    print(f"{'해시 전체':<12} {full_time:>10.3f} {len(full):>10}")
+    print(f"{'stat 우선':<12} {index_time:>10.3f} {len(found):>10}")
+    print(f"결과 일치: {full == found == changed}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+대용량 TXT 탐지 벤치마크: 전체 텍스트 탐지 vs 청크 단위 스트리밍 탐지
+새 프로세스의 실행 시간 / 최대 메모리(RSS) 비교
+- 전체: extract_text 로 파일 전체를 읽은 뒤 정규식 / 키워드 탐지 (MAX_FILE_SIZE 제한)
+- 스트리밍: iter_text_chunks 로 읽으며 detect_stream (일괄 분석 파이프라인 / CLI 의 대용량 TXT 경로)
+두 방식의 탐지 결과가 같은지도 확인한다.
+
+사용법:
+    python benchmarks/bench_streaming_detection.py [--size 10]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench_llm_dispatcher import SAMPLE
+
+# 탐지 실행 후 (최대 RSS KB, 탐지 항목 수, 결과 해시)를 JSON 으로 출력
+_MEASURE = '''
+import hashlib, json, logging, resource, sys
+from core.analyzer import LocalLLMAnalyzer
+from core.document_processor import DocumentProcessor
+from utils.logger import set_log_level
+set_log_level(logging.WARNING)
+analyzer = LocalLLMAnalyzer(use_llm_cache=False)
+processor = DocumentProcessor()
+{body}
+items = regex + sorted(keywords, key=lambda x: x['start'])
+digest = hashlib.sha256(json.dumps(items, ensure_ascii=False, sort_keys=True).encode()).hexdigest()
+print(json.dumps([resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(items), digest]),
+      file=sys.stderr)
+'''
+
+_WHOLE = '''
+text = processor.extract_text({path!r})
+regex = analyzer.detect_sensitive_info_regex(text)
+keywords = analyzer.detect_sensitive_keywords(text)
+'''
+
+_STREAM = '''
+detection = analyzer.detect_stream(processor.iter_text_chunks({path!r}))
+regex, keywords = detection.regex_detected, detection.keyword_detected
+'''
+
+
+def measure(body: str, cwd: str, env: dict):
+    """새 프로세스에서 1회 측정 (시간(초), 최대 RSS(MB), 탐지 항목 수, 결과 해시)"""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-c', _MEASURE.format(body=body)],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True
+    )
+    elapsed = time.perf_counter() - start
+    rss_kb, count, digest = json.loads(proc.stderr.strip().splitlines()[-1])
+    return elapsed, rss_kb / 1024, count, digest
+
+
+# 민감정보가 없는 일반 줄 (대용량 로그 / 보고서처럼 민감정보는 드물게 섞임)
+FILLER = "2024-05-01 09:00:00 INFO 정기 점검 작업이 정상적으로 완료되었습니다. 처리 건수 없음\n"
+
+
+def write_document(path: Path, size_mb: float):
+    """일반 줄 50줄마다 SAMPLE 1줄을 넣은 TXT 파일 생성"""
+    block = FILLER * 50 + SAMPLE + '\n'
+    target = int(size_mb * 1024 * 1024)
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        while written < target:
+            f.write(block)
+            written += len(block.encode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 텍스트 탐지 vs 스트리밍 탐지 벤치마크")
+    parser.add_argument('--size', type=float, default=10, help="TXT 파일 크기 (MB)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 설정 / 로그 / 이력 파일은 임시 디렉토리에 생성
+        # 키워드 클러스터의 대표 키워드는 집합 순서를 따르므로 두 프로세스의 해시 시드를 맞춤
+        env = dict(os.environ, PYTHONPATH=str(ROOT), XDG_CONFIG_HOME=tmp, PYTHONHASHSEED='0')
+        doc = Path(tmp) / 'large.txt'
+        write_document(doc, args.size)
+        size_mb = doc.stat().st_size / (1024 * 1024)
+
+        rows = [
+            (name, *measure(body.format(path=str(doc)), tmp, env))
+            for name, body in (('전체 텍스트', _WHOLE), ('스트리밍', _STREAM))
+        ]
+
+    print(f"TXT {size_mb:.1f}MB")
+    print(f"{'방식':<10} {'시간(초)':>10} {'최대 RSS(MB)':>14} {'탐지 항목':>10}")
+    for name, elapsed, rss, count, _ in rows:
+        print(f"{name:<10} {elapsed:>10.2f} {rss:>14.1f} {count:>10}")
+    whole, stream = rows
+    print(f"스트리밍 / 전체: 시간 {stream[1] / whole[1]:.0%}, 메모리 {stream[2] / whole[2]:.0%}")
+    print(f"탐지 결과 일치: {'예' if whole[4] == stream[4] else '아니오'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+LLM 탐지 값 위치 찾기 벤치마크
+종합 분석 6단계(탐지 항목 통합)에서 LLM 이 보고한 값을 문서 위치로 바꾸는 비용 비교
+- 기존: 값마다 any(d['value'] == value ...) 선형 비교 + text.find (첫 등장만)
+- 기존(모든 등장): 같은 방식으로 값마다 text.find 반복
+- 현재: 정규화 값 집합 + ValueIndex (문서 1회 탐색, 모든 등장)
+
+사용법:
+    python benchmarks/bench_value_index.py [--lines 20000] [--values 300]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.value_index import ValueIndex, normalize_value
+
+
+def make_document(lines: int, names, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    return ''.join(
+        f"{rng.choice(names)} 담당 업무 {i}번 처리 완료, 연락처 010-{rng.randint(1000, 9999)}-5678\n"
+        for i in range(lines)
+    )
+
+
+def legacy_resolve(text: str, detected, values):
+    """기존 방식"""
+    resolved = list(detected)
+    for value in values:
+        if value and not any(d['value'] == value for d in resolved):
+            pos = text.find(value)
+            if pos != -1:
+                resolved.append({'value': value, 'start': pos, 'end': pos + len(value)})
+    return resolved
+
+
+def legacy_resolve_all(text: str, detected, values):
+    """기존 방식을 모든 등장으로 확장 (값마다 text.find 반복)"""
+    resolved = list(detected)
+    for value in values:
+        if value and not any(d['value'] == value for d in resolved):
+            pos = text.find(value)
+            while pos != -1:
+                resolved.append({'value': value, 'start': pos, 'end': pos + len(value)})
+                pos = text.find(value, pos + len(value))
+    return resolved
+
+
+def indexed_resolve(text: str, detected, values):
+    """현재 방식"""
+    resolved = list(detected)
+    known = {normalize_value(d['value']) for d in resolved}
+    new_values = [v for v in values if v and normalize_value(v) not in known]
+    index = ValueIndex(text, new_values)
+    for value in new_values:
+        key = normalize_value(value)
+        if key in known:
+            continue
+        known.add(key)
+        for pos in index.offsets(key):
+            resolved.append({'value': text[pos:pos + len(key)], 'start': pos, 'end': pos + len(key)})
+    return resolved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 탐지 값 위치 찾기 벤치마크")
+    parser.add_argument('--lines', type=int, default=20000, help="문서 줄 수")
+    parser.add_argument('--values', type=int, default=300, help="LLM 보고 값 수")
+    args = parser.parse_args()
+
+    names = [f"직원{i:04d}" for i in range(args.values)]
+    text = make_document(args.lines, names)
+    # 규칙 기반 탐지 결과 흉내 (휴대전화 값)
+    detected = [{'value': line.rsplit(' ', 1)[-1], 'start': 0, 'end': 0}
+                for line in text.splitlines()[:2000]]
+    values = names + ["문서에 없는 값"] * 10
+
+    start = time.perf_counter()
+    legacy = legacy_resolve(text, detected, values)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    legacy_all = legacy_resolve_all(text, detected, values)
+    legacy_all_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = indexed_resolve(text, detected, values)
+    indexed_time = time.perf_counter() - start
+
+    print(f"문서 {len(text):,}자, 규칙 탐지 {len(detected)}개, LLM 값 {len(values)}개")
+    print(f"{'방식':<8} {'시간(ms)':>10} {'추가 항목':>10}")
+    print(f"{'기존':<8} {legacy_time * 1000:>10.1f} {len(legacy) - len(detected):>10}")
+    print(f"{'기존(모든)':<8} {legacy_all_time * 1000:>10.1f} {len(legacy_all) - len(detected):>10}")
+    print(f"{'현재':<8} {indexed_time * 1000:>10.1f} {len(indexed) - len(detected):>10}")
+
+
+if __name__ == '__main__':
+    main()
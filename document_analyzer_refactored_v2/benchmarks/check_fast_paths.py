@@ -0,0 +1,188 @@
+"""
+빠른 탐지 경로 결과 일치 검사
+최적화된 탐지 경로가 단순 구현과 같은 결과를 내는지 무작위 문서로 확인한다.
+- 다중 패턴 스캐너: 패턴별 re.finditer 와 같은 매치 (커스텀 패턴의 범위 지정 플래그 포함)
+- 스트리밍 탐지: 무작위 크기 청크로 나눠도 전체 문자열 탐지와 같은 항목 / 위치
+  (소문자 변환 시 길이가 바뀌는 문자 'İ' 포함, 키워드 위치가 원문 키워드를 가리키는지 확인)
+- 병렬 탐지: 페이지 단위로 나눠 작업 프로세스에서 탐지해도 단일 프로세스 탐지와 같은 결과
+  (작업 프로세스 풀 오류로 단일 프로세스 탐지로 대체되면 실패)
+
+결과가 다르면 AssertionError 로 종료한다 (종료 코드 1).
+
+사용법:
+    python benchmarks/check_fast_paths.py [--docs 30] [--seed 0]
+"""
+import argparse
+import logging
+import random
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_llm_dispatcher import SAMPLE
+
+from core.analyzer import LocalLLMAnalyzer
+from core.custom_detectors import CustomDetector
+from core.parallel_detector import MIN_SEGMENT_SIZE, shutdown_pool
+from utils.logger import logger, set_log_level
+
+# 문서 조각 (대소문자 / 유니코드 대소문자 대응 / 숫자 구간 경계 사례 포함)
+TOKENS = SAMPLE.split() + [
+    'EMP-1234', 'emp-5678', 'Emp-90', 'AB-12', 'ab-34', 'aB-56', 'K1', 'k2', 'K3',
+    'ſ4', 'S5', 'Ǆ7', 'ǅ8', '123 456', '12-34', '1234-56', 'HONG@EXAMPLE.COM',
+    '010 1234 5678', '02-123-4567', '192.168.0.1', 'M12345678', '서울시 강남구 테헤란로 1',
+    '당뇨', '진단', '노조', '환자', '성명:', 'İİ', 'İstanbul', '\n', '\t',
+]
+
+# (이름, 정규식, 대소문자 무시)
+CUSTOM_PATTERNS = [
+    ('사번', r'(?i:emp)-\d{2,4}', False),
+    ('코드', r'(?i:ab)-\d\d', False),
+    ('케이', r'(?i)K\d', False),
+    ('혼합', r'(?i:(?-i:a)b)-\d+', False),
+    ('에스', r's\d', True),
+    ('디제트', r'ǆ\d', True),
+    ('숫자쌍', r'(?<!\d)\d{2}-\d{2}(?!\d)', False),
+    ('세자리', r'\d{3} \d{3}', False),
+    ('빈매치', r'x*', False),
+    ('임의', r'(?s:.)@', False),
+]
+
+
+def make_documents(count: int, seed: int):
+    """무작위 문서 목록"""
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        words = [rng.choice(TOKENS) for _ in range(rng.randint(20, 400))]
+        documents.append(''.join(word + rng.choice(' \n,.') for word in words))
+    return documents
+
+
+def make_analyzer() -> LocalLLMAnalyzer:
+    """커스텀 패턴을 등록한 분석기"""
+    analyzer = LocalLLMAnalyzer(use_llm_cache=False)
+    for name, pattern, ignore_case in CUSTOM_PATTERNS:
+        analyzer.register_detector(CustomDetector(name, pattern, ignore_case=ignore_case))
+    return analyzer
+
+
+def check_scanner(analyzer: LocalLLMAnalyzer, documents) -> int:
+    """다중 패턴 스캐너 vs 패턴별 re.finditer"""
+    scanner = analyzer._get_scanner()
+    for text in documents:
+        expected = {
+            info_type: [
+                m.span() for m in re.finditer(
+                    analyzer.sensitive_types[info_type], text, analyzer._pattern_flags(info_type)
+                ) if m.end() > m.start()
+            ]
+            for info_type in scanner.names
+        }
+        actual = scanner.scan_by_name(text)
+        for info_type in scanner.names:
+            assert actual[info_type] == expected[info_type], (
+                f"스캐너 결과 불일치 ({info_type}): {actual[info_type]} != {expected[info_type]}"
+            )
+    return len(documents)
+
+
+def split_chunks(text: str, rng: random.Random):
+    """무작위 크기 청크로 분할"""
+    chunks = []
+    pos = 0
+    while pos < len(text):
+        size = rng.randint(1, 3000)
+        chunks.append(text[pos:pos + size])
+        pos += size
+    return chunks
+
+
+def check_streaming(analyzer: LocalLLMAnalyzer, documents) -> int:
+    """스트리밍 탐지 vs 전체 문자열 탐지 (작은 청크 크기로 청크 경계를 많이 만듦)"""
+    rng = random.Random(len(documents))
+    # 청크 경계가 여러 번 생기도록 문서를 이어 붙여 길게 만듦
+    texts = [''.join(documents[i:i + 5]) for i in range(0, len(documents), 5)]
+    for text in texts:
+        regex = analyzer.detect_sensitive_info_regex(text)
+        keywords = analyzer.detect_sensitive_keywords(text)
+        # 클러스터 시작 위치에는 클러스터의 키워드 중 하나가 있어야 함
+        for item in keywords:
+            start = item['start']
+            assert any(
+                text[start:start + len(keyword)].lower() == keyword.lower()
+                for keyword in item['keywords_matched']
+            ), f"키워드 위치 불일치: {start} {text[start:start + 10]!r} - {item['keywords_matched']}"
+
+        streamed = analyzer.detect_stream(split_chunks(text, rng), chunk_size=1)
+        assert streamed.regex_detected == regex, "스트리밍 정규식 탐지 결과 불일치"
+        assert sorted(streamed.keyword_detected, key=lambda x: x['start']) == keywords, (
+            "스트리밍 키워드 탐지 결과 불일치"
+        )
+    return len(texts)
+
+
+class WarningCollector(logging.Handler):
+    """경고 로그 수집 (대체 경로로 빠졌는지 확인)"""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def check_parallel(analyzer: LocalLLMAnalyzer, documents) -> int:
+    """병렬 탐지 vs 단일 프로세스 탐지 (문서 1개 = 1페이지, 여러 구간으로 나뉘도록 이어 붙임)"""
+    pages = []
+    while sum(map(len, pages)) < MIN_SEGMENT_SIZE * 6:
+        pages.extend(documents)
+    boundaries = []
+    offset = 0
+    for page in pages:
+        boundaries.append(offset)
+        offset += len(page)
+    text = ''.join(pages)
+
+    collector = WarningCollector()
+    logger.addHandler(collector)
+    try:
+        parallel = analyzer.detect_parallel(text, boundaries, workers=2)
+    finally:
+        logger.removeHandler(collector)
+        shutdown_pool()
+    assert not collector.messages, f"병렬 탐지 대체 경로 사용: {collector.messages}"
+
+    assert parallel.regex_detected == analyzer.detect_sensitive_info_regex(text), (
+        "병렬 정규식 탐지 결과 불일치"
+    )
+    assert parallel.keyword_detected == analyzer.detect_sensitive_keywords(text), (
+        "병렬 키워드 탐지 결과 불일치"
+    )
+    return len(pages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="빠른 탐지 경로 결과 일치 검사")
+    parser.add_argument('--docs', type=int, default=30, help="무작위 문서 수")
+    parser.add_argument('--seed', type=int, default=0, help="난수 시드")
+    args = parser.parse_args()
+    set_log_level(logging.WARNING)
+
+    analyzer = make_analyzer()
+    documents = make_documents(args.docs, args.seed)
+    checks = [
+        ('다중 패턴 스캐너 = 패턴별 finditer', check_scanner),
+        ('스트리밍 탐지 = 전체 문자열 탐지', check_streaming),
+        ('병렬 탐지 = 단일 프로세스 탐지', check_parallel),
+    ]
+    for name, check in checks:
+        count = check(analyzer, documents)
+        print(f"통과: {name} ({count}개 문서)")
+
+
+if __name__ == '__main__':
+    main()
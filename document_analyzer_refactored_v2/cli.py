@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+문서 위험도 분석 시스템 - 명령줄 일괄 분석 (GUI / PyQt5 없이 실행)
+
+디렉토리 / glob / 파일 경로를 받아 일괄 분석 파이프라인(BatchPipeline)으로 분석하고,
+파일이 끝날 때마다 결과를 JSONL 한 줄로 출력한다 (LLM 이 끝난 순서).
+로그는 표준 오류와 로그 파일로만 남기므로 표준 출력은 결과만 담는다.
+
+사용법:
+    python -m cli /data/share "/data/inbox/**/*.pdf" -o results.jsonl
+    python -m cli /data/share --no-llm --workers 4
+    python -m cli /logs/huge.txt --stream-min-size 0       (TXT 를 청크 단위로 읽으며 탐지)
+
+출력 줄:
+    {"path": ..., "result": {...}, "detected": [...]}     (--include-text 시 "text" 추가)
+    {"path": ..., "error": "..."}                         (분석 실패)
+    증분 재검사(--incremental)로 건너뛴 파일은 result 에 "resumed": true
+    스트리밍 탐지한 대용량 TXT 는 LLM 분석 없이 규칙 기반 결과, text 는 빈 문자열
+
+종료 코드: 0 전체 성공, 1 실패한 파일 있음, 2 분석할 파일 없음, 130 중단(Ctrl+C)
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from core.analyzer import LocalLLMAnalyzer
+from core.batch_pipeline import BatchPipeline, shutdown_pools
+from core.llm_dispatcher import LLMDispatcher
+from core.ollama_client import configure_ollama_client
+from core.parallel_detector import default_workers
+from core.scan_index import ScanIndex, llm_settings
+from utils.constants import (
+    SUPPORTED_EXTENSIONS, OLLAMA_NUM_PARALLEL, LLM_TOKEN_BUDGET, LLM_VERIFY_MODE, OLLAMA_KEEP_ALIVE,
+    SCAN_INDEX_DIR, STREAM_TEXT_MIN_SIZE
+)
+from utils.logger import logger, set_log_level
+
+# --no-llm 결과의 증분 색인 키 (LLM 모델별 색인과 섞이지 않도록 모델 이름 대신 사용)
+NO_LLM_INDEX_KEY = ''
+
+
+def collect_files(targets: Iterable[str]) -> List[str]:
+    """
+    분석 대상 파일 목록 (입력 순서 유지, 중복 제거)
+
+    - 디렉토리: 하위 디렉토리까지 지원 확장자 파일
+    - glob 패턴 (**, *, ?, [...]): 일치하는 파일(지원 확장자) / 디렉토리
+    - 파일: 확장자와 관계없이 그대로 (지원하지 않는 형식은 분석 실패로 출력)
+    """
+    files: List[str] = []
+    seen = set()
+
+    def add(path: str):
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            files.append(path)
+
+    def add_directory(directory: str):
+        for root, dirs, names in os.walk(directory):
+            dirs.sort()
+            for name in sorted(names):
+                if Path(name).suffix.lower() in SUPPORTED_EXTENSIONS:
+                    add(os.path.join(root, name))
+
+    for target in targets:
+        if os.path.isdir(target):
+            add_directory(target)
+        elif os.path.isfile(target):
+            add(target)
+        elif glob.has_magic(target):
+            matches = sorted(glob.glob(target, recursive=True))
+            if not matches:
+                logger.warning(f"일치하는 파일 없음: {target}")
+            for match in matches:
+                if os.path.isdir(match):
+                    add_directory(match)
+                elif Path(match).suffix.lower() in SUPPORTED_EXTENSIONS:
+                    add(match)
+        else:
+            logger.warning(f"파일 또는 디렉토리를 찾을 수 없음: {target}")
+    return files
+
+
+def load_patterns(path: Optional[str]) -> Dict:
+    """커스텀 탐지기 설정 파일 (Config.get_custom_patterns 와 같은 형식의 JSON)"""
+    if not path:
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            patterns = json.load(f)
+    except (OSError, ValueError) as e:
+        raise Exception(f"커스텀 패턴 파일을 읽을 수 없습니다: {str(e)}")
+    if not isinstance(patterns, dict):
+        raise Exception("커스텀 패턴 파일은 JSON 객체여야 합니다")
+    return patterns
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m cli',
+        description="문서 위험도 일괄 분석 (결과는 JSONL 로 출력)"
+    )
+    parser.add_argument('targets', nargs='+', metavar='PATH',
+                        help="파일, 디렉토리(하위 포함) 또는 glob 패턴 (예: 'docs/**/*.pdf')")
+    parser.add_argument('-o', '--output', default='-',
+                        help="결과 JSONL 파일 (기본: 표준 출력)")
+    parser.add_argument('-m', '--model', default='llama3.2:3b', help="Ollama 모델")
+    parser.add_argument('-w', '--workers', type=int, default=0,
+                        help="추출 / 탐지 프로세스 수 (0: CPU 코어 수 기준, 1: 현재 프로세스에서 처리)")
+    parser.add_argument('--no-llm', action='store_true',
+                        help="LLM 분석 없이 규칙 기반 탐지 결과만 출력 (Ollama 불필요)")
+    parser.add_argument('--llm-concurrency', type=int, default=OLLAMA_NUM_PARALLEL,
+                        help="동시 LLM 요청 수")
+    parser.add_argument('--llm-token-budget', type=int, default=LLM_TOKEN_BUDGET,
+                        help="문서당 LLM 에 보낼 최대 토큰 수")
+    parser.add_argument('--ollama-url', help="Ollama 서버 주소 (기본: 로컬)")
+    parser.add_argument('--keep-alive', default=OLLAMA_KEEP_ALIVE,
+                        help="마지막 요청 후 모델 유지 시간 (Ollama keep_alive 형식)")
+    parser.add_argument('--no-cache', action='store_true', help="LLM 분석 결과 캐시 사용 안 함")
+    parser.add_argument('--patterns', help="커스텀 탐지기 설정 JSON 파일")
+    parser.add_argument('--incremental', action='store_true',
+                        help="지난 분석 이후 바뀌지 않은 파일은 색인에 저장된 결과 출력")
+    parser.add_argument('--index-dir', default=SCAN_INDEX_DIR, help="증분 재검사 색인 디렉토리")
+    parser.add_argument('--stream-min-size', type=float, default=STREAM_TEXT_MIN_SIZE / (1024 * 1024),
+                        metavar='MB',
+                        help="이 크기를 넘는 TXT 는 청크 단위 스트리밍 탐지 (크기 제한 없음, LLM 분석 생략, "
+                             "0: 모든 TXT)")
+    parser.add_argument('--include-text', action='store_true', help="결과에 추출한 문서 텍스트 포함")
+    parser.add_argument('-q', '--quiet', action='store_true', help="경고 / 오류 로그만 출력")
+    return parser
+
+
+class JsonlWriter:
+    """결과를 한 줄씩 기록하고 바로 내보냄 (다른 프로그램이 파이프로 바로 읽을 수 있도록)"""
+
+    def __init__(self, stream, include_text: bool = False):
+        self.stream = stream
+        self.include_text = include_text
+        self.succeeded = 0
+        self.failed = 0
+        self.resumed = 0
+
+    def result(self, file_path: str, result: Dict, detected: List[Dict], text: str):
+        record = {'path': file_path, 'result': result, 'detected': detected}
+        if self.include_text:
+            record['text'] = text
+        self._write(record)
+        self.succeeded += 1
+        if result.get('resumed'):
+            self.resumed += 1
+
+    def error(self, file_path: str, error: Exception):
+        self._write({'path': file_path, 'error': str(error)})
+        self.failed += 1
+
+    def _write(self, record: Dict):
+        self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.stream.flush()
+
+
+def run(args: argparse.Namespace, writer: JsonlWriter, files: List[str]):
+    """일괄 분석 실행 (증분 색인 확인 → 파이프라인)"""
+    use_llm = not args.no_llm
+    patterns = load_patterns(args.patterns)
+    index = None
+    if args.incremental:
+        index = ScanIndex(
+            args.model if use_llm else NO_LLM_INDEX_KEY, patterns, index_dir=args.index_dir,
+            llm_settings=llm_settings(LLM_VERIFY_MODE, args.llm_token_budget) if use_llm else None
+        )
+
+    # 바뀌지 않은 파일은 저장된 결과 출력
+    pending = []
+    for file_path in files:
+        entry = index.finished_entry(file_path) if index is not None else None
+        if entry is not None:
+            try:
+                result, detected, text = index.load_result(entry)
+                result['resumed'] = True
+                writer.result(file_path, result, detected, text)
+                continue
+            except Exception as e:
+                logger.warning(f"{file_path}: {str(e)}")
+        pending.append(file_path)
+    if index is not None:
+        logger.info(f"변경 없음 {len(files) - len(pending)}개 파일, {len(pending)}개 파일 분석")
+    if not pending:
+        return
+
+    if args.ollama_url:
+        configure_ollama_client(base_url=args.ollama_url)
+    dispatcher = LLMDispatcher(args.llm_concurrency) if use_llm else None
+    analyzer = LocalLLMAnalyzer(
+        args.model,
+        custom_patterns=patterns,
+        parallel_workers=args.workers or default_workers(),
+        llm_token_budget=args.llm_token_budget,
+        use_llm_cache=use_llm and not args.no_cache,
+        llm_verify=LLM_VERIFY_MODE,
+        keep_alive=args.keep_alive
+    )
+    if use_llm:
+        threading.Thread(target=analyzer.warm_up_models, name='llm-warmup', daemon=True).start()
+
+    pipeline = BatchPipeline(analyzer, dispatcher,
+                             extract_workers=args.workers, detect_workers=args.workers,
+                             stream_min_size=int(args.stream_min_size * 1024 * 1024))
+    completed = False
+    try:
+        for item in pipeline.run(pending):
+            if item.error is None:
+                writer.result(item.file_path, item.result, item.detected, item.text)
+                # LLM 실패로 규칙 기반 결과를 쓴 파일은 색인에 남기지 않음 (다음 분석에서 LLM 재시도)
+                if index is not None and not item.llm_fallback:
+                    index.record_done(item.file_path, item.fingerprint, item.result,
+                                      item.detected, item.text)
+            else:
+                writer.error(item.file_path, item.error)
+        completed = True
+    finally:
+        pipeline.cancel()
+        if dispatcher is not None:
+            dispatcher.shutdown(cancel_pending=not completed)
+        shutdown_pools(wait=completed)
+        if index is not None:
+            index.compact()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령줄 진입점, 종료 코드 반환"""
+    args = build_parser().parse_args(argv)
+    if args.quiet:
+        set_log_level(logging.WARNING)
+
+    files = collect_files(args.targets)
+    if not files:
+        logger.error("분석할 파일이 없습니다.")
+        return 2
+
+    try:
+        output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    except OSError as e:
+        logger.error(f"결과 파일을 열 수 없습니다: {str(e)}")
+        return 2
+    writer = JsonlWriter(output, include_text=args.include_text)
+    start = time.perf_counter()
+    try:
+        run(args, writer, files)
+    except KeyboardInterrupt:
+        logger.warning(f"분석 중단: {writer.succeeded + writer.failed}/{len(files)}개 파일 완료")
+        return 130
+    except Exception as e:
+        logger.error(f"일괄 분석 실패: {str(e)}")
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    logger.info(
+        f"일괄 분석 완료: {len(files)}개 파일, 성공 {writer.succeeded}개 "
+        f"(변경 없음 {writer.resumed}개), 실패 {writer.failed}개, {time.perf_counter() - start:.1f}초"
+    )
+    return 1 if writer.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
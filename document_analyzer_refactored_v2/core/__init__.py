@@ -1,7 +1,9 @@
 """
 핵심 비즈니스 로직 패키지
+
+Config 는 PyQt5(QSettings)를 사용하므로 처음 접근할 때 불러온다.
+(Qt 없이 실행하는 CLI / 작업 프로세스에서 core 를 import 해도 Qt 를 불러오지 않음)
 """
-from .config import Config
 from .history import AnalysisHistory
 from .document_processor import DocumentProcessor
 from .analyzer import LocalLLMAnalyzer
@@ -14,3 +16,11 @@ __all__ = [
     'LocalLLMAnalyzer',
     'SecurityRecommendationEngine'
 ]
+
+
+def __getattr__(name: str):
+    """Config 지연 import"""
+    if name == 'Config':
+        from .config import Config
+        return Config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
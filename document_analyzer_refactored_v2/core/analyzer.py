@@ -9,16 +9,41 @@ LLM 기반 개인정보 분석기 (개인정보보호법 준수)
 """
 import re
 import json
+import time
+from bisect import bisect_left
+from collections import Counter
 import requests
-from typing import List, Dict, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Optional, Iterable, Sequence, Callable
 from utils.constants import (
-    SENSITIVE_PATTERNS, OLLAMA_URL, OLLAMA_TAGS_URL, OLLAMA_TIMEOUT,
+    SENSITIVE_PATTERNS, OLLAMA_TIMEOUT, OLLAMA_STREAM, OLLAMA_STREAM_MAX_TIME,
+    OLLAMA_KEEP_ALIVE, OLLAMA_LOAD_TIMEOUT,
+    LLM_CHUNK_TOKENS, LLM_TOKEN_BUDGET, LLM_VERIFY_MODE,
     SENSITIVE_KEYWORDS, SEVERITY_WEIGHTS, INFO_LEGAL_CATEGORY,
     LEGAL_CATEGORY_DESCRIPTIONS, UNIQUE_IDENTIFIERS, EXPOSURE_PROHIBITED_INFO,
     CONTEXT_KEYWORDS
 )
 from utils.logger import logger
 from core.recommendation_engine import SecurityRecommendationEngine
+from core.pattern_engine import MultiPatternScanner, pattern_registry
+from core.interval_index import IntervalIndex, MatchSpanIndex, merge_spans
+from core.detection_result import DetectionResult
+from core.streaming_detector import (
+    StreamingDetector, DEFAULT_CHUNK_SIZE, DEFAULT_MAX_MATCH_LENGTH, _lower_preserving_length
+)
+from core.parallel_detector import ParallelDetector, PARALLEL_MIN_SIZE
+from core.keyword_matcher import get_keyword_matcher
+from core.custom_detectors import CustomDetector
+from core.ollama_client import get_ollama_client
+from core.json_stream import IncrementalJSONParser
+from core.llm_chunking import (
+    plan_chunks, select_chunks, candidate_windows, group_windows,
+    reduce_chunk_results, risk_level_for_score, estimate_tokens
+)
+from core.llm_cache import LLMResultCache, get_llm_cache
+from core.model_router import ModelRouter, RouteDecision, get_model_stats
+from core.progress import STAGE_REGEX, STAGE_KEYWORDS
+from core.value_index import ValueIndex, normalize_value
 
 
 class LocalLLMAnalyzer:
@@ -45,39 +70,226 @@ class LocalLLMAnalyzer:
         "IP주소",
     ]
     
-    def __init__(self, model_name: str = "llama3.2:3b", status_callback=None):
+    # 법적 분류별 기본 위험도 가중치 (항목당)
+    LEGAL_CATEGORY_WEIGHTS = {
+        "고유식별정보": 20,
+        "금융정보": 15,
+        "민감정보": 12,
+        "일반개인정보": 5
+    }
+    
+    # 탐지 문맥 범위 (글자 수)
+    REGEX_CONTEXT_WINDOW = 100       # 정규식 탐지 컨텍스트 (앞뒤)
+    KEYWORD_CLUSTER_GAP = 50         # 같은 클러스터로 묶는 키워드 간격
+    KEYWORD_CONTEXT_WINDOW = 150     # 키워드 클러스터 컨텍스트 (앞뒤)
+    PERSONAL_INDICATOR_WINDOW = 500  # 개인정보 지표 확인 범위 (앞뒤) / 문서 머리 길이
+    
+    # 개인 직접 연결 패턴: 개인을 특정하는 명확한 표현
+    PERSONAL_DIRECT_PATTERNS = [
+        # 인적사항 레이블
+        r'성명\s*[:：]', r'이름\s*[:：]', r'환자\s*[:：]', r'회원\s*[:：]',
+        r'피보험자\s*[:：]', r'가입자\s*[:：]', r'신청인\s*[:：]',
+        # 소유/관계 표현
+        r'[가-힣]{2,4}(씨|님|의|은|는|이|가)\s*(건강|진단|병력|종교|신앙|정당)',
+        r'본인의?\s*(건강|진단|병력|종교|신앙|정당)',
+        # 기록 문서 형식
+        r'(진단서|소견서|처방전|의무기록|건강검진|가입신청)',
+        r'(인사기록|신상명세|이력서|입사지원)',
+    ]
+    
+    # 개인 간접 연결 지표: 주변에 있으면 같은 개인에 관한 문서로 판단
+    PERSONAL_INDICATOR_PATTERNS = [
+        r'\d{6}[-\s]?[1-4]\d{6}',  # 주민등록번호
+        r'01[016789][-\s]?\d{3,4}[-\s]?\d{4}',  # 휴대전화
+        r'성명\s*[:：]\s*[가-힣]{2,4}',  # 성명 필드
+        r'이름\s*[:：]\s*[가-힣]{2,4}',  # 이름 필드
+    ]
+    
+    # LLM 응답 JSON 필수 키 (프롬프트 출력 형식) - 모두 완료되면 스트리밍 조기 종료
+    LLM_RESPONSE_KEYS = (
+        "detected_info", "risk_level", "risk_score",
+        "reasoning", "legal_violations", "recommendations"
+    )
+    
+    # LLM 프롬프트 템플릿 버전 (프롬프트 / 요청 옵션 변경 시 올림 → 이전 캐시 무효)
+    LLM_PROMPT_VERSION = 2
+    
+    # LLM 프롬프트 공통 기준 (전체 분석 / 검증 프롬프트)
+    LLM_PROMPT_CRITERIA = """【분류 기준 (개인정보보호법)】
+1. 고유식별정보 (제24조): 주민등록번호, 여권번호, 운전면허번호, 외국인등록번호
+2. 민감정보 (제23조): 사상·신념, 노동조합·정당, 정치적 견해, 건강, 성생활 정보
+3. 금융정보 (제34조의2): 계좌번호, 카드번호 - 노출 금지
+4. 일반개인정보 (제2조): 전화번호, 이메일, 주소 등
+
+【위험도 기준】
+- 낮음: 0-24점 (일반개인정보 소량)
+- 보통: 25-49점 (일반개인정보 다수 또는 민감정보 소량)
+- 높음: 50-74점 (고유식별정보 또는 금융정보 포함)
+- 심각: 75-100점 (고유식별정보 + 금융정보 다수, 복합 노출)"""
+    
+    # 검증 모드: 탐지 후보 앞뒤로 LLM 에 보낼 문맥 (글자 수)
+    LLM_VERIFY_CONTEXT = 60
+    
+    # 검증 모드 판정 값 (detected_info 항목의 verdict)
+    LLM_VERDICT_CONFIRMED = "확인"
+    LLM_VERDICT_REJECTED = "오탐"
+    LLM_VERDICT_ADDED = "추가"
+    
+    # 개인정보 문서 유형 (문서 시작 부분에 있으면 개인정보 문서)
+    PERSONAL_DOCUMENT_TYPES = [
+        '인사기록', '신상명세', '이력서', '입사지원', '건강검진',
+        '진단서', '소견서', '처방전', '의무기록', '가입신청',
+        '개인정보', '회원정보', '환자정보', '고객정보'
+    ]
+    
+    def __init__(self, model_name: str = "llama3.2:3b", status_callback=None,
+                 custom_patterns: Optional[Dict] = None, parallel_workers: int = 0,
+                 llm_token_budget: int = LLM_TOKEN_BUDGET, use_llm_cache: bool = True,
+                 llm_verify: bool = LLM_VERIFY_MODE, model_router: Optional[ModelRouter] = None,
+                 keep_alive: str = OLLAMA_KEEP_ALIVE,
+                 stage_callback: Optional[Callable[[str], None]] = None):
+        """
+        Args:
+            model_name: Ollama 모델 이름
+            status_callback: 진행 상태 메시지 콜백
+            custom_patterns: 커스텀 탐지기 설정 (Config.get_custom_patterns)
+            parallel_workers: 대용량 문서 병렬 탐지 프로세스 수 (0/1 이면 사용 안 함)
+            llm_token_budget: LLM 에 보낼 문서 본문의 문서당 최대 토큰 수
+            use_llm_cache: LLM 분석 결과 디스크 캐시 사용 여부
+            llm_verify: 규칙 기반 탐지 후보가 있으면 후보 주변만 보내는 검증 프롬프트 사용
+            model_router: 문서별 모델 선택기 (None 이면 항상 model_name 사용)
+            keep_alive: 마지막 요청 후 모델을 메모리에 유지할 시간 (Ollama keep_alive 형식)
+            stage_callback: 탐지 단계 완료 콜백 (core.progress 단계 이름)
+        """
         self.model_name = model_name
-        self.ollama_url = OLLAMA_URL
+        self.parallel_workers = parallel_workers
+        self.llm_chunk_tokens = LLM_CHUNK_TOKENS
+        self.llm_token_budget = llm_token_budget
+        self.llm_cache: Optional[LLMResultCache] = get_llm_cache() if use_llm_cache else None
+        self.llm_verify = llm_verify
+        self.model_router = model_router
+        self.keep_alive = keep_alive
+        self.model_stats = get_model_stats()
+        self.client = get_ollama_client()
+        self.stream_llm = OLLAMA_STREAM
         self.recommendation_engine = SecurityRecommendationEngine()
         self.status_callback = status_callback
+        self.stage_callback = stage_callback
         self.sensitive_types = SENSITIVE_PATTERNS.copy()
+        self.custom_detectors: Dict[str, CustomDetector] = {}
+        self._scanner = None
+        
+        if custom_patterns:
+            self.load_custom_patterns(custom_patterns)
     
     def _emit_status(self, message: str):
         """상태 메시지 전송"""
         if self.status_callback:
             self.status_callback(message)
     
-    def add_custom_pattern(self, name: str, pattern: str) -> bool:
+    def _emit_stage(self, stage: str):
+        """탐지 단계 완료 전송"""
+        if self.stage_callback:
+            self.stage_callback(stage)
+    
+    def add_custom_pattern(self, name: str, pattern: str, priority: Optional[int] = None,
+                           legal_category: str = "일반개인정보",
+                           weight: Optional[int] = None) -> bool:
         """커스텀 패턴 추가"""
         try:
-            re.compile(pattern)
-            self.sensitive_types[name] = pattern
+            self.register_detector(
+                CustomDetector(name, pattern, priority, legal_category, weight)
+            )
             return True
-        except:
+        except Exception:
+            return False
+    
+    def register_detector(self, detector: CustomDetector):
+        """
+        사용자 정의 탐지기 등록 (같은 이름이면 교체)
+        
+        내장 패턴과 함께 하나의 다중 패턴 스캐너로 컴파일된다.
+        """
+        self.custom_detectors[detector.name] = detector
+        self.sensitive_types[detector.name] = detector.pattern
+        self._scanner = None
+    
+    def remove_detector(self, name: str) -> bool:
+        """사용자 정의 탐지기 제거 (내장 유형이면 기본 패턴 복원)"""
+        if self.custom_detectors.pop(name, None) is None:
             return False
+        if name in SENSITIVE_PATTERNS:
+            self.sensitive_types[name] = SENSITIVE_PATTERNS[name]
+        else:
+            self.sensitive_types.pop(name, None)
+        self._scanner = None
+        return True
+    
+    def load_custom_patterns(self, patterns: Dict) -> int:
+        """
+        설정에 저장된 커스텀 패턴 등록 (Config.get_custom_patterns 형식)
+        
+        Returns:
+            등록된 탐지기 수 (유효하지 않은 항목은 건너뜀)
+        """
+        loaded = 0
+        for name, value in patterns.items():
+            try:
+                self.register_detector(CustomDetector.from_config(name, value))
+                loaded += 1
+            except Exception as e:
+                logger.warning(f"커스텀 패턴 무시 ({name}): {str(e)}")
+        return loaded
+    
+    def get_priority_order(self) -> List[str]:
+        """
+        탐지 우선순위 (내장 + 사용자 정의)
+        
+        우선순위를 지정한 탐지기는 해당 순번 위치에 끼워 넣고,
+        지정하지 않은 새 유형은 내장 유형 뒤에 등록 순서대로 붙인다.
+        """
+        order = list(self.PRIORITY_ORDER)
+        ranked = []
+        for index, detector in enumerate(self.custom_detectors.values()):
+            if detector.priority is not None:
+                if detector.name in order:
+                    order.remove(detector.name)
+                ranked.append((detector.priority, index, detector.name))
+            elif detector.name not in order:
+                order.append(detector.name)
+        
+        for priority, _, name in sorted(ranked):
+            order.insert(min(max(priority, 0), len(order)), name)
+        return order
     
     def check_ollama_connection(self) -> Tuple[bool, str]:
         """Ollama 연결 확인"""
-        try:
-            response = requests.get(OLLAMA_TAGS_URL, timeout=5)
-            if response.status_code == 200:
-                models = [m.get('name', '') for m in response.json().get('models', [])]
-                if self.model_name in models:
-                    return True, f"연결 성공: {self.model_name}"
-                return False, f"모델 없음. 사용가능: {', '.join(models[:3])}"
+        # 서버 상태는 공유 캐시 사용 (analyze_with_llm / GUI 상태 표시와 공유)
+        status = self.client.probe(timeout=5)
+        if status.running:
+            if status.has_model(self.model_name):
+                return True, f"연결 성공: {self.model_name}"
+            return False, f"모델 없음. 사용가능: {', '.join(status.models[:3])}"
+        if status.status_code is not None:
             return False, "Ollama 서버 응답 없음"
-        except:
-            return False, "Ollama가 실행되지 않았습니다."
+        return False, "Ollama가 실행되지 않았습니다."
+    
+    def _get_scanner(self) -> MultiPatternScanner:
+        """우선순위 순서의 다중 패턴 스캐너 반환 (패턴 변경 시 재생성)"""
+        if self._scanner is None:
+            self._scanner = pattern_registry.scanner(tuple(
+                (info_type, self.sensitive_types[info_type], self._pattern_flags(info_type))
+                for info_type in self.get_priority_order()
+                if self.sensitive_types.get(info_type)
+            ))
+        return self._scanner
+    
+    def _pattern_flags(self, info_type: str) -> int:
+        """유형별 정규식 플래그"""
+        detector = self.custom_detectors.get(info_type)
+        if detector:
+            return detector.flags
+        return re.IGNORECASE if info_type == "주소" else 0
     
     def _is_overlapping(self, start1: int, end1: int, start2: int, end2: int) -> bool:
         """두 범위가 겹치는지 확인"""
@@ -85,10 +297,16 @@ class LocalLLMAnalyzer:
     
     def _get_legal_category(self, info_type: str) -> str:
         """정보 유형의 법적 분류 반환"""
+        detector = self.custom_detectors.get(info_type)
+        if detector:
+            return detector.legal_category
         return INFO_LEGAL_CATEGORY.get(info_type, "일반개인정보")
     
     def _is_exposure_prohibited(self, info_type: str) -> bool:
         """노출금지 정보 여부 확인 (제34조의2)"""
+        detector = self.custom_detectors.get(info_type)
+        if detector:
+            return detector.exposure_prohibited
         return info_type in EXPOSURE_PROHIBITED_INFO
     
     def detect_sensitive_info_regex(self, text: str) -> List[Dict]:
@@ -99,79 +317,103 @@ class LocalLLMAnalyzer:
         1. 정규식 매칭 후 컨텍스트 키워드 확인
         2. 계좌번호: 컨텍스트 없으면 제외 (false positive 방지)
         3. 주소: 컨텍스트 있으면 신뢰도 상승
+        4. 다중 패턴 스캐너로 후보를 한 번에 수집한 뒤 우선순위로 충돌 해결
         """
         detected = []
-        detected_ranges = []
+        detected_ranges = IntervalIndex()
+        
+        # 모든 유형의 후보 수집 (트리거 문자가 없는 패턴은 건너뜀)
+        try:
+            candidates = self._get_scanner().scan_by_name(text)
+        except Exception as e:
+            logger.error(f"패턴 매칭 오류: {str(e)} - 유형별 탐색으로 대체")
+            candidates = self._finditer_candidates(text)
+        
+        # 우선순위 순서대로 충돌 해결
+        for info_type in candidates:
+            for start, end in candidates[info_type]:
+                # 중복 범위 체크
+                overlap = detected_ranges.find_overlap(start, end)
+                if overlap:
+                    logger.debug(
+                        f"중복 제외: {info_type} '{text[start:end].strip()}' "
+                        f"(이미 {overlap[2]}로 탐지됨)"
+                    )
+                    continue
+                
+                item = self._make_regex_item(text, info_type, start, end)
+                if item:
+                    detected.append(item)
+                    detected_ranges.add(start, end, info_type)
         
-        # 우선순위 순서대로 탐지
-        for info_type in self.PRIORITY_ORDER:
+        detected.sort(key=lambda x: x['start'])
+        return detected
+    
+    def _finditer_candidates(self, text: str) -> Dict[str, List[Tuple[int, int]]]:
+        """유형별 finditer 후보 (스캐너를 쓸 수 없을 때, 오류가 난 유형만 건너뜀)"""
+        candidates = {}
+        for info_type in self.get_priority_order():
             pattern = self.sensitive_types.get(info_type)
             if not pattern:
                 continue
-            
             try:
-                for match in re.finditer(
-                    pattern, 
-                    text, 
-                    re.IGNORECASE if info_type == "주소" else 0
-                ):
-                    start = match.start()
-                    end = match.end()
-                    value = match.group().strip()
-                    
-                    # 중복 범위 체크
-                    is_duplicate = False
-                    for detected_start, detected_end, detected_type in detected_ranges:
-                        if self._is_overlapping(start, end, detected_start, detected_end):
-                            is_duplicate = True
-                            logger.debug(
-                                f"중복 제외: {info_type} '{value}' "
-                                f"(이미 {detected_type}로 탐지됨)"
-                            )
-                            break
-                    
-                    if is_duplicate:
-                        continue
-                    
-                    # 컨텍스트 추출 (앞뒤 100자)
-                    context_start = max(0, start - 100)
-                    context_end = min(len(text), end + 100)
-                    context = text[context_start:context_end].replace('\n', ' ')
-                    
-                    # 컨텍스트 기반 검증
-                    has_context, confidence = self._validate_with_context(
-                        info_type, value, context
-                    )
-                    
-                    # 계좌번호는 컨텍스트 없으면 제외 (false positive 방지)
-                    if info_type == "계좌번호" and not has_context:
-                        logger.debug(f"컨텍스트 없음 제외: {info_type} '{value}'")
-                        continue
-                    
-                    # 법적 분류 정보
-                    legal_category = self._get_legal_category(info_type)
-                    
-                    detected.append({
-                        'type': info_type,
-                        'value': value,
-                        'start': start,
-                        'end': end,
-                        'context': context,
-                        'method': 'regex',
-                        'confidence': confidence,
-                        'legal_category': legal_category,
-                        'exposure_prohibited': self._is_exposure_prohibited(info_type),
-                        'has_context': has_context
-                    })
-                    detected_ranges.append((start, end, info_type))
-                    logger.debug(f"✓ 탐지: {info_type} ({legal_category}, {confidence}) - {value[:20]}...")
-                    
+                candidates[info_type] = [
+                    match.span() for match in pattern_registry.compile(
+                        pattern, self._pattern_flags(info_type)
+                    ).finditer(text)
+                    if match.end() > match.start()
+                ]
             except Exception as e:
                 logger.error(f"패턴 매칭 오류 ({info_type}): {str(e)}")
-                continue
+        return candidates
+    
+    def _make_regex_item(self, text: str, info_type: str, start: int, end: int,
+                         offset: int = 0) -> Optional[Dict]:
+        """
+        정규식 후보를 컨텍스트로 검증해 탐지 항목 생성
         
-        detected.sort(key=lambda x: x['start'])
-        return detected
+        Args:
+            text: 후보 주변을 포함한 텍스트
+            info_type: 정보 유형
+            start, end: 후보 범위 (text 기준)
+            offset: text 의 문서 내 시작 위치 (스트리밍 탐지 시)
+        
+        Returns:
+            탐지 항목 또는 None (검증 실패)
+        """
+        value = text[start:end].strip()
+        
+        # 컨텍스트 추출 (앞뒤 100자)
+        context_start = max(0, start - self.REGEX_CONTEXT_WINDOW)
+        context_end = min(len(text), end + self.REGEX_CONTEXT_WINDOW)
+        context = text[context_start:context_end].replace('\n', ' ')
+        
+        # 컨텍스트 기반 검증
+        has_context, confidence = self._validate_with_context(
+            info_type, value, context
+        )
+        
+        # 계좌번호는 컨텍스트 없으면 제외 (false positive 방지)
+        if info_type == "계좌번호" and not has_context:
+            logger.debug(f"컨텍스트 없음 제외: {info_type} '{value}'")
+            return None
+        
+        # 법적 분류 정보
+        legal_category = self._get_legal_category(info_type)
+        logger.debug(f"✓ 탐지: {info_type} ({legal_category}, {confidence}) - {value[:20]}...")
+        
+        return {
+            'type': info_type,
+            'value': value,
+            'start': start + offset,
+            'end': end + offset,
+            'context': context,
+            'method': 'regex',
+            'confidence': confidence,
+            'legal_category': legal_category,
+            'exposure_prohibited': self._is_exposure_prohibited(info_type),
+            'has_context': has_context
+        }
     
     def _validate_with_context(self, info_type: str, value: str, context: str) -> Tuple[bool, str]:
         """
@@ -202,7 +444,7 @@ class LocalLLMAnalyzer:
         # 계좌번호: 컨텍스트 키워드 필수
         if info_type == '계좌번호':
             # 길이 검증 (하이픈/공백 제거 후 10~16자리)
-            digits_only = re.sub(r'[-\s]', '', value)
+            digits_only = pattern_registry.compile(r'[-\s]').sub('', value)
             if len(digits_only) < 10 or len(digits_only) > 16:
                 return False, 'low'
             
@@ -249,174 +491,363 @@ class LocalLLMAnalyzer:
         2. 인접 키워드 클러스터링 (중복 카운트 방지)
         3. 신뢰도 차등 적용
         """
-        # 1단계: 모든 키워드 위치 수집
-        raw_matches = []
-        text_lower = text.lower()
-        
-        for category, keywords in SENSITIVE_KEYWORDS.items():
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                start = 0
-                while True:
-                    pos = text_lower.find(keyword_lower, start)
-                    if pos == -1:
-                        break
-                    
-                    raw_matches.append({
-                        'category': category,
-                        'keyword': keyword,
-                        'start': pos,
-                        'end': pos + len(keyword),
-                        'value': text[pos:pos + len(keyword)]
-                    })
-                    start = pos + 1
+        # 1단계: 모든 키워드 위치 수집 (다중 키워드 매처로 한 번에 탐색)
+        # 소문자 변환으로 길이가 바뀌면 위치가 어긋나므로 스트리밍 / 병렬 탐지와 같은 변환 사용
+        raw_matches = self._find_keyword_matches(text, _lower_preserving_length(text))
         
         if not raw_matches:
             return []
         
         # 2단계: 인접 키워드 클러스터링 (50자 이내 = 같은 문맥)
-        raw_matches.sort(key=lambda x: x['start'])
+        clusters = self._cluster_keyword_matches(raw_matches)
+        
+        # 3단계: 각 클러스터에 대해 개인 연결 여부 확인
+        # (개인 연결 패턴 위치는 문서당 한 번만 계산)
+        connection_index = self._build_personal_connection_index(text)
+        detected = []
+        
+        for cluster in clusters:
+            item = self._make_keyword_item(text, cluster, connection_index)
+            if item:
+                detected.append(item)
+        
+        return detected
+    
+    def _cluster_keyword_matches(self, raw_matches: List[Dict]) -> List[List[Dict]]:
+        """인접 키워드 클러스터링 (매치 목록은 시작 위치 순)"""
         clusters = []
         current_cluster = [raw_matches[0]]
         
         for match in raw_matches[1:]:
             # 이전 클러스터의 마지막 항목과 50자 이내면 같은 클러스터
-            if match['start'] - current_cluster[-1]['end'] <= 50:
+            if match['start'] - current_cluster[-1]['end'] <= self.KEYWORD_CLUSTER_GAP:
                 # 같은 카테고리거나 관련 카테고리면 병합
                 current_cluster.append(match)
             else:
                 clusters.append(current_cluster)
                 current_cluster = [match]
         clusters.append(current_cluster)
+        return clusters
+    
+    def _find_keyword_matches(self, text: str, text_lower: str, pos: int = 0,
+                              offset: int = 0) -> List[Dict]:
+        """
+        민감정보 키워드 등장 위치 수집 (시작 위치 순)
         
-        # 3단계: 각 클러스터에 대해 개인 연결 여부 확인
-        detected = []
+        Args:
+            text: 원본 텍스트
+            text_lower: 소문자 변환 텍스트 (위치 기준)
+            pos: 탐색 시작 위치 (text 기준)
+            offset: text 의 문서 내 시작 위치 (스트리밍 탐지 시)
+        """
+        matcher = get_keyword_matcher(SENSITIVE_KEYWORDS)
+        return [
+            {
+                'category': category,
+                'keyword': keyword,
+                'start': start + offset,
+                'end': start + offset + len(keyword),
+                'value': text[start:start + len(keyword)]
+            }
+            for start, (_, category, keyword) in matcher.find_all(text_lower, pos)
+        ]
+    
+    def _make_keyword_item(self, text: str, cluster: List[Dict], connection_index: Dict,
+                           offset: int = 0) -> Optional[Dict]:
+        """
+        키워드 클러스터의 개인 연결 여부를 확인해 탐지 항목 생성
         
-        for cluster in clusters:
-            # 클러스터 범위 계산
-            cluster_start = min(m['start'] for m in cluster)
-            cluster_end = max(m['end'] for m in cluster)
-            
-            # 확장된 컨텍스트 추출 (앞뒤 150자)
-            context_start = max(0, cluster_start - 150)
-            context_end = min(len(text), cluster_end + 150)
-            context = text[context_start:context_end].replace('\n', ' ')
-            
-            # 개인 연결 여부 확인
-            is_personal, connection_type = self._check_personal_connection(context, text, cluster_start)
-            
-            if is_personal:
-                # 클러스터 대표 정보 생성
-                categories = list(set(m['category'] for m in cluster))
-                keywords = list(set(m['keyword'] for m in cluster))
-                
-                # 대표 카테고리 결정 (우선순위: 건강정보 > 범죄경력 > 사상_신념 > 나머지)
-                priority = ['건강정보', '범죄경력', '사상_신념', '노동조합_정당', '성생활']
-                main_category = next((c for c in priority if c in categories), categories[0])
-                
-                # 값 생성: 연결된 키워드들을 하나로 표현
-                if len(keywords) == 1:
-                    display_value = keywords[0]
-                else:
-                    display_value = f"{keywords[0]} 외 {len(keywords)-1}개"
-                
-                detected.append({
-                    'type': main_category,
-                    'value': display_value,
-                    'start': cluster_start,
-                    'end': cluster_end,
-                    'context': context,
-                    'method': 'keyword',
-                    'confidence': 'high' if connection_type == 'direct' else 'medium',
-                    'legal_category': '민감정보',
-                    'exposure_prohibited': False,
-                    'keywords_matched': keywords,
-                    'connection_type': connection_type
-                })
+        Args:
+            text: 클러스터 주변을 포함한 텍스트
+            cluster: 키워드 매치 목록 (문서 기준 위치)
+            connection_index: text 로 만든 개인 연결 인덱스
+            offset: text 의 문서 내 시작 위치 (스트리밍 탐지 시)
         
-        return detected
+        Returns:
+            탐지 항목 또는 None (개인 연결 없음)
+        """
+        # 클러스터 범위 계산 (text 기준)
+        cluster_start = min(m['start'] for m in cluster) - offset
+        cluster_end = max(m['end'] for m in cluster) - offset
+        
+        # 확장된 컨텍스트 범위 (앞뒤 150자)
+        context_start = max(0, cluster_start - self.KEYWORD_CONTEXT_WINDOW)
+        context_end = min(len(text), cluster_end + self.KEYWORD_CONTEXT_WINDOW)
+        
+        # 개인 연결 여부 확인
+        is_personal, connection_type = self._check_personal_connection(
+            connection_index, context_start, context_end, cluster_start
+        )
+        
+        if not is_personal:
+            return None
+        
+        context = text[context_start:context_end].replace('\n', ' ')
+        
+        # 클러스터 대표 정보 생성
+        categories = list(set(m['category'] for m in cluster))
+        keywords = list(set(m['keyword'] for m in cluster))
+        
+        # 대표 카테고리 결정 (우선순위: 건강정보 > 범죄경력 > 사상_신념 > 나머지)
+        priority = ['건강정보', '범죄경력', '사상_신념', '노동조합_정당', '성생활']
+        main_category = next((c for c in priority if c in categories), categories[0])
+        
+        # 값 생성: 연결된 키워드들을 하나로 표현
+        if len(keywords) == 1:
+            display_value = keywords[0]
+        else:
+            display_value = f"{keywords[0]} 외 {len(keywords)-1}개"
+        
+        return {
+            'type': main_category,
+            'value': display_value,
+            'start': cluster_start + offset,
+            'end': cluster_end + offset,
+            'context': context,
+            'method': 'keyword',
+            'confidence': 'high' if connection_type == 'direct' else 'medium',
+            'legal_category': '민감정보',
+            'exposure_prohibited': False,
+            'keywords_matched': keywords,
+            'connection_type': connection_type
+        }
+    
+    def _personal_connection_regexes(self) -> Tuple:
+        """개인 연결 판단용 정규식 (직접 연결, 개인정보 지표)"""
+        direct_regex = pattern_registry.compile(
+            '|'.join(f'(?:{p})' for p in self.PERSONAL_DIRECT_PATTERNS), re.IGNORECASE
+        )
+        indicator_regex = pattern_registry.compile(
+            '|'.join(f'(?:{p})' for p in self.PERSONAL_INDICATOR_PATTERNS)
+        )
+        return direct_regex, indicator_regex
     
-    def _check_personal_connection(self, context: str, full_text: str, position: int) -> tuple:
+    def _build_personal_connection_index(self, text: str,
+                                         personal_document: Optional[bool] = None,
+                                         spans: Optional[Tuple] = None) -> Dict:
+        """
+        개인 연결 판단용 문서 인덱스 생성 (문서당 1회)
+        
+        직접 연결 패턴과 개인정보 지표 패턴의 매치 위치를 정렬된 배열로 미리 구해 두고,
+        클러스터별 확인은 해당 범위에 매치가 있는지 bisect 로 질의한다.
+        
+        Args:
+            text: 대상 텍스트
+            personal_document: 개인정보 문서 여부 (None 이면 text 머리 부분으로 판단)
+            spans: 미리 구한 (직접 연결, 개인정보 지표) 매치 위치 (병렬 탐지 시)
+        
+        Returns:
+            {'direct': MatchSpanIndex, 'indicator': MatchSpanIndex,
+             'personal_document': bool, 'length': int}
+        """
+        direct_regex, indicator_regex = self._personal_connection_regexes()
+        direct_spans, indicator_spans = spans or (None, None)
+        
+        if personal_document is None:
+            personal_document = self._is_personal_document(text)
+        
+        return {
+            'direct': MatchSpanIndex(direct_regex, text, direct_spans),
+            'indicator': MatchSpanIndex(indicator_regex, text, indicator_spans),
+            'personal_document': personal_document,
+            'length': len(text)
+        }
+    
+    def _is_personal_document(self, text: str) -> bool:
+        """문서 전체가 개인정보 문서인지 확인 (문서 시작 부분 체크)"""
+        doc_header = text[:self.PERSONAL_INDICATOR_WINDOW].lower()
+        return any(doc_type in doc_header for doc_type in self.PERSONAL_DOCUMENT_TYPES)
+    
+    def _check_personal_connection(self, connection_index: Dict, context_start: int,
+                                   context_end: int, position: int) -> tuple:
         """
         민감정보 키워드가 특정 개인과 연결되어 있는지 확인
         
+        Args:
+            connection_index: _build_personal_connection_index 결과
+            context_start, context_end: 클러스터 컨텍스트 범위
+            position: 클러스터 시작 위치
+        
         Returns:
             (is_personal: bool, connection_type: str)
             - connection_type: 'direct' (직접 연결), 'indirect' (간접 연결), 'none' (연결 없음)
         """
-        context_lower = context.lower()
-        
-        # 직접 연결 패턴: 개인을 특정하는 명확한 표현
-        direct_patterns = [
-            # 인적사항 레이블
-            r'성명\s*[:：]', r'이름\s*[:：]', r'환자\s*[:：]', r'회원\s*[:：]',
-            r'피보험자\s*[:：]', r'가입자\s*[:：]', r'신청인\s*[:：]',
-            # 소유/관계 표현
-            r'[가-힣]{2,4}(씨|님|의|은|는|이|가)\s*(건강|진단|병력|종교|신앙|정당)',
-            r'본인의?\s*(건강|진단|병력|종교|신앙|정당)',
-            # 기록 문서 형식
-            r'(진단서|소견서|처방전|의무기록|건강검진|가입신청)',
-            r'(인사기록|신상명세|이력서|입사지원)',
-        ]
-        
-        for pattern in direct_patterns:
-            if re.search(pattern, context, re.IGNORECASE):
-                return True, 'direct'
+        # 직접 연결 패턴: 개인을 특정하는 명확한 표현 (컨텍스트 범위 내)
+        if connection_index['direct'].has_match_within(context_start, context_end):
+            return True, 'direct'
         
         # 간접 연결: 문서 내 다른 곳에 개인정보가 있는 경우
         # 정규식 탐지된 개인정보(주민번호, 전화번호 등)가 같은 문서에 있으면
         # 민감정보 키워드도 그 개인에 관한 것일 가능성 높음
-        personal_indicators = [
-            r'\d{6}[-\s]?[1-4]\d{6}',  # 주민등록번호
-            r'01[016789][-\s]?\d{3,4}[-\s]?\d{4}',  # 휴대전화
-            r'성명\s*[:：]\s*[가-힣]{2,4}',  # 성명 필드
-            r'이름\s*[:：]\s*[가-힣]{2,4}',  # 이름 필드
-        ]
-        
         # 키워드 위치 기준 앞뒤 500자 내에 개인정보가 있는지 확인
-        extended_start = max(0, position - 500)
-        extended_end = min(len(full_text), position + 500)
-        extended_context = full_text[extended_start:extended_end]
-        
-        for pattern in personal_indicators:
-            if re.search(pattern, extended_context):
-                return True, 'indirect'
-        
-        # 문서 전체가 개인정보 문서인지 확인 (문서 시작 부분 체크)
-        doc_header = full_text[:500].lower()
-        document_types = [
-            '인사기록', '신상명세', '이력서', '입사지원', '건강검진',
-            '진단서', '소견서', '처방전', '의무기록', '가입신청',
-            '개인정보', '회원정보', '환자정보', '고객정보'
-        ]
+        extended_start = max(0, position - self.PERSONAL_INDICATOR_WINDOW)
+        extended_end = min(connection_index['length'], position + self.PERSONAL_INDICATOR_WINDOW)
+        
+        if connection_index['indicator'].has_match_within(extended_start, extended_end):
+            return True, 'indirect'
         
-        for doc_type in document_types:
-            if doc_type in doc_header:
-                return True, 'indirect'
+        # 문서 전체가 개인정보 문서인지 (문서 시작 부분 체크 결과)
+        if connection_index['personal_document']:
+            return True, 'indirect'
         
         # 연결 없음 - 일반적인 단어 사용으로 판단
         return False, 'none'
     
-    def analyze_with_llm(self, text: str) -> Dict:
-        """LLM 분석 (개인정보보호법 기반)"""
-        text_sample = text[:2000]
+    def detect(self, text: str, boundaries: Optional[Sequence[int]] = None) -> DetectionResult:
+        """
+        규칙 기반 탐지 (정규식 + 민감정보 키워드) - 문서당 1회
+        
+        Args:
+            text: 대상 텍스트
+            boundaries: 페이지/섹션 시작 위치 목록 (병렬 탐지 구간 경계)
+        """
+        if self.should_parallelize(text):
+            return self.detect_parallel(text, boundaries or ())
+        return DetectionResult(
+            text,
+            self.detect_sensitive_info_regex(text),
+            self.detect_sensitive_keywords(text)
+        )
+    
+    def should_parallelize(self, text: str) -> bool:
+        """병렬 탐지 적용 여부 (설정 + 문서 크기)"""
+        return self.parallel_workers > 1 and len(text) >= PARALLEL_MIN_SIZE
+    
+    def detect_parallel(self, text: str, boundaries: Sequence[int] = (),
+                        workers: Optional[int] = None) -> DetectionResult:
+        """
+        병렬 규칙 기반 탐지 (대용량 문서)
+        
+        페이지/섹션 경계로 나눈 구간을 여러 프로세스에서 탐지한 뒤 합친다.
+        결과는 detect 와 동일한 문서 기준 위치.
+        
+        Args:
+            text: 대상 텍스트
+            boundaries: 페이지/섹션 시작 위치 목록
+            workers: 작업 프로세스 수 (None 이면 parallel_workers 또는 CPU 코어 수)
+        """
+        detector = ParallelDetector(self, workers or self.parallel_workers or None)
+        return detector.detect(text, boundaries)
+    
+    def detect_stream(self, chunks: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      max_match_length: int = DEFAULT_MAX_MATCH_LENGTH) -> DetectionResult:
+        """
+        스트리밍 규칙 기반 탐지 (대용량 텍스트)
+        
+        전체 텍스트를 메모리에 올리지 않고 청크 단위로 탐지한다.
+        결과 위치는 전체 문자열 탐지(detect)와 동일한 문서 기준 절대 위치.
+        
+        Args:
+            chunks: 텍스트 청크 이터러블 (예: DocumentProcessor.iter_text_chunks)
+            chunk_size: 한 번에 처리할 최소 글자 수
+            max_match_length: 매치 하나의 최대 길이 (청크 간 겹침 여유분)
+        """
+        detector = StreamingDetector(self, chunk_size, max_match_length)
+        return detector.detect(chunks)
+    
+    def analyze_with_llm(self, text: str, detection: Optional[DetectionResult] = None) -> Dict:
+        """
+        LLM 분석 (개인정보보호법 기반)
+        
+        - 검증 모드(llm_verify): 규칙 기반 탐지 후보가 있으면 후보 주변 발췌와 탐지 유형
+          요약만 보내 후보를 확인/오탐/추가 판정하게 한다 (프롬프트가 짧아짐)
+        - 전체 분석: 후보가 없거나 검증 모드를 끄면 문서를 토큰 예산에 맞는 구간으로
+          나누어 분석한다 (core.llm_chunking). 짧은 문서는 구간 1개로 한 번만 요청한다.
+        구간별 요청은 동시에 보내고 결과를 합친다. 구간 결과는 디스크 캐시(core.llm_cache)에
+        저장되며, 모든 구간이 캐시에 있으면 서버 상태 확인도 하지 않는다.
+        모델 라우터가 있으면 탐지 결과와 프롬프트 크기로 문서마다 모델을 고르고
+        (core.model_router), 사용한 모델은 결과의 llm_model 에 기록한다.
+        
+        Args:
+            text: 분석 대상 텍스트
+            detection: 이미 계산된 탐지 결과 (검증 프롬프트 / LLM 실패 시 대체 분석에 사용)
+        """
+        if detection is None and self.llm_verify:
+            detection = self.detect(text)
+        prompts, coverage, scope = self._plan_prompts(text, detection)
+        model = self._route_model(detection, prompts).model
+        
+        # 모든 구간이 캐시에 있으면 모델 호출 없이 결과 사용
+        cached = self._cached_results(prompts, model)
+        if cached is not None:
+            try:
+                parsed = reduce_chunk_results(cached, coverage, scope)
+            except Exception as e:
+                # 캐시된 결과를 합칠 수 없으면 캐시를 쓰지 않고 다시 요청
+                logger.warning(f"LLM 분석 결과 캐시 사용 실패: {str(e)}")
+                parsed = None
+            if parsed and 'recommendations' in parsed:
+                logger.info("LLM 분석 결과 캐시 사용")
+                self._emit_status("✅ LLM 분석 결과 캐시 사용")
+                parsed['llm_model'] = model
+                return parsed
+        
+        try:
+            # 서버 상태 확인 (TTL 캐시 - 문서마다 /api/tags 를 호출하지 않음)
+            self._emit_status("🔗 Ollama 서버 상태 확인 중...")
+            status = self.client.probe(timeout=2)
+            if not status.running:
+                if status.status_code is not None:
+                    logger.warning("Ollama 서버 응답 없음")
+                    self._emit_status("❌ Ollama 서버 응답 없음")
+                else:
+                    logger.warning("Ollama 서버 접속 불가")
+                    self._emit_status("❌ Ollama 서버 접속 불가")
+                return self._create_enhanced_analysis(text, detection)
+            
+            # 라우팅된 모델이 서버에 없으면 기본 모델 사용
+            if model != self.model_name and not status.has_model(model):
+                logger.warning(f"라우팅 모델 없음 ({model}) - {self.model_name} 사용")
+                model = self.model_name
+            
+            # 모델 적재는 생성 타임아웃과 별도 한도로 먼저 기다림 (유휴 후 첫 요청)
+            if not self.client.is_warm(model):
+                self._emit_status(f"⏳ {model} 모델 적재 중...")
+                if not self.client.load_model(model, self.keep_alive):
+                    logger.warning(f"모델 적재 실패 ({model}, 한도 {OLLAMA_LOAD_TIMEOUT}초)")
+                    self._emit_status("❌ 모델 적재 실패")
+                    return self._create_enhanced_analysis(text, detection)
+            
+            # LLM 호출
+            mode = "검증" if scope == "탐지 후보" else "분석"
+            if len(prompts) <= 1:
+                self._emit_status(f"🤖 {model} 모델로 LLM {mode} 중...")
+                parsed = self._request_llm(prompts[0], model)
+            else:
+                parsed = self._analyze_chunks(prompts, coverage, scope, model)
+            
+            if parsed and 'recommendations' in parsed:
+                logger.info("LLM 분석 성공")
+                self._emit_status("✅ LLM 분석 성공")
+                parsed['llm_model'] = model
+                return parsed
+            else:
+                logger.warning("LLM 응답 파싱 실패")
+                self._emit_status("❌ LLM 응답 파싱 실패")
+                
+        except requests.exceptions.Timeout:
+            logger.warning(f"LLM 타임아웃 ({OLLAMA_TIMEOUT}초)")
+            self._emit_status(f"⏰ LLM 타임아웃")
+        except Exception as e:
+            logger.warning(f"LLM 분석 실패: {str(e)}")
+            self._emit_status(f"❌ LLM 분석 실패")
+        
+        return self._create_enhanced_analysis(text, detection)
+    
+    def _build_prompt(self, text_sample: str, part: str = '') -> str:
+        """
+        LLM 분석 프롬프트 생성
         
-        prompt = f"""문서 보안 전문가로서 개인정보보호법에 따라 다음 문서를 분석하세요.
+        Args:
+            text_sample: 문서 본문 (또는 구간)
+            part: 구간 표시 (예: " (전체 8개 구간 중 3번째)")
+        """
+        return f"""문서 보안 전문가로서 개인정보보호법에 따라 다음 문서를 분석하세요.
 
-【문서】
+【문서】{part}
 {text_sample}
 
-【분류 기준 (개인정보보호법)】
-1. 고유식별정보 (제24조): 주민등록번호, 여권번호, 운전면허번호, 외국인등록번호
-2. 민감정보 (제23조): 사상·신념, 노동조합·정당, 정치적 견해, 건강, 성생활 정보
-3. 금융정보 (제34조의2): 계좌번호, 카드번호 - 노출 금지
-4. 일반개인정보 (제2조): 전화번호, 이메일, 주소 등
-
-【위험도 기준】
-- 낮음: 0-24점 (일반개인정보 소량)
-- 보통: 25-49점 (일반개인정보 다수 또는 민감정보 소량)
-- 높음: 50-74점 (고유식별정보 또는 금융정보 포함)
-- 심각: 75-100점 (고유식별정보 + 금융정보 다수, 복합 노출)
+{self.LLM_PROMPT_CRITERIA}
 
 【출력 형식】
 반드시 다음 JSON 형식으로만 응답하세요:
@@ -430,60 +861,338 @@ class LocalLLMAnalyzer:
 }}
 
 JSON만 출력하세요."""
+    
+    def _build_verification_prompt(self, excerpts: str, summary: str, part: str = '') -> str:
+        """
+        검증 프롬프트 생성 (규칙 기반 탐지 후보 확인/오탐/추가 판정)
+        
+        Args:
+            excerpts: 후보 주변 발췌 (_render_window, 후보 값은 «» 표시)
+            summary: 문서 전체 탐지 유형별 개수
+            part: 묶음 표시 (예: " (전체 3개 묶음 중 2번째)")
+        """
+        return f"""문서 보안 전문가로서 개인정보보호법에 따라 규칙 기반 탐지 결과를 검증하세요.
+
+【규칙 기반 탐지 요약 (문서 전체)】
+{summary}
+
+【탐지 후보 주변 발췌】{part}
+«» 안이 규칙 기반으로 탐지된 값입니다.
+{excerpts}
+
+【검증 방법】
+- 확인: «» 값이 실제 개인정보인 경우
+- 오탐: «» 값이 개인정보가 아닌 경우 (예: 문서번호, 금액, 날짜)
+- 추가: 발췌 안에 «» 표시되지 않은 개인정보가 있는 경우
+
+{self.LLM_PROMPT_CRITERIA}
+
+【출력 형식】
+반드시 다음 JSON 형식으로만 응답하세요:
+{{
+  "detected_info": [{{"type": "유형", "value": "값", "legal_category": "법적분류", "verdict": "확인|오탐|추가"}}],
+  "risk_level": "낮음|보통|높음|심각",
+  "risk_score": 숫자(0-100),
+  "reasoning": "탐지 요약과 검증 결과, 법적 근거에 따른 위험도 판단",
+  "legal_violations": ["위반 가능성이 있는 조항"],
+  "recommendations": ["보호조치1", "보호조치2", "보호조치3"]
+}}
 
+JSON만 출력하세요."""
+    
+    def _plan_prompts(self, text: str,
+                      detection: Optional[DetectionResult]) -> Tuple[List[str], float, str]:
+        """
+        LLM 요청 계획
+        
+        Returns:
+            (구간별 프롬프트, 분석 범위 비율, 분석 범위 기준)
+        """
+        candidates = detection.merged() if detection is not None and self.llm_verify else []
+        if candidates:
+            prompts, coverage = self._verification_prompts(text, candidates)
+            return prompts, coverage, "탐지 후보"
+        
+        chunks = plan_chunks(text, self.llm_chunk_tokens, self.llm_token_budget)
+        coverage = sum(end - start for start, end in chunks) / max(1, len(text))
+        return self._chunk_prompts(text, chunks), coverage, "문서"
+    
+    def _chunk_prompts(self, text: str, chunks: List[Tuple[int, int]]) -> List[str]:
+        """구간별 프롬프트 (구간이 없으면 빈 문서 프롬프트 1개)"""
+        if len(chunks) <= 1:
+            return [self._build_prompt(text[:chunks[0][1]] if chunks else '')]
+        total = len(chunks)
+        return [
+            self._build_prompt(text[start:end], f" (전체 {total}개 구간 중 {index}번째)")
+            for index, (start, end) in enumerate(chunks, 1)
+        ]
+    
+    def _verification_prompts(self, text: str, candidates: List[Dict]) -> Tuple[List[str], float]:
+        """
+        검증 프롬프트 생성
+        
+        후보 주변 창을 프롬프트당 토큰 한도로 묶고, 토큰 예산을 넘으면 묶음을 문서 전체에
+        고르게 고른다. 탐지 유형 요약은 모든 후보 기준으로 매 프롬프트에 포함한다.
+        
+        Returns:
+            (프롬프트 목록, 프롬프트에 포함된 후보 비율)
+        """
+        candidates = sorted(candidates, key=lambda x: x['start'])
+        starts = [c['start'] for c in candidates]
+        windows = candidate_windows(
+            len(text), ((c['start'], c['end']) for c in candidates), self.LLM_VERIFY_CONTEXT
+        )
+        max_groups = max(1, self.llm_token_budget // max(1, self.llm_chunk_tokens))
+        groups = select_chunks(group_windows(text, windows, self.llm_chunk_tokens), max_groups)
+        
+        summary = "\n".join(
+            f"- {name}: {count}개"
+            for name, count in Counter(c['type'] for c in candidates).most_common()
+        )
+        
+        prompts = []
+        covered = 0
+        number = 1
+        for index, group in enumerate(groups, 1):
+            excerpts = []
+            for window_start, window_end in group:
+                excerpt, count = self._render_window(
+                    text, window_start, window_end, candidates, starts
+                )
+                excerpts.append(f"[{number}] {excerpt}")
+                covered += count
+                number += 1
+            part = f" (전체 {len(groups)}개 묶음 중 {index}번째)" if len(groups) > 1 else ""
+            prompts.append(self._build_verification_prompt("\n".join(excerpts), summary, part))
+        
+        return prompts, covered / len(candidates)
+    
+    @staticmethod
+    def _render_window(text: str, window_start: int, window_end: int,
+                       candidates: List[Dict], starts: List[int]) -> Tuple[str, int]:
+        """
+        후보 주변 발췌 (후보 값을 «» 로 표시, 줄바꿈은 공백으로)
+        
+        Returns:
+            (발췌 문자열, 발췌에 포함된 후보 수)
+        """
+        parts = []
+        pos = window_start
+        count = 0
+        for i in range(bisect_left(starts, window_start), len(candidates)):
+            candidate = candidates[i]
+            if candidate['start'] >= window_end:
+                break
+            start, end = candidate['start'], min(candidate['end'], window_end)
+            if start < pos:
+                continue
+            parts.append(text[pos:start])
+            parts.append(f"«{text[start:end]}»")
+            pos = end
+            count += 1
+        parts.append(text[pos:window_end])
+        return re.sub(r'\s+', ' ', ''.join(parts)).strip(), count
+    
+    def warm_up_models(self) -> Dict[str, bool]:
+        """
+        분석에 쓸 모델 미리 적재 (라우터가 있으면 라우팅 대상 모델, 없으면 선택 모델)
+        
+        서버에 설치되지 않은 모델은 건너뛴다. 적재 중인 모델을 분석이 요청하면
+        적재가 끝날 때까지 기다린다 (OllamaClient.load_model).
+        
+        Returns:
+            {모델: 적재 성공 여부}
+        """
+        status = self.client.probe(timeout=2)
+        if not status.running:
+            return {}
+        
+        models = self.model_router.models if self.model_router else [self.model_name]
+        results = {}
+        for model in models:
+            if status.has_model(model):
+                results[model] = self.client.load_model(model, self.keep_alive)
+                logger.info(f"모델 적재 {'완료' if results[model] else '실패'}: {model}")
+        return results
+    
+    def _route_model(self, detection: Optional[DetectionResult],
+                     prompts: List[str]) -> RouteDecision:
+        """문서 1건의 LLM 모델 선택 (라우터가 없거나 탐지 결과가 없으면 기본 모델)"""
+        if self.model_router is None or detection is None:
+            return RouteDecision(self.model_name, "기본 모델")
+        decision = self.model_router.route(
+            detection, sum(estimate_tokens(prompt) for prompt in prompts)
+        )
+        logger.info(f"모델 라우팅: {decision.model} ({decision.reason})")
+        return decision
+    
+    def _cache_key(self, prompt: str, model: str) -> str:
+        """LLM 캐시 키 (모델, 프롬프트 템플릿 버전, 프롬프트)"""
+        return LLMResultCache.make_key(model, self.LLM_PROMPT_VERSION, prompt)
+    
+    def _cached_results(self, prompts: List[str], model: str) -> Optional[List[Dict]]:
+        """모든 프롬프트의 캐시 결과 (하나라도 없으면 None)"""
+        if self.llm_cache is None:
+            return None
+        results = []
+        for prompt in prompts:
+            result = self.llm_cache.get(self._cache_key(prompt, model))
+            if result is None:
+                return None
+            results.append(result)
+        return results
+    
+    def _request_llm(self, prompt: str, model: Optional[str] = None) -> Optional[Dict]:
+        """
+        LLM 요청 1회 (캐시 우선, 스트리밍 설정에 따라 증분 파싱)
+        
+        유효한 응답(권고사항 포함)은 캐시에 저장하고, 모델 요청 소요 시간은
+        모델별 지연 시간 통계에 기록한다.
+        
+        Args:
+            prompt: 프롬프트
+            model: 모델 이름 (None 이면 model_name)
+        
+        Returns:
+            파싱된 응답 또는 None
+        
+        Raises:
+            requests.exceptions.RequestException: 접속 실패 / 타임아웃
+        """
+        model = model or self.model_name
+        key = None
+        if self.llm_cache is not None:
+            key = self._cache_key(prompt, model)
+            cached = self.llm_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        started = time.perf_counter()
+        parsed = None
         try:
-            # 서버 상태 확인
-            try:
-                self._emit_status("🔗 Ollama 서버 상태 확인 중...")
-                health_response = requests.get(OLLAMA_TAGS_URL, timeout=2)
-                if health_response.status_code != 200:
-                    logger.warning("Ollama 서버 응답 없음")
-                    self._emit_status("❌ Ollama 서버 응답 없음")
-                    return self._create_enhanced_analysis(text)
-            except:
-                logger.warning("Ollama 서버 접속 불가")
-                self._emit_status("❌ Ollama 서버 접속 불가")
-                return self._create_enhanced_analysis(text)
-            
-            # LLM 호출
-            self._emit_status(f"🤖 {self.model_name} 모델로 LLM 분석 중...")
-            response = requests.post(
-                self.ollama_url,
-                json={
-                    "model": self.model_name,
-                    "prompt": prompt,
-                    "stream": False,
-                    "temperature": 0.2,
-                    "top_p": 0.9,
-                    "top_k": 40
-                },
-                timeout=OLLAMA_TIMEOUT
+            parsed = self._generate(prompt, model)
+        finally:
+            self.model_stats.record(
+                model, time.perf_counter() - started, estimate_tokens(prompt),
+                bool(parsed and 'recommendations' in parsed)
             )
-            
-            if response.status_code == 200:
-                self._emit_status("📝 LLM 응답 파싱 중...")
-                llm_response = response.json().get('response', '')
-                parsed = self._parse_json(llm_response)
+        if key is not None and parsed and 'recommendations' in parsed:
+            self.llm_cache.put(key, parsed)
+        return parsed
+    
+    def _generate(self, prompt: str, model: str) -> Optional[Dict]:
+        """LLM 생성 요청 및 응답 파싱"""
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": self.stream_llm,
+            "keep_alive": self.keep_alive,
+            "temperature": 0.2,
+            "top_p": 0.9,
+            "top_k": 40
+        }
+        
+        if self.stream_llm:
+            return self._generate_streaming(payload)
+        
+        response = self.client.generate(payload, timeout=OLLAMA_TIMEOUT)
+        if response.status_code != 200:
+            logger.warning(f"LLM 서버 오류 (status={response.status_code})")
+            self._emit_status(f"❌ LLM 서버 오류")
+            return None
+        
+        self._emit_status("📝 LLM 응답 파싱 중...")
+        return self._parse_json(response.json().get('response', ''))
+    
+    def _analyze_chunks(self, prompts: List[str], coverage: float,
+                        scope: str = "문서", model: Optional[str] = None) -> Optional[Dict]:
+        """
+        구간별 LLM 분석 (map) 후 결과 합치기 (reduce)
+        
+        구간 요청은 동시에 보내며, 동시 요청 수는 공유 Ollama 클라이언트가
+        연결 풀 크기로 제한한다. 실패한 구간은 제외하고 합친다.
+        
+        Args:
+            prompts: 구간별 프롬프트 (_plan_prompts)
+            coverage: 분석 범위 비율
+            scope: 분석 범위 기준 (문서 / 탐지 후보)
+            model: 모델 이름 (None 이면 model_name)
+        """
+        model = model or self.model_name
+        total = len(prompts)
+        self._emit_status(
+            f"🤖 {model} 모델로 LLM 분석 중... "
+            f"({total}개 구간, {scope}의 {coverage * 100:.0f}%)"
+        )
+        
+        def analyze(index: int) -> Optional[Dict]:
+            try:
+                return self._request_llm(prompts[index], model)
+            except Exception as e:
+                logger.warning(f"LLM 구간 {index + 1}/{total} 분석 실패: {str(e)}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(total, self.client.pool_size),
+                                thread_name_prefix='llm-chunk') as executor:
+            results = list(executor.map(analyze, range(total)))
+        
+        valid = sum(1 for r in results if r and 'recommendations' in r)
+        logger.info(f"LLM 구간 분석 완료: {valid}/{total}개 구간 유효")
+        return reduce_chunk_results(results, coverage, scope)
+    
+    def _generate_streaming(self, payload: Dict) -> Optional[Dict]:
+        """
+        LLM 스트리밍 호출 + 증분 JSON 파싱
+        
+        - 최상위 키 값이 완료될 때마다 상태 메시지로 진행 상황 전달
+        - 필수 키(LLM_RESPONSE_KEYS)가 모두 완료되거나 JSON 객체가 닫히면
+          생성 종료를 기다리지 않고 중단 (뒤따르는 설명문 생성 생략)
+        - 토큰 간 대기(OLLAMA_TIMEOUT) / 전체 시간(OLLAMA_STREAM_MAX_TIME) 초과 시
+          그때까지 완료된 항목에 권고사항이 있으면 그대로 사용
+        
+        Returns:
+            파싱된 응답 (완료된 키만 포함) 또는 None
+        
+        Raises:
+            requests.exceptions.Timeout: 권고사항 완료 전 타임아웃
+        """
+        parser = IncrementalJSONParser()
+        deadline = time.monotonic() + OLLAMA_STREAM_MAX_TIME
+        stream = self.client.generate_stream(payload, timeout=(5, OLLAMA_TIMEOUT))
+        
+        try:
+            for chunk in stream:
+                if chunk.get('error'):
+                    logger.warning(f"LLM 서버 오류: {chunk['error']}")
+                    break
                 
-                if parsed and 'recommendations' in parsed:
-                    logger.info("LLM 분석 성공")
-                    self._emit_status("✅ LLM 분석 성공")
-                    return parsed
-                else:
-                    logger.warning("LLM 응답 파싱 실패")
-                    self._emit_status("❌ LLM 응답 파싱 실패")
-            else:
-                logger.warning(f"LLM 서버 오류 (status={response.status_code})")
-                self._emit_status(f"❌ LLM 서버 오류")
+                if not parser.text and chunk.get('response'):
+                    self._emit_status("📝 LLM 응답 수신 중...")
+                for key in parser.feed(chunk.get('response', '')):
+                    self._emit_status(
+                        f"📝 LLM 응답 수신 중... {key} 완료 "
+                        f"({len(parser.values)}/{len(self.LLM_RESPONSE_KEYS)})"
+                    )
                 
+                if parser.closed or parser.has_keys(self.LLM_RESPONSE_KEYS):
+                    if not chunk.get('done'):
+                        logger.info("LLM 응답 JSON 완료 - 생성 조기 종료")
+                    break
+                if chunk.get('done'):
+                    break
+                if time.monotonic() > deadline:
+                    logger.warning(f"LLM 스트리밍 시간 초과 ({OLLAMA_STREAM_MAX_TIME}초) - 완료된 항목 사용")
+                    break
         except requests.exceptions.Timeout:
-            logger.warning(f"LLM 타임아웃 ({OLLAMA_TIMEOUT}초)")
-            self._emit_status(f"⏰ LLM 타임아웃")
-        except Exception as e:
-            logger.warning(f"LLM 분석 실패: {str(e)}")
-            self._emit_status(f"❌ LLM 분석 실패")
-        
-        return self._create_enhanced_analysis(text)
+            if 'recommendations' not in parser.values:
+                raise
+            logger.warning("LLM 응답 대기 타임아웃 - 완료된 항목 사용")
+        finally:
+            stream.close()
+        
+        if parser.values:
+            return parser.result()
+        return self._parse_json(parser.text)
     
     def _parse_json(self, response: str) -> Optional[Dict]:
         """JSON 파싱"""
@@ -502,26 +1211,20 @@ JSON만 출력하세요."""
         
         return None
     
-    def _create_enhanced_analysis(self, text: str) -> Dict:
-        """강화된 규칙 기반 분석 (개인정보보호법 준수)"""
-        # 정규식 탐지
-        regex_detected = self.detect_sensitive_info_regex(text)
+    def _create_enhanced_analysis(self, text: str,
+                                  detection: Optional[DetectionResult] = None) -> Dict:
+        """
+        강화된 규칙 기반 분석 (개인정보보호법 준수)
         
-        # 민감정보 키워드 탐지
-        keyword_detected = self.detect_sensitive_keywords(text)
+        Args:
+            text: 분석 대상 텍스트
+            detection: 이미 계산된 탐지 결과 (없으면 새로 탐지)
+        """
+        if detection is None:
+            detection = self.detect(text)
         
         # 통합 (중복 제거)
-        all_detected = regex_detected.copy()
-        existing_ranges = [(d['start'], d['end']) for d in regex_detected]
-        
-        for kw in keyword_detected:
-            is_dup = any(
-                self._is_overlapping(kw['start'], kw['end'], s, e)
-                for s, e in existing_ranges
-            )
-            if not is_dup:
-                all_detected.append(kw)
-                existing_ranges.append((kw['start'], kw['end']))
+        all_detected = detection.merged()
         
         # 법적 분류별 집계
         category_counts = {
@@ -546,22 +1249,31 @@ JSON만 출력하세요."""
         
         # 위험도 계산 (법적 분류 기반)
         risk_score = 0
+        weights = self.LEGAL_CATEGORY_WEIGHTS
         
         # 고유식별정보 (제24조) - 최고 위험
         unique_id_count = category_counts.get("고유식별정보", 0)
-        risk_score += unique_id_count * 20
+        risk_score += unique_id_count * weights["고유식별정보"]
         
         # 금융정보 (제34조의2) - 고위험
         financial_count = category_counts.get("금융정보", 0)
-        risk_score += financial_count * 15
+        risk_score += financial_count * weights["금융정보"]
         
         # 민감정보 (제23조) - 고위험
         sensitive_count = category_counts.get("민감정보", 0)
-        risk_score += sensitive_count * 12
+        risk_score += sensitive_count * weights["민감정보"]
         
         # 일반개인정보 (제2조) - 기본 위험
         general_count = category_counts.get("일반개인정보", 0)
-        risk_score += general_count * 5
+        risk_score += general_count * weights["일반개인정보"]
+        
+        # 사용자 정의 탐지기 가중치 (지정된 경우 법적 분류 기본 가중치 대신 적용)
+        for item in all_detected:
+            detector = self.custom_detectors.get(item['type'])
+            if detector and detector.weight is not None:
+                risk_score += detector.weight - weights.get(
+                    item.get('legal_category', '일반개인정보'), 0
+                )
         
         # 복합 노출 가중치
         active_categories = sum(1 for c in category_counts.values() if c > 0)
@@ -582,14 +1294,7 @@ JSON만 출력하세요."""
         risk_score = min(risk_score, 100)
         
         # 위험도 레벨
-        if risk_score >= 75:
-            risk_level = "심각"
-        elif risk_score >= 50:
-            risk_level = "높음"
-        elif risk_score >= 25:
-            risk_level = "보통"
-        else:
-            risk_level = "낮음"
+        risk_level = risk_level_for_score(risk_score)
         
         # 법적 위반 가능성 판단
         legal_violations = []
@@ -651,55 +1356,146 @@ JSON만 출력하세요."""
             "recommendations": recommendations
         }
     
-    def comprehensive_analysis(self, text: str) -> Tuple[Dict, List[Dict]]:
-        """종합 분석 (개인정보보호법 기반)"""
-        logger.info("분석 시작 - 개인정보보호법 기반 분석")
-        self._emit_status("🔍 정규식 기반 개인정보 탐지 중...")
+    def comprehensive_analysis(self, text: str,
+                               boundaries: Optional[Sequence[int]] = None) -> Tuple[Dict, List[Dict]]:
+        """
+        종합 분석 (개인정보보호법 기반)
         
-        # 1단계: 정규식 기반 탐지
-        regex_detected = self.detect_sensitive_info_regex(text)
-        logger.info(f"정규식 탐지 완료: {len(regex_detected)}개")
-        self._emit_status(f"✅ 정규식 탐지: {len(regex_detected)}개")
+        Args:
+            text: 대상 텍스트
+            boundaries: 페이지/섹션 시작 위치 목록 (병렬 탐지 구간 경계)
+        """
+        detection, rule_based_analysis = self.prepare_analysis(text, boundaries)
+        llm_analysis = self.run_llm_analysis(text, detection)
+        return self.finish_analysis(text, detection, rule_based_analysis, llm_analysis)
+    
+    def prepare_analysis(self, text: str,
+                         boundaries: Optional[Sequence[int]] = None) -> Tuple[DetectionResult, Dict]:
+        """
+        종합 분석 1~3단계: 규칙 기반 탐지 및 위험도 분석 (LLM 호출 전)
         
-        # 2단계: 민감정보 키워드 탐지
-        self._emit_status("🔍 민감정보 키워드 탐지 중...")
-        keyword_detected = self.detect_sensitive_keywords(text)
-        logger.info(f"키워드 탐지 완료: {len(keyword_detected)}개")
-        self._emit_status(f"✅ 키워드 탐지: {len(keyword_detected)}개")
+        일괄 분석에서는 이 단계를 다음 파일에 대해 미리 실행해 LLM 대기와 겹친다.
+        
+        Returns:
+            (탐지 결과, 규칙 기반 분석 결과)
+        """
+        logger.info("분석 시작 - 개인정보보호법 기반 분석")
+        
+        # 1~2단계 탐지 결과는 이후 모든 단계가 공유 - 문서당 1회 탐지
+        if self.should_parallelize(text):
+            # 대용량 문서: 정규식 + 키워드 탐지를 구간별로 병렬 실행
+            self._emit_status(f"🔍 병렬 규칙 기반 탐지 중... ({self.parallel_workers}개 프로세스)")
+            detection = self.detect_parallel(text, boundaries or ())
+            logger.info(
+                f"병렬 탐지 완료: 정규식 {len(detection.regex_detected)}개, "
+                f"키워드 {len(detection.keyword_detected)}개"
+            )
+            self._emit_status(
+                f"✅ 정규식 탐지: {len(detection.regex_detected)}개, "
+                f"키워드 탐지: {len(detection.keyword_detected)}개"
+            )
+            self._emit_stage(STAGE_REGEX)
+            self._emit_stage(STAGE_KEYWORDS)
+        else:
+            # 1단계: 정규식 기반 탐지
+            self._emit_status("🔍 정규식 기반 개인정보 탐지 중...")
+            regex_detected = self.detect_sensitive_info_regex(text)
+            logger.info(f"정규식 탐지 완료: {len(regex_detected)}개")
+            self._emit_status(f"✅ 정규식 탐지: {len(regex_detected)}개")
+            self._emit_stage(STAGE_REGEX)
+            
+            # 2단계: 민감정보 키워드 탐지
+            self._emit_status("🔍 민감정보 키워드 탐지 중...")
+            keyword_detected = self.detect_sensitive_keywords(text)
+            logger.info(f"키워드 탐지 완료: {len(keyword_detected)}개")
+            self._emit_status(f"✅ 키워드 탐지: {len(keyword_detected)}개")
+            self._emit_stage(STAGE_KEYWORDS)
+            
+            detection = DetectionResult(text, regex_detected, keyword_detected)
         
         # 3단계: 규칙 기반 분석
         self._emit_status("📊 규칙 기반 위험도 분석 중...")
-        rule_based_analysis = self._create_enhanced_analysis(text)
+        rule_based_analysis = self._create_enhanced_analysis(text, detection)
         logger.info("규칙 기반 분석 완료")
         self._emit_status("✅ 규칙 기반 분석 완료")
         
-        # 4단계: LLM 분석 (선택적)
-        llm_enhanced = False
+        return detection, rule_based_analysis
+    
+    def prepare_stream_analysis(self, chunks: Iterable[str]) -> Tuple[DetectionResult, Dict]:
+        """
+        종합 분석 1~3단계의 스트리밍 버전 (대용량 텍스트)
+        
+        청크 단위로 탐지해 전체 텍스트를 메모리에 올리지 않는다. 탐지 결과의 text 는 None 이며,
+        LLM 분석 없이 finish_analysis("", detection, 분석 결과) 로 결과를 통합한다.
+        
+        Args:
+            chunks: 텍스트 청크 이터러블 (DocumentProcessor.iter_text_chunks)
+        
+        Returns:
+            (탐지 결과, 규칙 기반 분석 결과)
+        """
+        logger.info("분석 시작 - 스트리밍 규칙 기반 분석")
+        self._emit_status("🔍 스트리밍 규칙 기반 탐지 중...")
+        detection = self.detect_stream(chunks)
+        logger.info(
+            f"스트리밍 탐지 완료: 정규식 {len(detection.regex_detected)}개, "
+            f"키워드 {len(detection.keyword_detected)}개"
+        )
+        self._emit_stage(STAGE_REGEX)
+        self._emit_stage(STAGE_KEYWORDS)
+        
+        self._emit_status("📊 규칙 기반 위험도 분석 중...")
+        rule_based_analysis = self._create_enhanced_analysis("", detection)
+        return detection, rule_based_analysis
+    
+    def run_llm_analysis(self, text: str, detection: DetectionResult) -> Optional[Dict]:
+        """
+        종합 분석 4단계: LLM 분석 (선택적)
+        
+        여러 스레드에서 동시에 호출할 수 있다 (LLMDispatcher).
+        
+        Returns:
+            유효한 LLM 분석 결과 (실패/무효 시 None)
+        """
         try:
             logger.info("LLM 분석 시도 중...")
             self._emit_status("🤖 LLM 분석 시도 중...")
-            llm_analysis = self.analyze_with_llm(text)
+            llm_analysis = self.analyze_with_llm(text, detection)
             
             if llm_analysis and 'risk_level' in llm_analysis:
-                rule_based_analysis = llm_analysis
-                llm_enhanced = True
                 logger.info("LLM 분석 결과 적용")
                 self._emit_status("✅ LLM 분석 성공")
-            else:
-                self._emit_status("⚠️ LLM 결과 무효 - 규칙 기반 결과 사용")
+                return llm_analysis
+            self._emit_status("⚠️ LLM 결과 무효 - 규칙 기반 결과 사용")
         except Exception as e:
             logger.warning(f"LLM 분석 예외: {str(e)}")
             self._emit_status("❌ LLM 분석 실패 - 규칙 기반 결과 사용")
+        return None
+    
+    def finish_analysis(self, text: str, detection: DetectionResult,
+                        rule_based_analysis: Dict,
+                        llm_analysis: Optional[Dict] = None) -> Tuple[Dict, List[Dict]]:
+        """
+        종합 분석 5~6단계: 권고사항 보장 및 탐지 항목 통합
+        
+        Args:
+            text: 대상 텍스트
+            detection: prepare_analysis 탐지 결과
+            rule_based_analysis: prepare_analysis 규칙 기반 분석 결과
+            llm_analysis: run_llm_analysis 결과 (None 이면 규칙 기반 결과 사용)
+        
+        결과의 llm_used 는 LLM 응답을 실제로 사용했는지 여부이다. LLM 서버 오류 / 타임아웃으로
+        규칙 기반 결과로 대체한 경우(llm_model 없음)는 False 이므로 저장해 두고 재사용하지 않는다.
+        """
+        llm_enhanced = llm_analysis is not None
+        if llm_enhanced:
+            rule_based_analysis = llm_analysis
+        rule_based_analysis['llm_used'] = llm_enhanced and 'llm_model' in llm_analysis
         
         # 5단계: 권고사항 보장
         if len(rule_based_analysis.get('recommendations', [])) < 3:
-            all_detected = regex_detected + [
-                k for k in keyword_detected 
-                if not any(self._is_overlapping(k['start'], k['end'], r['start'], r['end']) 
-                          for r in regex_detected)
-            ]
             enhanced_recommendations = self.recommendation_engine.generate_recommendations(
-                all_detected,
+                detection.combined(),
                 rule_based_analysis.get('risk_level', '보통'),
                 rule_based_analysis.get('risk_score', 50),
                 text
@@ -707,32 +1503,59 @@ JSON만 출력하세요."""
             rule_based_analysis['recommendations'] = enhanced_recommendations
         
         # 6단계: 탐지 항목 통합
-        all_detected = regex_detected.copy()
-        existing_ranges = [(d['start'], d['end']) for d in regex_detected]
-        
-        for kw in keyword_detected:
-            is_dup = any(
-                self._is_overlapping(kw['start'], kw['end'], s, e)
-                for s, e in existing_ranges
-            )
-            if not is_dup:
-                all_detected.append(kw)
+        all_detected = detection.combined()
         
         if llm_enhanced:
-            for llm_item in rule_based_analysis.get('detected_info', []):
-                value = llm_item.get('value', '')
-                if value and not any(d['value'] == value for d in all_detected):
-                    pos = text.find(value)
-                    if pos != -1:
-                        all_detected.append({
-                            'type': llm_item.get('type', '기타'),
-                            'value': value,
-                            'start': pos,
-                            'end': pos + len(value),
-                            'context': llm_item.get('context', 'LLM 탐지'),
-                            'method': 'llm',
-                            'legal_category': llm_item.get('legal_category', '일반개인정보')
-                        })
+            llm_items = [
+                (llm_item, self._llm_item_value(llm_item))
+                for llm_item in rule_based_analysis.get('detected_info', [])
+            ]
+            
+            # 검증 모드 판정 기록 (오탐 판정 항목도 마스킹 누락을 막기 위해 목록에는 유지)
+            verdicts = {}
+            for llm_item, value in llm_items:
+                verdict = llm_item.get('verdict')
+                if value and verdict in (self.LLM_VERDICT_CONFIRMED, self.LLM_VERDICT_REJECTED):
+                    verdicts[normalize_value(value)] = verdict
+            if verdicts:
+                marked = []
+                for d in all_detected:
+                    verdict = verdicts.get(normalize_value(d['value']))
+                    marked.append(dict(d, llm_verdict=verdict) if verdict else d)
+                all_detected = marked
+            
+            # 이미 탐지된 값은 집합으로 확인하고, 새 값의 위치는 문서를 한 번만 훑어 색인
+            known = {normalize_value(d['value']) for d in all_detected}
+            new_items = [
+                (llm_item, value) for llm_item, value in llm_items
+                if value and llm_item.get('verdict') != self.LLM_VERDICT_REJECTED
+                and normalize_value(value) not in known
+            ]
+            value_index = ValueIndex(text, (value for _, value in new_items))
+            # 규칙 기반 항목(정규식 + 키워드 클러스터) 범위와 겹치는 위치는 추가하지 않음
+            occupied = IntervalIndex(merge_spans((d['start'], d['end']) for d in all_detected))
+            
+            for llm_item, value in new_items:
+                key = normalize_value(value)
+                if key in known:
+                    continue
+                known.add(key)
+                
+                # 모든 등장 위치를 항목으로 추가 (강조 표시 / 마스킹 대상)
+                for pos in value_index.offsets(key):
+                    end = pos + len(key)
+                    if occupied.overlaps(pos, end):
+                        continue
+                    occupied.add(pos, end)
+                    all_detected.append({
+                        'type': llm_item.get('type', '기타'),
+                        'value': text[pos:end],
+                        'start': pos,
+                        'end': end,
+                        'context': llm_item.get('context', 'LLM 탐지'),
+                        'method': 'llm',
+                        'legal_category': llm_item.get('legal_category', '일반개인정보')
+                    })
         
         all_detected.sort(key=lambda x: x.get('start', 0))
         
@@ -741,6 +1564,14 @@ JSON만 출력하세요."""
         
         return rule_based_analysis, all_detected
     
+    @staticmethod
+    def _llm_item_value(llm_item: Dict) -> str:
+        """LLM 탐지 항목 값 (검증 프롬프트의 «» 표시 제거, 문자열/숫자 외 값은 무시)"""
+        value = llm_item.get('value', '')
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        return value.strip('«»') if isinstance(value, str) else ''
+    
     def mask_sensitive_info(self, text: str, detected_items: List[Dict]) -> str:
         """민감정보 마스킹"""
         masked_text = text
@@ -0,0 +1,238 @@
+"""
+일괄 분석 작업 기록 (이어서 분석하기)
+
+일괄 분석 결과는 GUI 메모리에만 있으므로 프로그램이 종료되거나 분석을 취소하면
+처음부터 다시 분석해야 한다. 작업마다 추가 전용(append-only) 기록 파일을 남겨,
+같은 파일 목록을 다시 분석할 때 이미 끝난 파일은 저장된 결과를 쓰고 건너뛴다.
+
+[디렉토리] BATCH_JOURNAL_DIR/<작업 ID>/
+- journal.jsonl: 파일별 상태 줄
+  {'path', 'status', 'size', 'mtime_ns', 'hash', 'offset', 'length'} (실패 시 'error')
+- results.jsonl: 결과 줄 {'result', 'detected', 'text'} - 상태 줄의 offset / length 위치
+작업 ID 는 모델 이름 + 정렬된 파일 경로 목록의 해시이다.
+
+[이어서 분석]
+journal.jsonl 을 한 번 읽어 파일별 마지막 상태를 만든다 (O(파일 수)).
+완료 파일은 크기 / 수정 시각이 기록과 같으면 바로, 크기만 같으면 내용 해시가 같을 때만
+건너뛴다. 실패한 파일은 다시 분석한다. 기록 도중 종료되어 잘린 마지막 줄은 무시한다.
+LLM 서버 오류 / 타임아웃으로 규칙 기반 결과를 쓴 파일도 실패로 기록해 이어서 분석할 때 다시 분석한다.
+같은 기록 형식(FileResultStore)을 증분 재검사 색인(core.scan_index)도 사용한다.
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from utils.constants import BATCH_JOURNAL_DIR
+from utils.logger import logger
+
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+# 내용 해시 계산 시 한 번에 읽을 크기
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_hash(file_path: str) -> str:
+    """파일 내용 해시 (sha256)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_stat(file_path: str) -> Tuple[int, int]:
+    """(크기, 수정 시각 ns)"""
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def file_fingerprint(file_path: str) -> Tuple[int, int, str]:
+    """(크기, 수정 시각 ns, 내용 해시) - 해시 계산 전 stat 이므로 그 사이 변경은 다음 확인 때 발견"""
+    size, mtime_ns = file_stat(file_path)
+    return size, mtime_ns, file_hash(file_path)
+
+
+class FileResultStore:
+    """파일별 상태 / 지문 / 결과 위치의 추가 전용 기록 (journal.jsonl + results.jsonl)"""
+
+    JOURNAL_FILE = 'journal.jsonl'
+    RESULTS_FILE = 'results.jsonl'
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: 기록 디렉토리
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._lines = 0
+        self._torn = False
+
+    # ------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------
+    def _load(self) -> Dict[str, Dict]:
+        """상태 줄을 읽어 파일별 마지막 상태 구성 (최초 1회, 잠금 보유 상태에서 호출)"""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        self._lines = 0
+        journal = self.path / self.JOURNAL_FILE
+        if not journal.exists():
+            return self._entries
+        line = ''
+        with open(journal, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 기록 도중 종료되어 잘린 줄
+                    continue
+                self._entries[entry['path']] = entry
+                self._lines += 1
+        # 잘린 마지막 줄 뒤에 이어 쓰지 않도록 다음 기록 전에 줄바꿈 추가
+        self._torn = bool(line) and not line.endswith('\n')
+        return self._entries
+
+    def completed_count(self) -> int:
+        """완료 기록이 있는 파일 수 (파일 변경 여부는 확인하지 않음)"""
+        with self._lock:
+            return sum(1 for e in self._load().values() if e['status'] == STATUS_DONE)
+
+    def finished_entry(self, file_path: str) -> Optional[Dict]:
+        """
+        건너뛸 수 있는 완료 기록 (없거나 파일이 바뀌었으면 None)
+
+        크기가 다르면 해시 없이 변경, 크기 / 수정 시각이 같으면 해시 없이 동일로 보고,
+        크기만 같고 수정 시각이 다를 때만 내용 해시를 비교한다.
+        """
+        with self._lock:
+            entry = self._load().get(os.path.abspath(file_path))
+        if entry is None or entry['status'] != STATUS_DONE:
+            return None
+        try:
+            size, mtime_ns = file_stat(file_path)
+            if size != entry['size']:
+                return None
+            if mtime_ns == entry['mtime_ns']:
+                return entry
+            if file_hash(file_path) != entry['hash']:
+                return None
+        except OSError:
+            return None
+
+        # 내용은 같고 수정 시각만 바뀐 파일 - 다음 확인 때 다시 해시하지 않도록 수정 시각 갱신
+        entry = dict(entry, mtime_ns=mtime_ns)
+        try:
+            with self._lock:
+                self._append(entry)
+        except OSError as e:
+            logger.warning(f"기록 갱신 실패 {file_path}: {str(e)}")
+        return entry
+
+    def load_result(self, entry: Dict) -> Tuple[Dict, List[Dict], str]:
+        """
+        완료 기록의 결과 읽기
+
+        Returns:
+            (분석 결과, 탐지 항목, 문서 텍스트)
+
+        Raises:
+            Exception: 결과 파일이 없거나 손상됨
+        """
+        try:
+            with open(self.path / self.RESULTS_FILE, 'rb') as f:
+                f.seek(entry['offset'])
+                stored = json.loads(f.read(entry['length']).decode('utf-8'))
+            return stored['result'], stored['detected'], stored['text']
+        except (OSError, ValueError, KeyError) as e:
+            raise Exception(f"작업 기록 결과를 읽을 수 없습니다: {str(e)}")
+
+    # ------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------
+    def _append(self, entry: Dict, payload: Optional[Dict] = None):
+        """결과 줄(있으면) → 상태 줄 순서로 추가 (잠금 보유 상태에서 호출)"""
+        entries = self._load()
+        self.path.mkdir(parents=True, exist_ok=True)
+        if payload is not None:
+            data = (json.dumps(payload, ensure_ascii=False) + '\n').encode('utf-8')
+            with open(self.path / self.RESULTS_FILE, 'ab') as f:
+                entry['offset'] = f.tell()
+                entry['length'] = len(data)
+                f.write(data)
+        # 상태 줄은 결과가 모두 기록된 뒤에 남김 (중간에 종료되면 미완료로 남음)
+        with open(self.path / self.JOURNAL_FILE, 'a', encoding='utf-8') as f:
+            if self._torn:
+                f.write('\n')
+                self._torn = False
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        entries[entry['path']] = entry
+        self._lines += 1
+
+    def record_done(self, file_path: str, fingerprint: Tuple[int, int, str], result: Dict,
+                    detected: List[Dict], text: str):
+        """
+        완료 기록
+
+        Args:
+            file_path: 파일 경로
+            fingerprint: 분석한 파일의 (크기, 수정 시각 ns, 내용 해시) - file_fingerprint
+            result, detected, text: 분석 결과 / 탐지 항목 / 문서 텍스트
+        """
+        try:
+            size, mtime_ns, content_hash = fingerprint
+            with self._lock:
+                self._append(
+                    {'path': os.path.abspath(file_path), 'status': STATUS_DONE,
+                     'size': size, 'mtime_ns': mtime_ns, 'hash': content_hash},
+                    {'result': result, 'detected': detected, 'text': text}
+                )
+        except Exception as e:
+            logger.warning(f"작업 기록 실패 {file_path}: {str(e)}")
+
+    def record_failed(self, file_path: str, error: str):
+        """실패 기록 (이어서 분석할 때 다시 분석)"""
+        try:
+            with self._lock:
+                self._append({'path': os.path.abspath(file_path), 'status': STATUS_FAILED,
+                              'error': error})
+        except Exception as e:
+            logger.warning(f"작업 기록 실패 {file_path}: {str(e)}")
+
+    def remove(self):
+        """기록 삭제"""
+        with self._lock:
+            shutil.rmtree(self.path, ignore_errors=True)
+            self._entries = None
+
+
+class BatchJournal(FileResultStore):
+    """일괄 분석 작업 1건의 추가 전용 기록 (전체 완료 시 삭제)"""
+
+    def __init__(self, file_paths: Sequence[str], model_name: str,
+                 journal_dir: str = BATCH_JOURNAL_DIR):
+        """
+        Args:
+            file_paths: 일괄 분석 파일 목록
+            model_name: 분석 모델 (모델이 다르면 다른 작업)
+            journal_dir: 작업 기록 디렉토리
+        """
+        self.job_id = self.make_job_id(model_name, file_paths)
+        super().__init__(Path(journal_dir) / self.job_id)
+
+    @staticmethod
+    def make_job_id(model_name: str, file_paths: Sequence[str]) -> str:
+        """작업 ID 생성 (파일 순서와 무관)"""
+        digest = hashlib.sha256(model_name.encode('utf-8'))
+        for file_path in sorted(os.path.abspath(p) for p in file_paths):
+            digest.update(b'\0')
+            digest.update(file_path.encode('utf-8'))
+        return digest.hexdigest()[:32]
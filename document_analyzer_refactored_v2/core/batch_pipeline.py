@@ -0,0 +1,458 @@
+"""
+일괄 분석 단계별 병렬 파이프라인
+
+파일마다 추출 → 탐지 → LLM 을 차례로 처리하지 않고 단계마다 작업자를 두어,
+CPU(텍스트 추출 / 규칙 기반 탐지)와 Ollama 서버(LLM 분석)를 동시에 사용한다.
+
+[단계]
+1. 텍스트 추출 + 파일 지문: 작업 프로세스 풀 (PyPDF2 / pyhwp 추출은 CPU 작업이므로 GIL 을 피함)
+2. 규칙 기반 탐지 + 위험도 분석: 작업 프로세스 풀
+   (대용량 문서는 현재 프로세스에서 ParallelDetector 로 페이지 단위 병렬 탐지)
+3. LLM 분석: LLMDispatcher (동시 요청 수 제한, 디스패처가 없으면 건너뛰고 규칙 기반 결과 사용)
+4. 결과 통합(finish_analysis): run() 을 호출한 스레드에서 LLM 이 끝난 순서대로
+
+[대용량 TXT 스트리밍]
+stream_min_size 를 넘는 TXT 는 1단계에서 청크 단위로 읽으며 탐지까지 끝낸다 (detect_stream).
+텍스트를 메모리에 올리지 않으므로 MAX_FILE_SIZE 제한이 없고, 결과의 텍스트는 비어 있으며 LLM 분석은 건너뛴다.
+
+[역압(back-pressure)]
+추출 → 탐지 대기열은 queue_size 개, LLM 단계는 동시 요청 수 + BATCH_PREFETCH 개까지만
+받는다. 뒤 단계가 밀리면 앞 단계가 멈추므로 추출한 텍스트가 메모리에 쌓이지 않는다.
+
+[취소]
+cancel() 후에는 어느 단계도 새 파일을 시작하지 않고 대기열에 남은 파일은 버린다.
+이미 작업 프로세스 / Ollama 서버로 넘어간 작업은 기다리지 않는다.
+작업 프로세스 수가 1 이하이면 프로세스 풀 없이 단계 스레드에서 직접 처리한다.
+"""
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from core.batch_journal import file_fingerprint
+from core.detection_result import DetectionResult
+from core.llm_dispatcher import LLMDispatcher
+from core.parallel_detector import default_workers, detector_configs, _get_worker_analyzer
+from core.progress import STAGE_EXTRACT, STAGE_REGEX, STAGE_KEYWORDS, STAGE_LLM, STAGE_SCORE
+from utils.constants import (
+    BATCH_EXTRACT_WORKERS, BATCH_DETECT_WORKERS, BATCH_QUEUE_SIZE, BATCH_PREFETCH,
+    STREAM_TEXT_MIN_SIZE
+)
+from utils.logger import logger
+
+# 대기 중 취소 여부를 확인하는 간격 (초)
+_POLL_INTERVAL = 0.1
+
+# 단계 종료 표시
+_DONE = object()
+
+
+class BatchItem:
+    """파이프라인을 지나는 파일 1건"""
+
+    def __init__(self, index: int, file_path: str):
+        self.index = index  # 입력 순서 (0 부터)
+        self.file_path = file_path
+        self.text = ''
+        self.boundaries: List[int] = []
+        self.fingerprint: Optional[Tuple[int, int, str]] = None  # (크기, 수정 시각 ns, 내용 해시)
+        self.detection: Optional[DetectionResult] = None
+        self.analysis: Optional[Dict] = None
+        self.future: Optional[Future] = None
+        self.result: Optional[Dict] = None
+        self.detected: List[Dict] = []
+        self.error: Optional[Exception] = None
+        self.streamed = False  # 스트리밍 탐지 여부 (텍스트 없음, LLM 분석 안 함)
+        self.llm_fallback = False  # LLM 분석 대상이었지만 실패해 규칙 기반 결과를 사용했는지
+
+
+# ============================================================
+# 작업 프로세스
+# ============================================================
+_worker_processor = None
+
+
+def _extract_file(file_path: str):
+    """
+    텍스트 추출 (작업 프로세스에서 실행)
+
+    Returns:
+        (텍스트, 페이지/섹션 시작 위치 목록, 파일 지문)
+    """
+    global _worker_processor
+    if _worker_processor is None:
+        from core.document_processor import DocumentProcessor
+        _worker_processor = DocumentProcessor()
+    text, boundaries = _worker_processor.extract_text_with_boundaries(file_path)
+    return text, boundaries, file_fingerprint(file_path)
+
+
+def _stream_file(configs: str, file_path: str):
+    """
+    대용량 TXT 스트리밍 탐지 (작업 프로세스에서 실행)
+
+    Returns:
+        (정규식 탐지 결과, 키워드 탐지 결과, 규칙 기반 분석 결과, 파일 지문)
+    """
+    return _stream_with(_get_worker_analyzer(configs), file_path)
+
+
+def _stream_with(analyzer, file_path: str):
+    """청크 단위로 읽으며 탐지 (_stream_file 참고)"""
+    global _worker_processor
+    if _worker_processor is None:
+        from core.document_processor import DocumentProcessor
+        _worker_processor = DocumentProcessor()
+    fingerprint = file_fingerprint(file_path)
+    detection, analysis = analyzer.prepare_stream_analysis(
+        _worker_processor.iter_text_chunks(file_path)
+    )
+    return detection.regex_detected, detection.keyword_detected, analysis, fingerprint
+
+
+def _detect_text(configs: str, text: str, boundaries: List[int]):
+    """
+    규칙 기반 탐지 + 위험도 분석 (작업 프로세스에서 실행)
+
+    Returns:
+        (정규식 탐지 결과, 키워드 탐지 결과, 규칙 기반 분석 결과)
+        - 텍스트는 호출한 프로세스에 이미 있으므로 돌려보내지 않음
+    """
+    detection, analysis = _get_worker_analyzer(configs).prepare_analysis(text, boundaries)
+    return detection.regex_detected, detection.keyword_detected, analysis
+
+
+# ============================================================
+# 프로세스 풀 (단계별, 프로세스 전역 공유)
+# ============================================================
+_pools: Dict[str, ProcessPoolExecutor] = {}
+_pool_workers: Dict[str, int] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(stage: str, workers: int) -> ProcessPoolExecutor:
+    """단계별 작업 프로세스 풀 반환 (프로세스 수가 바뀌면 재생성)"""
+    with _pools_lock:
+        pool = _pools.get(stage)
+        if pool is None or _pool_workers[stage] != workers:
+            if pool is not None:
+                pool.shutdown(wait=False)
+            # Qt 스레드에서 fork 하지 않도록 모든 플랫폼에서 spawn 사용
+            pool = _pools[stage] = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            _pool_workers[stage] = workers
+            logger.info(f"일괄 분석 {stage} 프로세스 풀 생성: {workers}개")
+        return pool
+
+
+def shutdown_pools(wait: bool = True):
+    """모든 단계의 작업 프로세스 풀 종료"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=wait)
+        _pools.clear()
+        _pool_workers.clear()
+
+
+def _discard_pool(stage: str):
+    """오류가 난 풀 폐기 (다음 호출 시 재생성)"""
+    with _pools_lock:
+        pool = _pools.pop(stage, None)
+        _pool_workers.pop(stage, None)
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+# ============================================================
+# 파이프라인
+# ============================================================
+class BatchPipeline:
+    """추출 / 탐지 프로세스 풀 + LLM 디스패처 일괄 분석 파이프라인"""
+
+    def __init__(self, analyzer, dispatcher: Optional[LLMDispatcher],
+                 extract_workers: int = BATCH_EXTRACT_WORKERS,
+                 detect_workers: int = BATCH_DETECT_WORKERS,
+                 queue_size: int = BATCH_QUEUE_SIZE,
+                 on_stage: Optional[Callable[[int, str], None]] = None,
+                 stream_min_size: Optional[int] = STREAM_TEXT_MIN_SIZE):
+        """
+        Args:
+            analyzer: LocalLLMAnalyzer (LLM 분석 / 결과 통합, 대용량 문서 탐지)
+            dispatcher: LLM 요청 디스패처 (종료는 호출한 쪽에서, None 이면 LLM 분석 안 함)
+            extract_workers: 텍스트 추출 프로세스 수 (0 이면 CPU 코어 수의 절반)
+            detect_workers: 규칙 기반 탐지 프로세스 수 (0 이면 남은 CPU 코어 수)
+            queue_size: 추출 → 탐지 대기열 크기
+            on_stage: 단계 완료 콜백 (파일 순서, core.progress 단계 이름) - 여러 스레드에서 호출
+            stream_min_size: 이 크기(바이트)를 넘는 TXT 는 스트리밍 탐지 (None 이면 사용 안 함)
+        """
+        cores = default_workers()
+        self.analyzer = analyzer
+        self.dispatcher = dispatcher
+        self.extract_workers = extract_workers or max(1, cores // 2)
+        self.detect_workers = detect_workers or max(1, cores - self.extract_workers)
+        self.queue_size = max(1, queue_size)
+        self.on_stage = on_stage
+        self.stream_min_size = stream_min_size
+        self._cancelled = threading.Event()
+        self._configs = detector_configs(analyzer)
+
+    def cancel(self):
+        """취소 (새 파일 처리 중단, 대기열에 남은 파일은 run() 종료 시 버림)"""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def run(self, file_paths: Sequence[str]) -> Iterator[BatchItem]:
+        """
+        일괄 분석 실행
+
+        Args:
+            file_paths: 파일 경로 목록
+
+        Yields:
+            결과 통합까지 끝난 BatchItem (LLM 이 끝난 순서, 실패 시 error 설정)
+        """
+        total = len(file_paths)
+        if total == 0:
+            return
+        extract_workers = min(self.extract_workers, total)
+        detect_workers = min(self.detect_workers, total)
+        logger.info(
+            f"일괄 분석 파이프라인 시작: {total}개 파일, 추출 {extract_workers}개 / "
+            f"탐지 {detect_workers}개 프로세스, "
+            + (f"LLM 동시 요청 {self.dispatcher.concurrency}개" if self.dispatcher else "LLM 사용 안 함")
+        )
+
+        sources: queue.Queue = queue.Queue()
+        for index, file_path in enumerate(file_paths):
+            sources.put(BatchItem(index, file_path))
+        sources.put(_DONE)
+        extracted: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        results: queue.Queue = queue.Queue()
+        # LLM 단계에 맡길 수 있는 파일 수 (진행 중 요청 + 미리 탐지해 둘 파일)
+        # (LLM 을 쓰지 않으면 결과 통합을 기다리는 파일 수)
+        llm_slots = threading.Semaphore(
+            (self.dispatcher.concurrency if self.dispatcher else 0) + BATCH_PREFETCH
+        )
+
+        workers = self._start_stage(
+            'extract', extract_workers, sources, extracted,
+            lambda item: self._extract(item, extract_workers)
+        ) + self._start_stage(
+            'detect', detect_workers, extracted, None,
+            lambda item: self._detect(item, detect_workers, llm_slots, results)
+        )
+
+        finished = 0
+        try:
+            while finished < total:
+                item = self._get(results)
+                if item is _DONE:
+                    break
+                if item.error is None:
+                    llm_slots.release()
+                self._finish(item)
+                finished += 1
+                yield item
+        finally:
+            if finished < total:
+                # 취소 또는 호출한 쪽에서 중단 - 단계 스레드를 멈추고 남은 파일 버림
+                self._cancelled.set()
+                dropped = sum(self._drain(q) for q in (sources, extracted, results))
+                logger.info(f"일괄 분석 파이프라인 취소: {finished}/{total}개 완료, 대기 파일 {dropped}개 버림")
+            else:
+                for worker in workers:
+                    worker.join()
+
+    # ------------------------------------------------------------
+    # 단계 스레드
+    # ------------------------------------------------------------
+    def _start_stage(self, name: str, count: int, source: queue.Queue,
+                     sink: Optional[queue.Queue], process: Callable) -> List[threading.Thread]:
+        """
+        단계 스레드 시작 (source 에서 파일을 꺼내 처리 후 sink 로 전달)
+
+        마지막으로 끝난 스레드가 sink 에 종료 표시를 넣는다.
+        """
+        remaining = [count]
+        lock = threading.Lock()
+
+        def work():
+            while True:
+                item = self._get(source)
+                if item is _DONE:
+                    # 같은 단계의 다른 스레드도 종료하도록 되돌려 놓음
+                    self._put(source, _DONE)
+                    break
+                process(item)
+                if sink is not None and not self._put(sink, item):
+                    break
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last and sink is not None:
+                self._put(sink, _DONE)
+
+        threads = [
+            threading.Thread(target=work, name=f'batch-{name}-{i}', daemon=True)
+            for i in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _extract(self, item: BatchItem, workers: int):
+        """1단계: 텍스트 추출 (대용량 TXT 는 스트리밍 탐지까지)"""
+        try:
+            if self._should_stream(item.file_path):
+                self._stream(item, workers)
+            else:
+                item.text, item.boundaries, item.fingerprint = self._run_in_pool(
+                    STAGE_EXTRACT, workers, _extract_file, item.file_path
+                )
+        except Exception as e:
+            logger.error(f"파일 처리 실패 {item.file_path}: {str(e)}")
+            item.error = e
+        self._emit_stage(item, STAGE_EXTRACT)
+
+    def _should_stream(self, file_path: str) -> bool:
+        """스트리밍 탐지 대상 여부 (stream_min_size 를 넘는 TXT)"""
+        if self.stream_min_size is None or not file_path.lower().endswith('.txt'):
+            return False
+        try:
+            return os.path.getsize(file_path) > self.stream_min_size
+        except OSError:
+            return False
+
+    def _stream(self, item: BatchItem, workers: int):
+        """대용량 TXT 스트리밍 탐지 (프로세스 수 1 이하이면 파이프라인 분석기로 처리)"""
+        if workers <= 1:
+            result = _stream_with(self.analyzer, item.file_path)
+        else:
+            result = self._run_in_pool(STAGE_EXTRACT, workers, _stream_file, self._configs, item.file_path)
+        regex_detected, keyword_detected, item.analysis, item.fingerprint = result
+        item.detection = DetectionResult(None, regex_detected, keyword_detected)
+        item.streamed = True
+        logger.info(f"대용량 TXT 스트리밍 탐지 (LLM 분석 생략): {item.file_path}")
+
+    def _detect(self, item: BatchItem, workers: int,
+                llm_slots: threading.Semaphore, results: queue.Queue):
+        """2~3단계: 규칙 기반 탐지 후 LLM 분석 예약 (실패한 파일은 바로 결과로)"""
+        if item.error is None and not item.streamed:
+            try:
+                if workers <= 1 or self.analyzer.should_parallelize(item.text):
+                    item.detection, item.analysis = self.analyzer.prepare_analysis(
+                        item.text, item.boundaries
+                    )
+                else:
+                    regex_detected, keyword_detected, item.analysis = self._run_in_pool(
+                        'detect', workers, _detect_text, self._configs, item.text, item.boundaries
+                    )
+                    item.detection = DetectionResult(item.text, regex_detected, keyword_detected)
+            except Exception as e:
+                logger.error(f"파일 처리 실패 {item.file_path}: {str(e)}")
+                item.error = e
+        self._emit_stage(item, STAGE_REGEX)
+        self._emit_stage(item, STAGE_KEYWORDS)
+
+        if item.error is not None:
+            results.put(item)
+            return
+        while not llm_slots.acquire(timeout=_POLL_INTERVAL):
+            if self.cancelled:
+                return
+        if self.cancelled:
+            llm_slots.release()
+            return
+        if self.dispatcher is None or item.streamed:
+            self._emit_stage(item, STAGE_LLM)
+            results.put(item)
+            return
+
+        def done(_: Future):
+            self._emit_stage(item, STAGE_LLM)
+            results.put(item)
+
+        try:
+            item.future = self.dispatcher.submit(
+                self.analyzer.run_llm_analysis, item.text, item.detection
+            )
+        except RuntimeError as e:
+            # 디스패처가 이미 종료됨 (취소 중)
+            llm_slots.release()
+            item.error = e
+            results.put(item)
+            return
+        item.future.add_done_callback(done)
+
+    def _finish(self, item: BatchItem):
+        """4단계: LLM 결과 수집 및 결과 통합 (run() 을 호출한 스레드에서 실행)"""
+        if item.error is not None:
+            return
+        try:
+            llm_analysis = item.future.result() if item.future is not None else None
+            item.result, item.detected = self.analyzer.finish_analysis(
+                item.text, item.detection, item.analysis, llm_analysis
+            )
+            item.llm_fallback = item.future is not None and not item.result['llm_used']
+            self._emit_stage(item, STAGE_SCORE)
+        except Exception as e:
+            logger.error(f"파일 처리 실패 {item.file_path}: {str(e)}")
+            item.error = e
+
+    # ------------------------------------------------------------
+    # 보조
+    # ------------------------------------------------------------
+    def _run_in_pool(self, stage: str, workers: int, func: Callable, *args):
+        """작업 프로세스 풀에서 실행 (프로세스 수 1 이하 / 풀 오류 시 현재 프로세스에서 실행)"""
+        if workers > 1:
+            try:
+                return _get_pool(stage, workers).submit(func, *args).result()
+            except BrokenProcessPool as e:
+                logger.warning(f"일괄 분석 {stage} 프로세스 풀 오류 - 현재 프로세스에서 처리: {str(e)}")
+                _discard_pool(stage)
+        return func(*args)
+
+    def _emit_stage(self, item: BatchItem, stage: str):
+        if self.on_stage and not self.cancelled:
+            self.on_stage(item.index, stage)
+
+    def _get(self, source: queue.Queue):
+        """대기열에서 꺼냄 (취소되면 _DONE)"""
+        while not self.cancelled:
+            try:
+                return source.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _put(self, sink: queue.Queue, item) -> bool:
+        """대기열에 넣음 (가득 차면 자리가 날 때까지 대기, 취소되면 False)"""
+        while not self.cancelled:
+            try:
+                sink.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _drain(source: queue.Queue) -> int:
+        """대기열 비우기 (LLM 요청이 예약된 파일은 요청 취소), 버린 파일 수 반환"""
+        dropped = 0
+        while True:
+            try:
+                item = source.get_nowait()
+            except queue.Empty:
+                return dropped
+            if isinstance(item, BatchItem):
+                if item.future is not None:
+                    item.future.cancel()
+                dropped += 1
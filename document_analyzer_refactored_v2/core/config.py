@@ -1,8 +1,13 @@
 """
 설정 관리 클래스
 """
+import os
 from pathlib import Path
 from PyQt5.QtCore import QSettings
+from utils.constants import (
+    OLLAMA_NUM_PARALLEL, LLM_TOKEN_BUDGET, LLM_VERIFY_MODE, LLM_FAST_MODEL, LLM_ACCURATE_MODEL,
+    OLLAMA_KEEP_ALIVE
+)
 
 
 class Config:
@@ -50,3 +55,93 @@ class Config:
     def set_custom_patterns(self, patterns: dict):
         """커스텀 패턴 저장"""
         self.settings.setValue('custom_patterns', patterns)
+    
+    def get_parallel_detection(self) -> bool:
+        """대용량 문서 병렬 탐지 사용 여부"""
+        return self.settings.value('parallel_detection', False, type=bool)
+    
+    def set_parallel_detection(self, enabled: bool):
+        """대용량 문서 병렬 탐지 사용 여부 저장"""
+        self.settings.setValue('parallel_detection', enabled)
+    
+    def get_detection_workers(self) -> int:
+        """병렬 탐지 프로세스 수 (0 = CPU 코어 수)"""
+        return self.settings.value('detection_workers', 0, type=int)
+    
+    def set_detection_workers(self, workers: int):
+        """병렬 탐지 프로세스 수 저장"""
+        self.settings.setValue('detection_workers', workers)
+    
+    def get_parallel_workers(self) -> int:
+        """분석기에 넘길 병렬 탐지 프로세스 수 (사용 안 함 = 0)"""
+        if not self.get_parallel_detection():
+            return 0
+        return self.get_detection_workers() or os.cpu_count() or 1
+    
+    def get_llm_concurrency(self) -> int:
+        """일괄 분석 동시 LLM 요청 수"""
+        return self.settings.value('llm_concurrency', OLLAMA_NUM_PARALLEL, type=int)
+    
+    def set_llm_concurrency(self, concurrency: int):
+        """일괄 분석 동시 LLM 요청 수 저장"""
+        self.settings.setValue('llm_concurrency', concurrency)
+    
+    def get_llm_token_budget(self) -> int:
+        """문서당 LLM 토큰 예산"""
+        return self.settings.value('llm_token_budget', LLM_TOKEN_BUDGET, type=int)
+    
+    def set_llm_token_budget(self, budget: int):
+        """문서당 LLM 토큰 예산 저장"""
+        self.settings.setValue('llm_token_budget', budget)
+    
+    def get_llm_cache_enabled(self) -> bool:
+        """LLM 분석 결과 캐시 사용 여부"""
+        return self.settings.value('llm_cache_enabled', True, type=bool)
+    
+    def set_llm_cache_enabled(self, enabled: bool):
+        """LLM 분석 결과 캐시 사용 여부 저장"""
+        self.settings.setValue('llm_cache_enabled', enabled)
+    
+    def get_incremental_scan(self) -> bool:
+        """일괄 분석 증분 재검사 사용 여부 (바뀌지 않은 파일은 이전 결과 사용)"""
+        return self.settings.value('incremental_scan', False, type=bool)
+    
+    def set_incremental_scan(self, enabled: bool):
+        """일괄 분석 증분 재검사 사용 여부 저장"""
+        self.settings.setValue('incremental_scan', enabled)
+    
+    def get_llm_verify_mode(self) -> bool:
+        """LLM 검증 모드 사용 여부 (규칙 기반 탐지 후보 주변만 전송)"""
+        return self.settings.value('llm_verify_mode', LLM_VERIFY_MODE, type=bool)
+    
+    def set_llm_verify_mode(self, enabled: bool):
+        """LLM 검증 모드 사용 여부 저장"""
+        self.settings.setValue('llm_verify_mode', enabled)
+    
+    def get_model_routing(self) -> bool:
+        """문서별 모델 라우팅 사용 여부 (빠른 모델 / 정확한 모델)"""
+        return self.settings.value('model_routing', False, type=bool)
+    
+    def set_model_routing(self, enabled: bool):
+        """문서별 모델 라우팅 사용 여부 저장"""
+        self.settings.setValue('model_routing', enabled)
+    
+    def get_router_models(self) -> tuple:
+        """모델 라우팅 대상 (빠른 모델, 정확한 모델)"""
+        return (
+            self.settings.value('router_fast_model', LLM_FAST_MODEL),
+            self.settings.value('router_accurate_model', LLM_ACCURATE_MODEL)
+        )
+    
+    def set_router_models(self, fast_model: str, accurate_model: str):
+        """모델 라우팅 대상 저장"""
+        self.settings.setValue('router_fast_model', fast_model)
+        self.settings.setValue('router_accurate_model', accurate_model)
+    
+    def get_ollama_keep_alive(self) -> str:
+        """모델 메모리 유지 시간 (Ollama keep_alive 형식, 예: 30m, 1h, -1)"""
+        return str(self.settings.value('ollama_keep_alive', OLLAMA_KEEP_ALIVE))
+    
+    def set_ollama_keep_alive(self, keep_alive: str):
+        """모델 메모리 유지 시간 저장"""
+        self.settings.setValue('ollama_keep_alive', keep_alive)
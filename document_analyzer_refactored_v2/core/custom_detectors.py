@@ -0,0 +1,115 @@
+"""
+사용자 정의 탐지기 (커스텀 패턴)
+
+설정 화면에서 등록한 패턴을 내장 패턴과 같은 다중 패턴 스캐너에 넣어
+한 번의 스캔으로 함께 탐지한다.
+
+[설정 저장 형식]
+{이름: 정규식}                         - 이전 버전 형식 (기본값 적용)
+{이름: {'pattern': 정규식, 'priority': 우선순위, 'legal_category': 법적 분류,
+        'weight': 가중치, 'ignore_case': 대소문자 무시}}
+"""
+import re
+from typing import Dict, Optional, Union
+
+from core.pattern_engine import pattern_registry
+from utils.constants import LEGAL_CATEGORY_DESCRIPTIONS
+
+
+# 노출금지 대상 법적 분류 (제34조의2)
+EXPOSURE_PROHIBITED_CATEGORIES = ("고유식별정보", "금융정보")
+
+
+class CustomDetector:
+    """사용자 정의 탐지기"""
+
+    def __init__(self, name: str, pattern: str, priority: Optional[int] = None,
+                 legal_category: str = "일반개인정보", weight: Optional[int] = None,
+                 ignore_case: bool = False):
+        """
+        Args:
+            name: 탐지 유형 이름 (내장 유형 이름이면 해당 패턴을 대체)
+            pattern: 정규식
+            priority: 우선순위 (0이 가장 높음, None 이면 내장 유형 뒤 / 내장 유형 자리)
+            legal_category: 법적 분류 (고유식별정보/민감정보/금융정보/일반개인정보)
+            weight: 위험도 가중치 (None 이면 법적 분류 기본 가중치)
+            ignore_case: 대소문자 무시 여부
+
+        Raises:
+            ValueError: 이름/법적 분류/가중치가 유효하지 않은 경우
+            re.error: 유효하지 않은 정규식
+        """
+        if not name or not pattern:
+            raise ValueError("이름과 패턴을 모두 입력하세요.")
+        if legal_category not in LEGAL_CATEGORY_DESCRIPTIONS:
+            raise ValueError(f"알 수 없는 법적 분류: {legal_category}")
+        if weight is not None and weight < 0:
+            raise ValueError("가중치는 0 이상이어야 합니다.")
+
+        self.name = name
+        self.pattern = pattern
+        self.priority = priority
+        self.legal_category = legal_category
+        self.weight = weight
+        self.ignore_case = ignore_case
+
+        # 등록 시점에 컴파일 (공유 캐시에 보관)
+        pattern_registry.compile(pattern, self.flags)
+
+    @property
+    def flags(self) -> int:
+        """정규식 플래그"""
+        return re.IGNORECASE if self.ignore_case else 0
+
+    @property
+    def exposure_prohibited(self) -> bool:
+        """노출금지 정보 여부 (제34조의2)"""
+        return self.legal_category in EXPOSURE_PROHIBITED_CATEGORIES
+
+    def to_config(self) -> Dict:
+        """설정 저장용 딕셔너리"""
+        return {
+            'pattern': self.pattern,
+            'priority': self.priority,
+            'legal_category': self.legal_category,
+            'weight': self.weight,
+            'ignore_case': self.ignore_case
+        }
+
+    @classmethod
+    def from_config(cls, name: str, value: Union[str, Dict]) -> 'CustomDetector':
+        """
+        설정 값으로부터 생성
+
+        Raises:
+            ValueError, re.error: 유효하지 않은 설정
+        """
+        if isinstance(value, str):
+            return cls(name, value)
+
+        def optional_int(key):
+            item = value.get(key)
+            return None if item in (None, '') else int(item)
+
+        # QSettings 는 bool/int 를 문자열로 돌려줄 수 있음
+        ignore_case = value.get('ignore_case', False)
+        if isinstance(ignore_case, str):
+            ignore_case = ignore_case.lower() == 'true'
+
+        return cls(
+            name,
+            value.get('pattern', ''),
+            priority=optional_int('priority'),
+            legal_category=value.get('legal_category') or "일반개인정보",
+            weight=optional_int('weight'),
+            ignore_case=bool(ignore_case)
+        )
+
+    def describe(self) -> str:
+        """목록 표시용 설명"""
+        parts = [self.legal_category]
+        if self.priority is not None:
+            parts.append(f"우선순위 {self.priority}")
+        if self.weight is not None:
+            parts.append(f"가중치 {self.weight}")
+        return f"{self.name}: {self.pattern} ({', '.join(parts)})"
@@ -0,0 +1,59 @@
+"""
+문서 탐지 결과
+
+정규식 탐지와 민감정보 키워드 탐지는 문서당 한 번만 실행하고,
+그 결과를 위험도 산정 / LLM 실패 시 대체 분석 / 권고사항 생성 단계가 함께 사용한다.
+"""
+from typing import Dict, List, Optional
+
+from core.interval_index import IntervalIndex
+
+
+class DetectionResult:
+    """문서 1건의 규칙 기반 탐지 결과"""
+
+    def __init__(self, text: str, regex_detected: List[Dict], keyword_detected: List[Dict]):
+        """
+        Args:
+            text: 분석 대상 텍스트
+            regex_detected: 정규식 탐지 결과 (시작 위치 순)
+            keyword_detected: 민감정보 키워드 탐지 결과
+        """
+        self.text = text
+        self.regex_detected = regex_detected
+        self.keyword_detected = keyword_detected
+        self._regex_ranges: Optional[IntervalIndex] = None
+
+    @property
+    def regex_ranges(self) -> IntervalIndex:
+        """정규식 탐지 범위 인덱스 (최초 접근 시 생성)"""
+        if self._regex_ranges is None:
+            self._regex_ranges = IntervalIndex(
+                (d['start'], d['end']) for d in self.regex_detected
+            )
+        return self._regex_ranges
+
+    def merged(self) -> List[Dict]:
+        """
+        위험도 산정용 통합 목록
+        - 정규식 결과 + 정규식/앞선 키워드 결과와 겹치지 않는 키워드 결과
+        """
+        all_detected = self.regex_detected.copy()
+        existing_ranges = IntervalIndex((d['start'], d['end']) for d in self.regex_detected)
+
+        for kw in self.keyword_detected:
+            if not existing_ranges.overlaps(kw['start'], kw['end']):
+                all_detected.append(kw)
+                existing_ranges.add(kw['start'], kw['end'])
+        return all_detected
+
+    def combined(self) -> List[Dict]:
+        """
+        탐지 항목 목록
+        - 정규식 결과 + 정규식 결과와 겹치지 않는 키워드 결과
+        """
+        regex_ranges = self.regex_ranges
+        return self.regex_detected + [
+            kw for kw in self.keyword_detected
+            if not regex_ranges.overlaps(kw['start'], kw['end'])
+        ]
@@ -1,12 +1,11 @@
 """
 문서 텍스트 추출 모듈
 """
+import codecs
 import os
 import zipfile
 from pathlib import Path
-from typing import Dict, Callable
-import PyPDF2
-import docx
+from typing import Dict, Callable, Iterator, List, Tuple
 from utils.constants import MAX_FILE_SIZE, SUPPORTED_EXTENSIONS
 from utils.logger import logger
 
@@ -22,6 +21,11 @@ class DocumentProcessor:
             '.hwp': self._extract_from_hwp,
             '.hwpx': self._extract_from_hwpx,
         }
+        # 페이지/섹션 단위 추출기 (병렬 탐지 구간 경계용)
+        self.page_extractors: Dict[str, Tuple[Callable, str]] = {
+            '.pdf': (self._extract_pdf_pages, "\n"),
+            '.hwpx': (self._extract_hwpx_sections, '\n\n'),
+        }
     
     def check_file_size(self, file_path: str) -> bool:
         """파일 크기 확인"""
@@ -41,6 +45,42 @@ class DocumentProcessor:
         Raises:
             Exception: 파일 처리 중 오류 발생
         """
+        return self._get_extractor(file_path)(file_path)
+    
+    def extract_text_with_boundaries(self, file_path: str) -> Tuple[str, List[int]]:
+        """
+        파일에서 텍스트와 페이지/섹션 시작 위치 추출 (병렬 탐지용)
+        
+        텍스트는 extract_text 와 동일하다. PDF 는 페이지, HWPX 는 섹션 시작 위치를
+        반환하고, 그 외 형식은 빈 목록을 반환한다.
+        
+        Returns:
+            (텍스트, 페이지/섹션 시작 위치 목록)
+            
+        Raises:
+            Exception: 파일 처리 중 오류 발생
+        """
+        extractor = self._get_extractor(file_path)
+        page_extractor = self.page_extractors.get(Path(file_path).suffix.lower())
+        if not page_extractor:
+            return extractor(file_path), []
+        
+        extract_pages, separator = page_extractor
+        pages = extract_pages(file_path)
+        boundaries = []
+        position = 0
+        for page in pages:
+            boundaries.append(position)
+            position += len(page) + len(separator)
+        return separator.join(pages), boundaries
+    
+    def _get_extractor(self, file_path: str) -> Callable:
+        """
+        파일 확인 후 형식별 추출기 반환
+        
+        Raises:
+            Exception: 파일이 없거나 크거나 지원하지 않는 형식
+        """
         if not os.path.exists(file_path):
             raise Exception("파일을 찾을 수 없습니다.")
         
@@ -56,11 +96,67 @@ class DocumentProcessor:
         if not extractor:
             raise Exception(f"추출기를 찾을 수 없습니다: {ext}")
         
-        return extractor(file_path)
+        return extractor
+    
+    def iter_text_chunks(self, file_path: str, chunk_size: int = 1024 * 1024) -> Iterator[str]:
+        """
+        파일 텍스트를 청크 단위로 반환 (스트리밍 탐지용)
+        
+        TXT 파일은 전체를 메모리에 올리지 않고 읽으므로 MAX_FILE_SIZE 제한을 두지 않는다.
+        그 외 형식은 extract_text 결과를 한 번에 반환한다.
+        
+        Args:
+            file_path: 파일 경로
+            chunk_size: 청크 크기 (글자 수)
+            
+        Raises:
+            Exception: 파일 처리 중 오류 발생
+        """
+        if Path(file_path).suffix.lower() != '.txt':
+            yield self.extract_text(file_path)
+            return
+        
+        if not os.path.exists(file_path):
+            raise Exception("파일을 찾을 수 없습니다.")
+        
+        encoding = self._detect_txt_encoding(file_path, chunk_size)
+        with open(file_path, 'r', encoding=encoding) as file:
+            while True:
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    
+    def _detect_txt_encoding(self, file_path: str, block_size: int) -> str:
+        """TXT 인코딩 확인 (파일 전체를 블록 단위로 디코딩해 봄)"""
+        encodings = ['utf-8', 'cp949', 'euc-kr', 'latin-1']
+        
+        for encoding in encodings:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            try:
+                with open(file_path, 'rb') as file:
+                    while True:
+                        block = file.read(block_size)
+                        if not block:
+                            decoder.decode(b'', final=True)
+                            break
+                        decoder.decode(block)
+                return encoding
+            except (UnicodeDecodeError, LookupError):
+                continue
+        
+        raise Exception("TXT 파일 인코딩을 인식할 수 없습니다.")
     
     def _extract_from_pdf(self, file_path: str) -> str:
         """PDF 텍스트 추출"""
+        return "\n".join(self._extract_pdf_pages(file_path))
+    
+    def _extract_pdf_pages(self, file_path: str) -> List[str]:
+        """PDF 페이지별 텍스트 추출 (텍스트가 없는 페이지 제외)"""
         try:
+            # 처음 사용할 때 import (추출하지 않는 프로세스의 시작 시간 / 메모리 절약)
+            import PyPDF2
+            
             text = []
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
@@ -75,16 +171,17 @@ class DocumentProcessor:
                     except:
                         continue
             
-            result = "\n".join(text)
-            if not result.strip():
+            if not any(page.strip() for page in text):
                 raise Exception("PDF에서 텍스트를 추출할 수 없습니다.")
-            return result
+            return text
         except Exception as e:
             raise Exception(f"PDF 처리 오류: {str(e)}")
     
     def _extract_from_docx(self, file_path: str) -> str:
         """DOCX 텍스트 추출"""
         try:
+            import docx
+            
             doc = docx.Document(file_path)
             paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
             
@@ -254,6 +351,10 @@ class DocumentProcessor:
     
     def _extract_from_hwpx(self, file_path: str) -> str:
         """HWPX 텍스트 추출"""
+        return '\n\n'.join(self._extract_hwpx_sections(file_path))
+    
+    def _extract_hwpx_sections(self, file_path: str) -> List[str]:
+        """HWPX 섹션별 텍스트 추출"""
         try:
             import xml.etree.ElementTree as ET
             text_parts = []
@@ -273,6 +374,6 @@ class DocumentProcessor:
                     except:
                         continue
             
-            return '\n\n'.join(text_parts)
+            return text_parts
         except Exception as e:
             raise Exception(f"HWPX 처리 오류: {str(e)}")
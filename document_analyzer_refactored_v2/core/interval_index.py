@@ -0,0 +1,170 @@
+"""
+탐지 범위 중복 검사용 구간 인덱스
+
+- IntervalIndex: 겹치지 않는 탐지 범위 집합 (중복 검사)
+- MatchSpanIndex: 정규식 매치 위치 집합 (구간 내 매치 존재 질의)
+- merge_spans: 겹치는 범위 합치기 (서로 겹칠 수 있는 범위로 IntervalIndex 를 만들 때)
+
+IntervalIndex 는 서로 겹치지 않는 [start, end) 구간을 시작 위치 순으로 정렬해 보관한다.
+구간끼리 겹치지 않으므로 끝 위치도 같은 순서로 정렬되며,
+새 범위와 겹칠 수 있는 구간은 "시작 < 새 범위 끝" 중 마지막 하나뿐이다.
+→ 중복 검사 O(log n) (기존 전체 목록 순회는 O(n))
+
+구간은 일정 크기의 버킷으로 나누어 저장하므로 정렬 순서와 무관한
+삽입도 버킷 크기만큼의 이동 비용으로 끝난다.
+"""
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+def merge_spans(spans: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """겹치는 [start, end) 범위를 합쳐 시작 위치 순으로 반환 (빈 범위는 제외)"""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(span for span in spans if span[1] > span[0]):
+        if merged and start < merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class IntervalIndex:
+    """겹치지 않는 구간 집합 (bisect 기반)"""
+
+    # 버킷 분할 기준 크기
+    BUCKET_SIZE = 512
+
+    def __init__(self, intervals: Iterable[Tuple] = ()):
+        """
+        Args:
+            intervals: (start, end) 또는 (start, end, label) 목록
+        """
+        self._firsts = []   # 버킷별 첫 구간의 시작 위치
+        self._starts = []   # 버킷별 시작 위치 목록
+        self._ends = []     # 버킷별 끝 위치 목록
+        self._labels = []   # 버킷별 레이블 목록
+        self._count = 0
+        for interval in intervals:
+            self.add(*interval)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _last_before(self, position: int) -> Optional[Tuple[int, int]]:
+        """시작 위치가 position 미만인 마지막 구간의 (버킷, 인덱스)"""
+        b = bisect_left(self._firsts, position) - 1
+        if b < 0:
+            return None
+        return b, bisect_left(self._starts[b], position) - 1
+
+    def find_overlap(self, start: int, end: int) -> Optional[Tuple[int, int, Any]]:
+        """
+        겹치는 구간 반환
+
+        Returns:
+            (start, end, label) 또는 None
+        """
+        found = self._last_before(end)
+        if found:
+            b, i = found
+            if self._ends[b][i] > start:
+                return self._starts[b][i], self._ends[b][i], self._labels[b][i]
+        return None
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """겹치는 구간 존재 여부"""
+        found = self._last_before(end)
+        return bool(found) and self._ends[found[0]][found[1]] > start
+
+    def items(self) -> Iterator[Tuple[int, int, Any]]:
+        """모든 구간을 시작 위치 순으로 반환 ((start, end, label))"""
+        for starts, ends, labels in zip(self._starts, self._ends, self._labels):
+            yield from zip(starts, ends, labels)
+
+    def add(self, start: int, end: int, label: Any = None):
+        """
+        구간 추가 (빈 구간은 어떤 범위와도 겹치지 않으므로 저장하지 않음)
+
+        Raises:
+            ValueError: 기존 구간과 겹치는 경우
+        """
+        if end <= start:
+            return
+        if self.overlaps(start, end):
+            raise ValueError(f"겹치는 구간은 추가할 수 없습니다: ({start}, {end})")
+
+        if not self._firsts:
+            self._firsts.append(start)
+            self._starts.append([start])
+            self._ends.append([end])
+            self._labels.append([label])
+            self._count = 1
+            return
+
+        b = max(bisect_right(self._firsts, start) - 1, 0)
+        starts = self._starts[b]
+        i = bisect_left(starts, start)
+        starts.insert(i, start)
+        self._ends[b].insert(i, end)
+        self._labels[b].insert(i, label)
+        self._firsts[b] = starts[0]
+        self._count += 1
+
+        if len(starts) > self.BUCKET_SIZE * 2:
+            self._split(b)
+
+    def _split(self, b: int):
+        """큰 버킷을 둘로 분할"""
+        half = self.BUCKET_SIZE
+        for lists in (self._starts, self._ends, self._labels):
+            bucket = lists[b]
+            lists[b:b + 1] = [bucket[:half], bucket[half:]]
+        self._firsts.insert(b + 1, self._starts[b + 1][0])
+
+
+class MatchSpanIndex:
+    """
+    정규식 매치 위치 인덱스 (문서당 1회 계산)
+
+    "구간 [start, end) 안에 패턴 매치가 존재하는가" 질의를 구간마다
+    텍스트를 잘라 다시 검색하지 않고 bisect 로 처리한다.
+
+    전후방 탐색/앵커가 없는 패턴만 사용해야 한다 (부분 문자열의 매치 여부가
+    주변 문자와 무관해야 함). 이 경우 구간 안의 매치는 전체 텍스트 finditer
+    결과 중 하나이거나, 그 결과 중 구간 경계에 걸친 매치 안에서 시작하므로
+    경계에 걸친 매치만 있을 때에만 해당 구간을 직접 검색한다.
+    """
+
+    def __init__(self, regex, text: str, spans: Optional[Iterable[Tuple[int, int]]] = None):
+        """
+        Args:
+            regex: 컴파일된 정규식
+            text: 대상 텍스트
+            spans: 미리 구한 매치 위치 (시작 위치 순, 병렬 탐지 시) - None 이면 직접 검색
+        """
+        self._regex = regex
+        self._text = text
+        self._starts = []
+        self._ends = []
+        if spans is None:
+            spans = (match.span() for match in regex.finditer(text))
+        for start, end in spans:
+            if end > start:
+                self._starts.append(start)
+                self._ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def has_match_within(self, start: int, end: int) -> bool:
+        """구간 [start, end) 안에 완전히 포함되는 매치 존재 여부"""
+        i = bisect_right(self._ends, start)
+        straddles = False
+        while i < len(self._starts) and self._starts[i] < end:
+            if self._starts[i] >= start and self._ends[i] <= end:
+                return True
+            straddles = True
+            i += 1
+        if straddles:
+            return self._regex.search(self._text, start, end) is not None
+        return False
@@ -0,0 +1,136 @@
+"""
+스트리밍 JSON 파서 (LLM 응답용)
+
+LLM 이 토큰 단위로 생성하는 텍스트를 받으면서 첫 번째 JSON 객체를 해석한다.
+최상위 키의 값이 끝나는 즉시(다음 ',' 또는 닫는 '}') 그 값만 json.loads 로 파싱해
+보관하므로, 응답 전체를 기다리지 않고 완료된 항목부터 사용할 수 있다.
+
+- 첫 '{' 이전의 텍스트(설명, 코드 블록 표시 등)는 무시
+- 최상위 객체가 닫힌 뒤의 텍스트는 무시
+- 파싱할 수 없는 값은 건너뜀 (완료된 키 목록에 포함하지 않음)
+"""
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class IncrementalJSONParser:
+    """최상위 키 단위 증분 JSON 객체 파서"""
+
+    def __init__(self):
+        self.text = ''          # 지금까지 받은 전체 텍스트
+        self.values: Dict[str, Any] = {}
+        self.closed = False     # 최상위 객체 종료 여부
+
+        self._pos = 0           # 다음에 해석할 위치
+        self._depth = 0         # 중괄호/대괄호 깊이 (0 = 객체 시작 전/종료 후)
+        self._in_string = False
+        self._escape = False
+        self._phase = 'key'     # 최상위 객체 내부 상태: key → colon → value
+        self._key: Optional[str] = None
+        self._key_start = 0
+        self._value_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        텍스트 추가
+
+        Returns:
+            이번에 값이 완료된 최상위 키 목록
+        """
+        self.text += chunk
+        completed = []
+        text = self.text
+
+        while self._pos < len(text) and not self.closed:
+            i = self._pos
+            ch = text[i]
+            self._pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._phase == 'key':
+                        key = self._load(text[self._key_start:i + 1])
+                        self._key = key if isinstance(key, str) else None
+                        self._phase = 'colon'
+                continue
+
+            if self._depth == 0:
+                # 객체 시작 전 텍스트 무시
+                if ch == '{':
+                    self._depth = 1
+                    self._phase = 'key'
+                continue
+
+            if self._depth == 1:
+                if ch == '"':
+                    self._in_string = True
+                    if self._phase == 'key':
+                        self._key_start = i
+                    elif self._phase == 'value' and self._value_start is None:
+                        self._value_start = i
+                elif ch == ':' and self._phase == 'colon':
+                    self._phase = 'value'
+                    self._value_start = None
+                elif ch in ',}':
+                    if self._phase == 'value':
+                        key = self._finish_value(i)
+                        if key is not None:
+                            completed.append(key)
+                    self._phase = 'key'
+                    if ch == '}':
+                        self._depth = 0
+                        self.closed = True
+                elif ch in '{[':
+                    if self._phase == 'value' and self._value_start is None:
+                        self._value_start = i
+                    self._depth += 1
+                elif not ch.isspace() and self._phase == 'value' and self._value_start is None:
+                    self._value_start = i
+                continue
+
+            # 중첩된 값 내부
+            if ch == '"':
+                self._in_string = True
+            elif ch in '{[':
+                self._depth += 1
+            elif ch in '}]':
+                self._depth -= 1
+
+        return completed
+
+    def _finish_value(self, end: int) -> Optional[str]:
+        """최상위 값 완료 처리 (파싱 성공 시 키 반환)"""
+        key, start = self._key, self._value_start
+        self._key = None
+        self._value_start = None
+        if key is None or start is None:
+            return None
+        value = self._load(self.text[start:end].strip())
+        if value is _INVALID:
+            return None
+        self.values[key] = value
+        return key
+
+    @staticmethod
+    def _load(fragment: str):
+        try:
+            return json.loads(fragment)
+        except ValueError:
+            return _INVALID
+
+    def has_keys(self, keys: Iterable[str]) -> bool:
+        """지정한 최상위 키가 모두 완료되었는지"""
+        return all(key in self.values for key in keys)
+
+    def result(self) -> Dict:
+        """완료된 최상위 키/값"""
+        return dict(self.values)
+
+
+# 파싱 실패 표시 (None 은 JSON null 과 구분되지 않으므로 별도 객체 사용)
+_INVALID = object()
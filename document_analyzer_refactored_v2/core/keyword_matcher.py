@@ -0,0 +1,143 @@
+"""
+다중 키워드 매처 (민감정보 키워드 일괄 탐지)
+
+키워드 표 전체를 하나의 매처로 만들어 텍스트를 한 번만 훑으면서
+겹치는 위치를 포함한 모든 키워드 등장 위치를 찾는다.
+
+[백엔드]
+- ahocorasick: pyahocorasick 이 설치되어 있으면 C 구현 오토마톤 사용
+- regex: 표준 라이브러리만 사용. 키워드를 길이 내림차순 대체 정규식으로
+         결합해 각 위치의 가장 긴 키워드를 찾고, 같은 위치에서 시작하는
+         짧은 키워드(가장 긴 키워드의 접두사)는 미리 계산한 표로 보충한다.
+         안쪽에서 다른 키워드가 시작될 수 있는 키워드가 매치되면 그 범위의
+         각 위치만 추가로 확인해 겹치는 등장도 모두 찾는다.
+"""
+import re
+import threading
+from typing import Dict, List, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# (순번, 카테고리, 키워드) - 순번은 키워드 표 순서
+KeywordEntry = Tuple[int, str, str]
+
+
+class KeywordMatcher:
+    """키워드 표로부터 만든 다중 키워드 매처"""
+
+    def __init__(self, keyword_table: Dict[str, List[str]], use_c_backend: bool = True):
+        """
+        Args:
+            keyword_table: {카테고리: [키워드, ...]}
+            use_c_backend: pyahocorasick 사용 가능 시 사용 여부
+        """
+        # 소문자 키워드 → 해당 키워드를 가진 (순번, 카테고리, 원본 키워드) 목록
+        self._entries: Dict[str, List[KeywordEntry]] = {}
+        ordinal = 0
+        for category, keywords in keyword_table.items():
+            for keyword in keywords:
+                if keyword:
+                    self._entries.setdefault(keyword.lower(), []).append(
+                        (ordinal, category, keyword)
+                    )
+                ordinal += 1
+
+        self.backend = 'regex'
+        self._automaton = None
+        self._regex = None
+        # 가장 긴 키워드 → (같은 위치의 모든 항목(순번 순), 안쪽 키워드 가능 여부)
+        self._longest: Dict[str, Tuple[List[KeywordEntry], bool]] = {}
+
+        if not self._entries:
+            return
+
+        if use_c_backend and ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for key in self._entries:
+                self._automaton.add_word(key, key)
+            self._automaton.make_automaton()
+            self.backend = 'ahocorasick'
+        else:
+            keys = sorted(self._entries, key=len, reverse=True)
+            self._regex = re.compile('|'.join(re.escape(key) for key in keys))
+            for key in keys:
+                # 같은 위치에서 함께 일치하는 키워드 = 가장 긴 키워드의 접두사
+                entries = sorted(
+                    entry
+                    for other in keys if key.startswith(other)
+                    for entry in self._entries[other]
+                )
+                self._longest[key] = (entries, self._has_inner_start(key, keys))
+
+    @staticmethod
+    def _has_inner_start(key: str, keys: List[str]) -> bool:
+        """키워드 안쪽(두 번째 글자 이후)에서 다른 키워드가 시작될 수 있는지"""
+        for i in range(1, len(key)):
+            tail = key[i:]
+            if any(other.startswith(tail) or tail.startswith(other) for other in keys):
+                return True
+        return False
+
+    def find_all(self, text_lower: str, pos: int = 0) -> List[Tuple[int, KeywordEntry]]:
+        """
+        모든 키워드 등장 위치
+
+        Args:
+            text_lower: 소문자로 변환된 텍스트
+            pos: 탐색 시작 위치 (이 위치 이후에 시작하는 등장만 반환)
+
+        Returns:
+            [(시작 위치, (순번, 카테고리, 키워드)), ...]
+            - (시작 위치, 순번) 순 정렬 (키워드별 str.find 반복 결과와 동일한 순서)
+        """
+        hits = []
+        if self._automaton is not None:
+            for end_index, key in self._automaton.iter(text_lower, pos):
+                start = end_index - len(key) + 1
+                hits.extend((start, entry) for entry in self._entries[key])
+            hits.sort(key=lambda hit: (hit[0], hit[1][0]))
+            return hits
+
+        if self._regex is None:
+            return hits
+
+        # 위치 순으로 탐색하고 같은 위치 항목은 순번 순이므로 정렬 불필요
+        match_at = self._regex.match
+        longest = self._longest
+        for match in self._regex.finditer(text_lower, pos):
+            start = match.start()
+            entries, has_inner = longest[match.group()]
+            hits.extend((start, entry) for entry in entries)
+            if has_inner:
+                for pos in range(start + 1, match.end()):
+                    inner = match_at(text_lower, pos)
+                    if inner:
+                        hits.extend((pos, entry) for entry in longest[inner.group()][0])
+        return hits
+
+
+_cache_lock = threading.Lock()
+_cached_signature = None
+_cached_matcher = None
+
+
+def get_keyword_matcher(keyword_table: Dict[str, List[str]]) -> KeywordMatcher:
+    """
+    키워드 표에 맞는 매처 반환
+
+    키워드 표 내용이 바뀐 경우에만 다시 생성한다 (지연 재생성).
+    """
+    global _cached_signature, _cached_matcher
+
+    signature = tuple(
+        (category, tuple(keywords)) for category, keywords in keyword_table.items()
+    )
+    with _cache_lock:
+        if signature != _cached_signature:
+            _cached_matcher = KeywordMatcher(keyword_table)
+            _cached_signature = signature
+        return _cached_matcher
@@ -0,0 +1,174 @@
+"""
+LLM 분석 결과 디스크 캐시 (내용 주소 기반)
+
+같은 문서(또는 일부만 바뀐 문서의 바뀌지 않은 구간)를 다시 분석할 때 LLM 을 호출하지
+않도록, 파싱된 LLM 응답을 디스크에 저장한다.
+
+[키]
+sha256(모델 이름, 프롬프트 템플릿 버전, 프롬프트 전문) - 같은 키는 항상 같은 요청이다.
+프롬프트(지시문, 출력 형식 등)를 바꾸면 템플릿 버전을 올려 이전 결과를 쓰지 않게 한다.
+
+[저장 / 교체]
+- 항목 하나가 파일 하나 (<키>.json), 임시 파일에 쓴 뒤 교체하므로 중간 상태를 읽지 않음
+- 전체 크기가 max_bytes 를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+- 사용 시각은 파일 수정 시각으로 기록해 프로그램을 다시 시작해도 순서 유지
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+from utils.constants import LLM_CACHE_DIR, LLM_CACHE_MAX_BYTES
+from utils.logger import logger
+
+
+class LLMResultCache:
+    """크기 제한 LRU 디스크 캐시"""
+
+    def __init__(self, cache_dir: str = LLM_CACHE_DIR, max_bytes: int = LLM_CACHE_MAX_BYTES):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            max_bytes: 캐시 전체 최대 크기 (바이트)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Optional["OrderedDict[str, int]"] = None  # 키 → 파일 크기 (오래된 순)
+        self._total_bytes = 0
+
+    @staticmethod
+    def make_key(model_name: str, template_version: int, prompt: str) -> str:
+        """캐시 키 생성"""
+        digest = hashlib.sha256()
+        for part in (model_name, str(template_version), prompt):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load_index(self):
+        """디렉토리 스캔으로 항목 목록 구성 (최초 사용 시 1회, 잠금 보유 상태에서 호출)"""
+        if self._entries is not None:
+            return
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        if not self.cache_dir.is_dir():
+            return
+
+        files = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        캐시 조회 (사용 시각 갱신)
+
+        Returns:
+            저장된 분석 결과 또는 None
+        """
+        with self._lock:
+            self._load_index()
+            if key not in self._entries:
+                self.misses += 1
+                return None
+
+            path = self._path(key)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    result = json.load(f)
+                os.utime(path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"LLM 캐시 읽기 실패 - 항목 삭제: {str(e)}")
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: str, result: Dict):
+        """캐시 저장 (크기 초과 시 오래된 항목 삭제)"""
+        data = json.dumps(result, ensure_ascii=False).encode('utf-8')
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            self._load_index()
+            path = self._path(key)
+            tmp_path = path.with_suffix(f'.{threading.get_ident()}.tmp')
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"LLM 캐시 저장 실패: {str(e)}")
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+                return
+
+            self._total_bytes += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+
+            while self._total_bytes > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str):
+        """항목 삭제 (잠금 보유 상태에서 호출)"""
+        self._total_bytes -= self._entries.pop(key, 0)
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._load_index()
+            for key in list(self._entries):
+                self._remove(key)
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load_index()
+            return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """캐시 전체 크기 (바이트)"""
+        with self._lock:
+            self._load_index()
+            return self._total_bytes
+
+
+_cache: Optional[LLMResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResultCache:
+    """프로세스 전역 공유 캐시 반환 (최초 호출 시 생성)"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResultCache()
+        return _cache
@@ -0,0 +1,253 @@
+"""
+LLM 구간 분할 분석 (map-reduce)
+
+문서 앞부분만 LLM 에 보내지 않고 전체를 토큰 예산에 맞는 구간으로 나누어 구간별로
+분석(map)한 뒤, 결과를 순서와 무관하게 항상 같은 방식으로 합친다(reduce).
+
+[토큰 추정]
+모델별 토크나이저 없이 근사한다: 한글 등 비 ASCII 문자 1글자 ≈ 1토큰,
+ASCII 문자 4글자 ≈ 1토큰. 프롬프트 지시문은 포함하지 않고 문서 본문만 센다.
+
+[예산]
+문서당 토큰 예산(budget)을 넘는 문서는 구간을 문서 전체에 고르게 골라
+예산 안에서 분석한다 (첫 구간은 항상 포함). 응답 시간은 구간 수에 비례하므로
+예산으로 문서당 LLM 분석 시간의 상한을 정한다.
+
+[검증 모드 구간]
+규칙 기반 탐지 후보가 있으면 문서 전체 대신 후보 주변 창(candidate_windows)만 모아
+프롬프트당 토큰 한도로 묶는다(group_windows). 예산을 넘으면 묶음을 고르게 고른다.
+
+[합치기 규칙]
+- detected_info: (유형, 값) 기준 중복 제거, 구간 순서 → 구간 내 순서
+- legal_violations / recommendations: 처음 나온 순서로 중복 제거
+- risk_score: 구간 점수 중 최댓값 (가장 위험한 구간이 문서 위험도를 결정)
+- risk_level: 합친 점수로 다시 계산
+- reasoning: 구간별 판단 근거를 구간 번호와 함께 연결
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트 토큰 수 추정"""
+    ascii_count = len(text.encode('ascii', 'ignore'))
+    return (len(text) - ascii_count) + (ascii_count + 3) // 4
+
+
+def risk_level_for_score(score: int) -> str:
+    """위험도 점수 → 위험도 레벨"""
+    if score >= 75:
+        return "심각"
+    elif score >= 50:
+        return "높음"
+    elif score >= 25:
+        return "보통"
+    return "낮음"
+
+
+def split_chunks(text: str, chunk_tokens: int) -> List[Tuple[int, int]]:
+    """
+    토큰 수 기준 구간 분할
+
+    구간 끝은 가능하면 줄바꿈(없으면 공백)에 맞춘다.
+
+    Args:
+        text: 전체 텍스트
+        chunk_tokens: 구간당 최대 토큰 수 (추정치)
+
+    Returns:
+        [(시작, 끝), ...]
+    """
+    length = len(text)
+    if length == 0:
+        return []
+
+    total_tokens = estimate_tokens(text)
+    if total_tokens <= chunk_tokens:
+        return [(0, length)]
+
+    # 문서 평균 밀도로 구간 글자 수를 정하고, 구간별 추정치가 넘치면 줄임
+    chars_per_chunk = max(1, int(chunk_tokens * length / total_tokens))
+    chunks = []
+    start = 0
+    while start < length:
+        end = min(length, start + chars_per_chunk)
+        while end - start > 1 and estimate_tokens(text[start:end]) > chunk_tokens:
+            end = start + (end - start) * 3 // 4
+        if end < length:
+            end = _snap_end(text, start, end)
+        chunks.append((start, end))
+        start = end
+    return chunks
+
+
+def _snap_end(text: str, start: int, end: int) -> int:
+    """구간 끝을 뒤쪽 절반 안의 마지막 줄바꿈(없으면 공백) 다음으로 이동"""
+    floor = start + (end - start) // 2
+    for separator in ('\n', ' '):
+        pos = text.rfind(separator, floor, end)
+        if pos != -1:
+            return pos + 1
+    return end
+
+
+def select_chunks(chunks: Sequence, max_chunks: int) -> List:
+    """
+    예산 안에서 분석할 구간 선택 (문서 전체에 고르게, 첫/마지막 구간 포함)
+
+    Args:
+        chunks: split_chunks / group_windows 결과
+        max_chunks: 최대 구간 수
+    """
+    count = len(chunks)
+    if count <= max_chunks:
+        return list(chunks)
+    if max_chunks <= 1:
+        return chunks[:1]
+    indices = sorted({round(i * (count - 1) / (max_chunks - 1)) for i in range(max_chunks)})
+    return [chunks[i] for i in indices]
+
+
+def plan_chunks(text: str, chunk_tokens: int, budget_tokens: int) -> List[Tuple[int, int]]:
+    """
+    LLM 에 보낼 구간 계획
+
+    Args:
+        text: 전체 텍스트
+        chunk_tokens: 구간당 최대 토큰 수
+        budget_tokens: 문서당 최대 토큰 수
+
+    Returns:
+        [(시작, 끝), ...] (문서 순서)
+    """
+    max_chunks = max(1, budget_tokens // max(1, chunk_tokens))
+    return select_chunks(split_chunks(text, chunk_tokens), max_chunks)
+
+
+def candidate_windows(length: int, spans: Iterable[Tuple[int, int]],
+                      context: int) -> List[Tuple[int, int]]:
+    """
+    탐지 후보 주변 창 (앞뒤 context 글자, 겹치거나 맞닿는 창은 합침)
+
+    Args:
+        length: 텍스트 길이
+        spans: 후보 (시작, 끝) 목록
+        context: 앞뒤 문맥 글자 수
+
+    Returns:
+        [(시작, 끝), ...] (위치 순)
+    """
+    windows = []
+    for start, end in sorted(spans):
+        window_start, window_end = max(0, start - context), min(length, end + context)
+        if windows and window_start <= windows[-1][1]:
+            windows[-1] = (windows[-1][0], max(windows[-1][1], window_end))
+        else:
+            windows.append((window_start, window_end))
+    return windows
+
+
+def group_windows(text: str, windows: List[Tuple[int, int]],
+                  chunk_tokens: int) -> List[List[Tuple[int, int]]]:
+    """
+    창을 프롬프트당 토큰 한도로 묶음 (한도를 넘는 창은 split_chunks 로 나눔)
+
+    Returns:
+        [[(시작, 끝), ...], ...] (묶음 하나 = 프롬프트 하나)
+    """
+    groups = []
+    current, used = [], 0
+    for window_start, window_end in windows:
+        pieces = split_chunks(text[window_start:window_end], chunk_tokens)
+        for piece_start, piece_end in pieces:
+            start, end = window_start + piece_start, window_start + piece_end
+            tokens = estimate_tokens(text[start:end])
+            if current and used + tokens > chunk_tokens:
+                groups.append(current)
+                current, used = [], 0
+            current.append((start, end))
+            used += tokens
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _to_score(value) -> Optional[int]:
+    """LLM 응답 점수를 0~100 정수로 변환 (해석 불가 시 None)"""
+    try:
+        return max(0, min(100, int(float(value))))
+    except (TypeError, ValueError):
+        return None
+
+
+def _key(value):
+    """중복 비교 키 (목록 / 객체 등 해시 불가 값은 문자열로 비교)"""
+    return value if isinstance(value, (str, int, float)) else repr(value)
+
+
+def _unique(values) -> List:
+    """처음 나온 순서로 중복 제거 (해시 불가 값은 문자열로 비교)"""
+    seen = set()
+    unique = []
+    for value in values:
+        key = _key(value)
+        if key not in seen:
+            seen.add(key)
+            unique.append(value)
+    return unique
+
+
+def reduce_chunk_results(results: List[Optional[Dict]], coverage: float = 1.0,
+                         scope: str = '문서') -> Optional[Dict]:
+    """
+    구간별 LLM 분석 결과 합치기
+
+    Args:
+        results: 구간 순서대로의 분석 결과 (실패한 구간은 None)
+        coverage: 분석한 구간이 scope 에서 차지하는 비율 (판단 근거 표시용)
+        scope: 분석 범위 기준 (문서 / 탐지 후보)
+
+    Returns:
+        합친 분석 결과 (유효한 구간이 없으면 None)
+    """
+    valid = [(i, r) for i, r in enumerate(results, 1) if r and 'recommendations' in r]
+    if not valid:
+        return None
+    if len(results) == 1:
+        return valid[0][1]
+
+    detected_info = []
+    seen_items = set()
+    for _, result in valid:
+        for item in result.get('detected_info') or []:
+            if not isinstance(item, dict):
+                continue
+            # LLM 이 값을 목록 / 객체로 돌려주는 경우가 있어 문자열로 비교
+            key = (_key(item.get('type', '')), _key(item.get('value', '')))
+            if key not in seen_items:
+                seen_items.add(key)
+                detected_info.append(item)
+
+    scores = [s for s in (_to_score(r.get('risk_score')) for _, r in valid) if s is not None]
+    risk_score = max(scores) if scores else 0
+
+    reasoning_parts = [
+        f"{len(results)}개 구간으로 나누어 분석했습니다 "
+        f"(분석 범위: {scope}의 {coverage * 100:.0f}%, 유효 응답 {len(valid)}개 구간)."
+    ]
+    for i, result in valid:
+        reasoning = str(result.get('reasoning') or '').strip()
+        if reasoning:
+            reasoning_parts.append(f"[구간 {i}/{len(results)}] {reasoning}")
+
+    return {
+        "detected_info": detected_info,
+        "risk_level": risk_level_for_score(risk_score),
+        "risk_score": risk_score,
+        "reasoning": "\n".join(reasoning_parts),
+        "legal_violations": _unique(
+            v for _, r in valid for v in (r.get('legal_violations') or [])
+        ),
+        "recommendations": _unique(
+            v for _, r in valid for v in (r.get('recommendations') or [])
+        ),
+    }
@@ -0,0 +1,68 @@
+"""
+LLM 요청 디스패처 (동시 요청 수 제한)
+
+일괄 분석에서 LLM 호출을 스레드 풀로 넘겨 최대 concurrency 개의 생성 요청을
+동시에 Ollama 서버로 보낸다. 요청이 서버에서 처리되는 동안 호출한 스레드는
+다음 파일의 텍스트 추출 / 규칙 기반 탐지를 진행한다.
+
+[동시 요청 수]
+Ollama 서버는 OLLAMA_NUM_PARALLEL 개의 요청만 동시에 처리하고 나머지는 대기열에
+넣으므로, concurrency 를 서버 설정과 맞추면 서버 슬롯을 모두 쓰면서 불필요한
+대기 요청을 만들지 않는다. 공유 OllamaClient 의 연결 풀 크기(동시 생성 요청 한도)도
+concurrency 로 맞추므로, 문서 하나를 여러 구간으로 나누어 요청해도 전체 동시 요청 수는
+concurrency 를 넘지 않는다.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from core.ollama_client import get_ollama_client, configure_ollama_client
+from utils.constants import OLLAMA_NUM_PARALLEL
+from utils.logger import logger
+
+
+class LLMDispatcher:
+    """동시 요청 수를 제한하는 LLM 호출 스레드 풀"""
+
+    def __init__(self, concurrency: int = OLLAMA_NUM_PARALLEL):
+        """
+        Args:
+            concurrency: 동시에 처리할 LLM 요청 수 (Ollama 서버의 OLLAMA_NUM_PARALLEL)
+        """
+        self.concurrency = max(1, concurrency)
+
+        # 클라이언트가 연결 풀 크기만큼만 생성 요청을 동시에 보내므로 같은 값으로 맞춤
+        if get_ollama_client().pool_size != self.concurrency:
+            configure_ollama_client(pool_size=self.concurrency)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix='llm-dispatch'
+        )
+        logger.info(f"LLM 디스패처 시작: 동시 요청 {self.concurrency}개")
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        LLM 호출 예약
+
+        Args:
+            func: LLM 을 호출하는 함수 (예: analyzer.run_llm_analysis)
+
+        Returns:
+            호출 결과 Future
+        """
+        return self._executor.submit(func, *args, **kwargs)
+
+    def shutdown(self, cancel_pending: bool = False):
+        """
+        디스패처 종료
+
+        Args:
+            cancel_pending: True 이면 시작하지 않은 요청을 취소하고 진행 중인 요청을
+                            기다리지 않음 (분석 취소 시)
+        """
+        self._executor.shutdown(wait=not cancel_pending, cancel_futures=cancel_pending)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown(cancel_pending=exc_type is not None)
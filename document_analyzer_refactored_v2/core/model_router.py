@@ -0,0 +1,185 @@
+"""
+LLM 모델 라우터 (문서별 빠른 모델 / 정확한 모델 선택)
+
+콤보박스에서 고른 모델 하나로 모든 문서를 분석하지 않고, 규칙 기반 탐지 결과와
+프롬프트 크기로 문서마다 모델을 고른다. 대부분의 문서는 규칙 기반 결과가 확실하거나
+개인정보가 없으므로 작은 모델로 충분하고, 판단이 애매한 문서만 큰 모델로 보낸다.
+
+[라우팅 규칙] (위에서부터 처음 맞는 규칙 적용)
+1. 탐지 후보 없음 → 빠른 모델 (깨끗한 문서)
+2. 애매한 후보 없음 → 빠른 모델 (규칙 기반으로 확실)
+   애매한 후보: 민감정보 키워드 탐지 항목, 신뢰도가 high 가 아닌 정규식 탐지 항목
+3. 프롬프트 토큰 합계 > max_accurate_tokens → 빠른 모델 (큰 모델 응답 시간 상한)
+4. 애매한 후보 비율 ≥ ambiguous_ratio 또는 키워드 항목 수 ≥ keyword_min → 정확한 모델
+5. 그 외 → 빠른 모델
+
+[지연 시간 통계]
+모델별 LLM 요청 소요 시간을 기록해(ModelLatencyStats) 라우팅 기준을 조정할 때 쓴다.
+캐시에서 가져온 결과는 기록하지 않는다.
+"""
+import threading
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional
+
+from core.detection_result import DetectionResult
+from utils.constants import (
+    LLM_FAST_MODEL, LLM_ACCURATE_MODEL, LLM_ROUTE_MAX_ACCURATE_TOKENS,
+    LLM_ROUTE_AMBIGUOUS_RATIO, LLM_ROUTE_KEYWORD_MIN, LLM_LATENCY_SAMPLES
+)
+
+
+class RouteDecision(NamedTuple):
+    """라우팅 결과"""
+    model: str
+    reason: str
+
+
+class ModelRouter:
+    """탐지 결과 / 프롬프트 크기 기반 모델 선택"""
+
+    def __init__(self, fast_model: str = LLM_FAST_MODEL,
+                 accurate_model: str = LLM_ACCURATE_MODEL,
+                 max_accurate_tokens: int = LLM_ROUTE_MAX_ACCURATE_TOKENS,
+                 ambiguous_ratio: float = LLM_ROUTE_AMBIGUOUS_RATIO,
+                 keyword_min: int = LLM_ROUTE_KEYWORD_MIN):
+        """
+        Args:
+            fast_model: 빠른 모델 (깨끗하거나 규칙 기반으로 확실한 문서)
+            accurate_model: 정확한 모델 (판단이 애매한 문서)
+            max_accurate_tokens: 정확한 모델에 보낼 프롬프트 토큰 합계 상한
+            ambiguous_ratio: 정확한 모델로 보낼 애매한 후보 비율 기준
+            keyword_min: 정확한 모델로 보낼 키워드 탐지 항목 수 기준
+        """
+        self.fast_model = fast_model
+        self.accurate_model = accurate_model
+        self.max_accurate_tokens = max_accurate_tokens
+        self.ambiguous_ratio = ambiguous_ratio
+        self.keyword_min = keyword_min
+
+    @property
+    def models(self) -> List[str]:
+        """라우팅 대상 모델 목록"""
+        return list(dict.fromkeys((self.fast_model, self.accurate_model)))
+
+    @staticmethod
+    def _is_ambiguous(item: Dict) -> bool:
+        """LLM 판단이 필요한 후보인지 여부"""
+        return item.get('method') == 'keyword' or item.get('confidence') != 'high'
+
+    def route(self, detection: DetectionResult, prompt_tokens: int) -> RouteDecision:
+        """
+        문서 1건의 모델 선택
+
+        Args:
+            detection: 규칙 기반 탐지 결과
+            prompt_tokens: 문서의 LLM 프롬프트 토큰 합계 (추정치)
+        """
+        candidates = detection.merged()
+        if not candidates:
+            return RouteDecision(self.fast_model, "탐지 후보 없음")
+
+        ambiguous = sum(1 for item in candidates if self._is_ambiguous(item))
+        if ambiguous == 0:
+            return RouteDecision(self.fast_model, "규칙 기반 탐지 확실")
+
+        if prompt_tokens > self.max_accurate_tokens:
+            return RouteDecision(
+                self.fast_model, f"프롬프트 {prompt_tokens}토큰 > {self.max_accurate_tokens}"
+            )
+
+        keywords = sum(1 for item in candidates if item.get('method') == 'keyword')
+        ratio = ambiguous / len(candidates)
+        if ratio >= self.ambiguous_ratio or keywords >= self.keyword_min:
+            return RouteDecision(
+                self.accurate_model,
+                f"애매한 후보 {ambiguous}/{len(candidates)}개, 키워드 {keywords}개"
+            )
+        return RouteDecision(self.fast_model, f"애매한 후보 비율 {ratio:.0%}")
+
+
+class ModelLatencyStats:
+    """모델별 LLM 요청 소요 시간 통계 (스레드 안전)"""
+
+    def __init__(self, max_samples: int = LLM_LATENCY_SAMPLES):
+        """
+        Args:
+            max_samples: 모델별로 보관할 최근 요청 수 (백분위 계산용)
+        """
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict] = {}
+
+    def record(self, model: str, seconds: float, prompt_tokens: int, success: bool = True):
+        """
+        요청 1회 기록
+
+        Args:
+            model: 모델 이름
+            seconds: 요청 소요 시간 (초)
+            prompt_tokens: 프롬프트 토큰 수 (추정치)
+            success: 유효한 응답 여부
+        """
+        with self._lock:
+            stats = self._stats.get(model)
+            if stats is None:
+                stats = self._stats[model] = {
+                    'count': 0, 'failures': 0, 'total_seconds': 0.0, 'total_tokens': 0,
+                    'samples': deque(maxlen=self.max_samples),
+                }
+            stats['count'] += 1
+            stats['total_seconds'] += seconds
+            stats['total_tokens'] += prompt_tokens
+            stats['samples'].append(seconds)
+            if not success:
+                stats['failures'] += 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        모델별 통계
+
+        Returns:
+            {모델: {'count', 'failures', 'mean', 'p50', 'p95', 'seconds_per_1k_tokens'}}
+        """
+        with self._lock:
+            result = {}
+            for model, stats in self._stats.items():
+                samples = sorted(stats['samples'])
+                result[model] = {
+                    'count': stats['count'],
+                    'failures': stats['failures'],
+                    'mean': stats['total_seconds'] / stats['count'],
+                    'p50': samples[(len(samples) - 1) // 2],
+                    'p95': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+                    'seconds_per_1k_tokens': (
+                        stats['total_seconds'] * 1000 / stats['total_tokens']
+                        if stats['total_tokens'] else 0.0
+                    ),
+                }
+            return result
+
+    def summary(self) -> str:
+        """로그 / 상태 표시용 요약 (모델당 한 줄)"""
+        return "\n".join(
+            f"{model}: {s['count']}회 (실패 {s['failures']}), 평균 {s['mean']:.2f}초, "
+            f"p50 {s['p50']:.2f}초, p95 {s['p95']:.2f}초, "
+            f"1k 토큰당 {s['seconds_per_1k_tokens']:.2f}초"
+            for model, s in sorted(self.snapshot().items())
+        )
+
+    def clear(self):
+        """통계 초기화"""
+        with self._lock:
+            self._stats.clear()
+
+
+_stats: Optional[ModelLatencyStats] = None
+_stats_lock = threading.Lock()
+
+
+def get_model_stats() -> ModelLatencyStats:
+    """프로세스 전역 공유 지연 시간 통계 반환 (최초 호출 시 생성)"""
+    global _stats
+    with _stats_lock:
+        if _stats is None:
+            _stats = ModelLatencyStats()
+        return _stats
@@ -0,0 +1,370 @@
+"""
+Ollama HTTP 클라이언트 (연결 재사용)
+
+서버 상태 확인(/api/tags)과 LLM 호출(/api/generate)이 모두 하나의 requests.Session 을
+공유해, 호출마다 TCP 연결을 새로 맺고 끊지 않도록 한다 (HTTP keep-alive).
+분석 스레드 / 일괄 분석 / GUI 상태 표시가 같은 클라이언트를 사용한다.
+
+[상태 캐시]
+서버 상태와 모델 목록(/api/tags)은 probe() 로 조회하며 결과를 TTL 동안 공유한다.
+- 연결 성공 상태: OLLAMA_HEALTH_TTL 동안 유지, LLM 호출이 성공할 때마다 갱신
+- 연결 실패 상태: OLLAMA_HEALTH_FAILURE_TTL 동안 유지 (서버 재시작을 빨리 반영)
+- LLM 호출 실패(접속 오류/오류 응답) 시 즉시 무효화 → 다음 probe() 에서 다시 조회
+
+[동시 요청 제한]
+생성 요청(generate / generate_stream)은 동시에 pool_size 개까지만 보내고 나머지는
+호출한 스레드에서 대기한다 (상태 확인 요청은 제한하지 않음).
+
+[모델 적재 (warm-up)]
+유휴 후 첫 생성 요청은 모델을 메모리에 올리는 시간까지 기다려야 해서 생성 타임아웃
+(OLLAMA_TIMEOUT)을 넘기기 쉽다. load_model() 은 빈 프롬프트로 모델만 적재하며 적재
+시간 한도(OLLAMA_LOAD_TIMEOUT)를 따로 적용한다. 적재 / 생성에 성공한 모델은 keep_alive
+동안 적재 상태로 기억하고, 같은 모델의 동시 적재 요청은 하나로 합친다.
+요청 실패로 상태 캐시를 무효화하면 적재 상태도 함께 지운다.
+
+[설정 변경]
+configure_ollama_client() 는 공유 클라이언트를 교체하지 않고 설정만 바꾼다. 분석기가
+보관한 클라이언트가 닫히지 않으며, 연결 풀 크기만 바뀌면 상태 캐시 / 적재 상태도 유지된다.
+"""
+import json
+import re
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+
+from utils.constants import (
+    OLLAMA_BASE_URL, OLLAMA_POOL_SIZE, OLLAMA_HEALTH_TTL, OLLAMA_HEALTH_FAILURE_TTL,
+    OLLAMA_KEEP_ALIVE, OLLAMA_LOAD_TIMEOUT
+)
+
+_DURATION_UNITS = {'h': 3600, 'm': 60, 's': 1, 'ms': 0.001}
+
+
+def keep_alive_seconds(keep_alive: Union[str, int, float]) -> float:
+    """
+    Ollama keep_alive 값 → 초 (음수는 무기한 유지 = inf, 해석 불가 시 0)
+
+    예: 300, "300", "30m", "1h30m", "-1"
+    """
+    if isinstance(keep_alive, (int, float)):
+        seconds = float(keep_alive)
+    else:
+        value = str(keep_alive).strip()
+        try:
+            seconds = float(value)
+        except ValueError:
+            sign = -1 if value.startswith('-') else 1
+            parts = re.findall(r'(\d+(?:\.\d+)?)(ms|h|m|s)', value)
+            if not parts or ''.join(n + u for n, u in parts) != value.lstrip('+-'):
+                return 0.0
+            seconds = sign * sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+    return float('inf') if seconds < 0 else seconds
+
+
+class OllamaStatus:
+    """Ollama 서버 상태 조회 결과"""
+
+    def __init__(self, running: bool, models: Optional[List[str]] = None,
+                 status_code: Optional[int] = None, error: str = ''):
+        """
+        Args:
+            running: 서버 정상 응답 여부
+            models: 설치된 모델 이름 목록
+            status_code: HTTP 응답 코드 (접속 실패 시 None)
+            error: 실패 사유
+        """
+        self.running = running
+        self.models = models or []
+        self.status_code = status_code
+        self.error = error
+        self.checked_at = time.monotonic()
+
+    @property
+    def age(self) -> float:
+        """조회 후 경과 시간 (초)"""
+        return time.monotonic() - self.checked_at
+
+    def has_model(self, model_name: str) -> bool:
+        """모델 설치 여부"""
+        return model_name in self.models
+
+
+class OllamaClient:
+    """Ollama HTTP 클라이언트 (연결 풀 공유)"""
+
+    def __init__(self, base_url: str = OLLAMA_BASE_URL, pool_size: int = OLLAMA_POOL_SIZE,
+                 health_ttl: float = OLLAMA_HEALTH_TTL,
+                 failure_ttl: float = OLLAMA_HEALTH_FAILURE_TTL):
+        """
+        Args:
+            base_url: Ollama 서버 주소 (예: http://localhost:11434)
+            pool_size: 서버당 유지할 최대 연결 수 (동시 생성 요청 수)
+            health_ttl: 연결 성공 상태 캐시 유지 시간 (초)
+            failure_ttl: 연결 실패 상태 캐시 유지 시간 (초)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.pool_size = pool_size
+        self.health_ttl = health_ttl
+        self.failure_ttl = failure_ttl
+        self._status: Optional[OllamaStatus] = None
+        self._status_lock = threading.Lock()
+        self._generate_slots = threading.BoundedSemaphore(pool_size)
+        self._warm_until: Dict[str, float] = {}  # 모델 → 적재 상태 유지 예상 시각
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._warm_lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update({'Connection': 'keep-alive'})
+        self._mount_adapter(pool_size)
+
+    def _mount_adapter(self, pool_size: int):
+        """연결 풀 어댑터 설정 (이전 어댑터는 유휴 연결만 정리, 사용 중인 연결은 요청이 끝나면 닫힘)"""
+        previous = self.session.adapters.get('http://')
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if previous is not None:
+            previous.close()
+
+    def configure(self, base_url: Optional[str] = None, pool_size: Optional[int] = None):
+        """
+        서버 주소 / 연결 풀 크기 변경 (같은 클라이언트 유지)
+
+        연결 풀 크기만 바뀌면 상태 캐시 / 모델 적재 상태를 유지한다. 서버 주소가 바뀌면
+        다른 서버의 상태이므로 무효화한다. 진행 중인 생성 요청은 이전 한도로 끝난다.
+
+        Args:
+            base_url: Ollama 서버 주소 (None 이면 기존 값 유지)
+            pool_size: 최대 연결 수 (None 이면 기존 값 유지)
+        """
+        if pool_size and pool_size != self.pool_size:
+            self.pool_size = pool_size
+            self._generate_slots = threading.BoundedSemaphore(pool_size)
+            self._mount_adapter(pool_size)
+        if base_url and base_url.rstrip('/') != self.base_url:
+            self.base_url = base_url.rstrip('/')
+            self.invalidate()
+
+    @property
+    def tags_url(self) -> str:
+        """모델 목록 API 주소"""
+        return f"{self.base_url}/api/tags"
+
+    @property
+    def generate_url(self) -> str:
+        """텍스트 생성 API 주소"""
+        return f"{self.base_url}/api/generate"
+
+    def get_tags(self, timeout: float = 2) -> requests.Response:
+        """
+        모델 목록 조회 (서버 상태 확인 겸용)
+
+        Raises:
+            requests.exceptions.RequestException: 접속 실패 / 타임아웃
+        """
+        return self.session.get(self.tags_url, timeout=timeout)
+
+    def probe(self, timeout: float = 2, max_age: Optional[float] = None) -> OllamaStatus:
+        """
+        서버 상태 / 모델 목록 조회 (캐시 사용)
+
+        동시에 여러 스레드가 호출해도 서버에는 한 번만 요청한다.
+
+        Args:
+            timeout: 요청 타임아웃 (초)
+            max_age: 허용할 캐시 경과 시간 (None 이면 상태별 TTL, 0 이면 항상 새로 조회)
+        """
+        with self._status_lock:
+            status = self._status
+            if status is not None:
+                ttl = max_age if max_age is not None else (
+                    self.health_ttl if status.running else self.failure_ttl
+                )
+                if status.age < ttl:
+                    return status
+
+            try:
+                response = self.get_tags(timeout)
+                if response.status_code == 200:
+                    models = [m.get('name', '') for m in response.json().get('models', [])]
+                    status = OllamaStatus(True, models, response.status_code)
+                else:
+                    status = OllamaStatus(
+                        False, status_code=response.status_code,
+                        error=f"Ollama 서버 오류 (status={response.status_code})"
+                    )
+            except Exception as e:
+                status = OllamaStatus(False, error=str(e))
+
+            self._status = status
+            return status
+
+    def invalidate(self):
+        """상태 캐시 / 모델 적재 상태 무효화 (다음 probe 에서 다시 조회)"""
+        with self._status_lock:
+            self._status = None
+        with self._warm_lock:
+            self._warm_until.clear()
+
+    def _record_success(self, payload: Optional[Dict] = None):
+        """요청 성공 → 연결 성공 상태 캐시 / 모델 적재 상태 갱신"""
+        with self._status_lock:
+            if self._status is not None and self._status.running:
+                self._status.checked_at = time.monotonic()
+        if payload and payload.get('model'):
+            self._mark_warm(payload['model'], payload.get('keep_alive', OLLAMA_KEEP_ALIVE))
+
+    def _mark_warm(self, model: str, keep_alive: Union[str, int, float]):
+        """모델 적재 상태 기록 (keep_alive 동안 유지)"""
+        seconds = keep_alive_seconds(keep_alive)
+        with self._warm_lock:
+            if seconds > 0:
+                self._warm_until[model] = time.monotonic() + seconds
+            else:
+                self._warm_until.pop(model, None)
+
+    def is_warm(self, model: str) -> bool:
+        """모델이 적재되어 있을 것으로 예상되는지 여부"""
+        with self._warm_lock:
+            return self._warm_until.get(model, 0) > time.monotonic()
+
+    def load_model(self, model: str, keep_alive: Union[str, int, float] = OLLAMA_KEEP_ALIVE,
+                   timeout: float = OLLAMA_LOAD_TIMEOUT) -> bool:
+        """
+        모델 적재 (빈 프롬프트 생성 요청, 생성 요청 동시 제한과 별개)
+
+        같은 모델을 다른 스레드가 적재 중이면 그 요청이 끝나기를 기다린다.
+        이미 적재 상태로 기억하는 모델은 요청하지 않는다.
+
+        Args:
+            model: 모델 이름
+            keep_alive: 적재 유지 시간 (Ollama keep_alive 형식)
+            timeout: 적재 대기 한도 (초)
+
+        Returns:
+            적재 성공 여부
+        """
+        with self._warm_lock:
+            lock = self._load_locks.setdefault(model, threading.Lock())
+
+        with lock:
+            if self.is_warm(model):
+                return True
+            payload = {'model': model, 'prompt': '', 'stream': False, 'keep_alive': keep_alive}
+            try:
+                response = self.session.post(self.generate_url, json=payload, timeout=(5, timeout))
+                response.close()
+            except requests.exceptions.RequestException:
+                self.invalidate()
+                return False
+
+            if response.status_code != 200:
+                self.invalidate()
+                return False
+            self._record_success(payload)
+            return True
+
+    def generate(self, payload: Dict, timeout: float) -> requests.Response:
+        """
+        텍스트 생성 요청 (실패 시 상태 캐시 무효화)
+
+        Raises:
+            requests.exceptions.RequestException: 접속 실패 / 타임아웃
+        """
+        try:
+            with self._generate_slots:
+                response = self.session.post(self.generate_url, json=payload, timeout=timeout)
+        except requests.exceptions.RequestException:
+            self.invalidate()
+            raise
+
+        if response.status_code == 200:
+            self._record_success(payload)
+        else:
+            self.invalidate()
+        return response
+
+    def generate_stream(self, payload: Dict, timeout) -> Iterator[Dict]:
+        """
+        텍스트 생성 요청 (NDJSON 스트리밍)
+
+        응답 줄(JSON 객체)을 받는 대로 반환한다. 이터레이터를 중간에 닫으면
+        연결을 끊어 서버의 생성도 중단된다.
+
+        Args:
+            payload: 요청 본문 ("stream" 은 항상 True 로 전송)
+            timeout: 연결 / 토큰 간 대기 타임아웃 (초 또는 (연결, 읽기) 튜플)
+
+        Raises:
+            requests.exceptions.RequestException: 접속 실패 / 타임아웃
+            Exception: 서버 오류 응답
+        """
+        with self._generate_slots:
+            try:
+                response = self.session.post(
+                    self.generate_url, json=dict(payload, stream=True),
+                    timeout=timeout, stream=True
+                )
+            except requests.exceptions.RequestException:
+                self.invalidate()
+                raise
+
+            try:
+                if response.status_code != 200:
+                    self.invalidate()
+                    raise Exception(f"LLM 서버 오류 (status={response.status_code})")
+                self._record_success(payload)
+
+                for line in response.iter_lines():
+                    if line:
+                        yield json.loads(line)
+            except requests.exceptions.ConnectionError as e:
+                self.invalidate()
+                # 수신 중 읽기 타임아웃은 requests 가 ConnectionError 로 감싸므로 타임아웃으로 전달
+                if e.args and isinstance(e.args[0], ReadTimeoutError):
+                    raise requests.exceptions.ReadTimeout(e) from e
+                raise
+            except requests.exceptions.RequestException:
+                self.invalidate()
+                raise
+            finally:
+                response.close()
+
+    def close(self):
+        """연결 풀 정리"""
+        self.session.close()
+
+
+_client: Optional[OllamaClient] = None
+_client_lock = threading.Lock()
+
+
+def get_ollama_client() -> OllamaClient:
+    """프로세스 전역 공유 클라이언트 반환 (최초 호출 시 생성)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OllamaClient()
+        return _client
+
+
+def configure_ollama_client(base_url: Optional[str] = None,
+                            pool_size: Optional[int] = None) -> OllamaClient:
+    """
+    공유 클라이언트 설정 변경 (클라이언트를 교체하지 않음 - OllamaClient.configure)
+
+    Args:
+        base_url: Ollama 서버 주소 (None 이면 기존 값 유지)
+        pool_size: 최대 연결 수 (None 이면 기존 값 유지)
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OllamaClient(base_url or OLLAMA_BASE_URL, pool_size or OLLAMA_POOL_SIZE)
+        else:
+            _client.configure(base_url, pool_size)
+        return _client
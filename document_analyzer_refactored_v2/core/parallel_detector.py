@@ -0,0 +1,300 @@
+"""
+병렬 규칙 기반 탐지 (다중 프로세스)
+
+대용량 문서를 페이지/섹션 경계에서 구간으로 나누어 정규식/키워드 탐지를
+ProcessPoolExecutor 로 병렬 실행하고, 결과를 문서 기준 위치로 합친다.
+
+[작업 분담]
+- 작업 프로세스: 구간(앞뒤 겹침 여유분 포함) 스캔, 정규식 후보 컨텍스트 검증,
+                 키워드 / 개인 연결 패턴 매치 수집
+                 → 시작 위치가 자기 구간 안인 결과만 반환 (경계 중복 제거)
+- 메인 프로세스: 우선순위 충돌 해결, 키워드 클러스터링, 개인 연결 확인
+                 (구간 경계를 넘는 충돌/클러스터도 전체 문서 기준으로 처리)
+
+[제약]
+- 매치 하나의 길이가 max_match_length 를 넘으면 전체 문자열 탐지와 결과가 달라질 수 있다.
+- 소문자 변환 시 길이가 바뀌는 문자는 변환하지 않는다 (스트리밍 탐지와 동일).
+- 작업 프로세스는 spawn 방식으로 시작하므로 첫 사용 시 프로세스 기동 비용이 든다
+  (풀은 프로세스 전역으로 재사용).
+"""
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.detection_result import DetectionResult
+from core.interval_index import IntervalIndex
+from core.streaming_detector import DEFAULT_MAX_MATCH_LENGTH, _lower_preserving_length
+from utils.logger import logger
+
+
+# 병렬 탐지를 적용할 최소 텍스트 길이 (작은 문서는 프로세스 간 전송 비용이 더 큼)
+PARALLEL_MIN_SIZE = 200 * 1024
+
+# 구간 최소 크기 (글자 수)
+MIN_SEGMENT_SIZE = 64 * 1024
+
+# 작업 프로세스 수당 구간 수 (구간 크기 편차 흡수)
+SEGMENTS_PER_WORKER = 4
+
+
+def default_workers() -> int:
+    """기본 작업 프로세스 수 (CPU 코어 수)"""
+    return os.cpu_count() or 1
+
+
+# ============================================================
+# 작업 프로세스
+# ============================================================
+_worker_analyzers: Dict[str, object] = {}
+
+
+def detector_configs(analyzer) -> str:
+    """작업 프로세스에 넘길 커스텀 탐지기 설정 (JSON 문자열, 작업 프로세스 분석기 캐시 키)"""
+    return json.dumps(
+        {name: detector.to_config() for name, detector in analyzer.custom_detectors.items()},
+        ensure_ascii=False, sort_keys=True
+    )
+
+
+def _get_worker_analyzer(detector_configs: str):
+    """작업 프로세스의 분석기 (커스텀 패턴 구성별 1회 생성)"""
+    analyzer = _worker_analyzers.get(detector_configs)
+    if analyzer is None:
+        from core.analyzer import LocalLLMAnalyzer
+        analyzer = LocalLLMAnalyzer(custom_patterns=json.loads(detector_configs))
+        _worker_analyzers[detector_configs] = analyzer
+    return analyzer
+
+
+def _detect_segment(detector_configs: str, text: str, offset: int,
+                    own_start: int, own_end: int) -> Dict:
+    """
+    구간 탐지 (작업 프로세스에서 실행)
+
+    Args:
+        detector_configs: 커스텀 탐지기 설정 (JSON 문자열)
+        text: 겹침 여유분을 포함한 구간 텍스트
+        offset: text 의 문서 내 시작 위치
+        own_start, own_end: 이 구간이 담당하는 범위 (문서 기준)
+
+    Returns:
+        {'regex': [(유형 순번, 시작, 끝, 탐지 항목 또는 None), ...],
+         'keywords': [키워드 매치, ...],
+         'direct': [(시작, 끝), ...], 'indicator': [(시작, 끝), ...]}
+    """
+    analyzer = _get_worker_analyzer(detector_configs)
+    scanner = analyzer._get_scanner()
+
+    def owned(start: int) -> bool:
+        return own_start <= start + offset < own_end
+
+    regex = []
+    for index, start, end in scanner.scan(text):
+        if owned(start):
+            item = analyzer._make_regex_item(text, scanner.names[index], start, end, offset)
+            regex.append((index, start + offset, end + offset, item))
+
+    keywords = [
+        match for match in analyzer._find_keyword_matches(
+            text, _lower_preserving_length(text), 0, offset
+        )
+        if own_start <= match['start'] < own_end
+    ]
+
+    direct_regex, indicator_regex = analyzer._personal_connection_regexes()
+    return {
+        'regex': regex,
+        'keywords': keywords,
+        'direct': [
+            (m.start() + offset, m.end() + offset)
+            for m in direct_regex.finditer(text) if owned(m.start())
+        ],
+        'indicator': [
+            (m.start() + offset, m.end() + offset)
+            for m in indicator_regex.finditer(text) if owned(m.start())
+        ],
+    }
+
+
+# ============================================================
+# 프로세스 풀 (프로세스 전역 공유)
+# ============================================================
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """작업 프로세스 풀 반환 (프로세스 수가 바뀌면 재생성)"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # Qt 스레드에서 fork 하지 않도록 모든 플랫폼에서 spawn 사용
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            _pool_workers = workers
+            logger.info(f"병렬 탐지 프로세스 풀 생성: {workers}개")
+        return _pool
+
+
+def shutdown_pool(wait: bool = True):
+    """작업 프로세스 풀 종료"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait)
+            _pool = None
+            _pool_workers = 0
+
+
+# ============================================================
+# 병렬 탐지기
+# ============================================================
+class ParallelDetector:
+    """페이지/섹션 단위 병렬 탐지기"""
+
+    def __init__(self, analyzer, workers: Optional[int] = None,
+                 max_match_length: int = DEFAULT_MAX_MATCH_LENGTH):
+        """
+        Args:
+            analyzer: LocalLLMAnalyzer (패턴/검증/개인 연결 로직 공유)
+            workers: 작업 프로세스 수 (None 이면 CPU 코어 수)
+            max_match_length: 매치 하나의 최대 길이 (구간 간 겹침 여유분 계산용)
+        """
+        self.analyzer = analyzer
+        self.workers = workers or default_workers()
+        self.margin = max_match_length + max(
+            analyzer.REGEX_CONTEXT_WINDOW,
+            analyzer.KEYWORD_CONTEXT_WINDOW,
+            analyzer.PERSONAL_INDICATOR_WINDOW
+        )
+
+    def split(self, length: int, boundaries: Sequence[int] = ()) -> List[Tuple[int, int]]:
+        """
+        구간 분할
+
+        페이지/섹션 시작 위치를 우선 경계로 사용하고, 경계가 없거나 너무 먼 구간은
+        일정 크기로 나눈다.
+
+        Args:
+            length: 텍스트 길이
+            boundaries: 페이지/섹션 시작 위치 목록
+
+        Returns:
+            [(시작, 끝), ...]
+        """
+        target = max(MIN_SEGMENT_SIZE, -(-length // (self.workers * SEGMENTS_PER_WORKER)))
+        cuts = sorted(b for b in set(boundaries) if 0 < b < length)
+
+        segments = []
+        start = 0
+        for cut in cuts + [length]:
+            # 다음 경계까지 너무 멀면 일정 크기로 분할
+            while cut - start > target * 2:
+                segments.append((start, start + target))
+                start += target
+            if cut - start >= target or cut == length:
+                segments.append((start, cut))
+                start = cut
+
+        # 마지막 구간이 너무 작으면 앞 구간에 합침
+        if len(segments) > 1 and segments[-1][1] - segments[-1][0] < target // 2:
+            last = segments.pop()
+            segments[-1] = (segments[-1][0], last[1])
+        return segments
+
+    def detect(self, text: str, boundaries: Sequence[int] = ()) -> DetectionResult:
+        """
+        병렬 탐지
+
+        Args:
+            text: 전체 텍스트
+            boundaries: 페이지/섹션 시작 위치 목록 (DocumentProcessor.extract_text_with_boundaries)
+
+        Returns:
+            DetectionResult (detect 와 같은 결과)
+        """
+        analyzer = self.analyzer
+        segments = self.split(len(text), boundaries)
+        configs = detector_configs(analyzer)
+
+        try:
+            pool = _get_pool(self.workers)
+            futures = []
+            for own_start, own_end in segments:
+                start = max(0, own_start - self.margin)
+                end = min(len(text), own_end + self.margin)
+                futures.append(pool.submit(
+                    _detect_segment, configs, text[start:end], start, own_start, own_end
+                ))
+            parts = [future.result() for future in futures]
+        except Exception as e:
+            # 프로세스 풀 오류 시 단일 프로세스 탐지로 대체 (다음 호출 시 풀 재생성)
+            logger.warning(f"병렬 탐지 실패 - 단일 프로세스로 탐지: {str(e)}")
+            shutdown_pool(wait=False)
+            return DetectionResult(
+                text,
+                analyzer.detect_sensitive_info_regex(text),
+                analyzer.detect_sensitive_keywords(text)
+            )
+        logger.info(f"병렬 탐지: {len(segments)}개 구간, {self.workers}개 프로세스")
+
+        return DetectionResult(
+            text,
+            self._merge_regex(text, parts),
+            self._merge_keywords(text, parts)
+        )
+
+    def _merge_regex(self, text: str, parts: List[Dict]) -> List[Dict]:
+        """구간별 정규식 후보를 우선순위 순서로 충돌 해결"""
+        type_names = self.analyzer._get_scanner().names
+        candidates = sorted(
+            (candidate for part in parts for candidate in part['regex']),
+            key=lambda x: (x[0], x[1])
+        )
+
+        detected = []
+        detected_ranges = IntervalIndex()
+        for index, start, end, item in candidates:
+            overlap = detected_ranges.find_overlap(start, end)
+            if overlap:
+                logger.debug(
+                    f"중복 제외: {type_names[index]} '{text[start:end].strip()}' "
+                    f"(이미 {overlap[2]}로 탐지됨)"
+                )
+                continue
+            if item:
+                detected.append(item)
+                detected_ranges.add(start, end, type_names[index])
+
+        detected.sort(key=lambda x: x['start'])
+        return detected
+
+    def _merge_keywords(self, text: str, parts: List[Dict]) -> List[Dict]:
+        """구간별 키워드 매치를 문서 전체 기준으로 클러스터링 및 개인 연결 확인"""
+        analyzer = self.analyzer
+        raw_matches = [match for part in parts for match in part['keywords']]
+        if not raw_matches:
+            return []
+
+        connection_index = analyzer._build_personal_connection_index(
+            text,
+            spans=(
+                [span for part in parts for span in part['direct']],
+                [span for part in parts for span in part['indicator']]
+            )
+        )
+
+        detected = []
+        for cluster in analyzer._cluster_keyword_matches(raw_matches):
+            item = analyzer._make_keyword_item(text, cluster, connection_index)
+            if item:
+                detected.append(item)
+        return detected
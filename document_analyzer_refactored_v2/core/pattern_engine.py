@@ -0,0 +1,455 @@
+"""
+정규식 패턴 엔진
+
+- PatternRegistry: 프로세스 전역 컴파일 캐시 (패턴 문자열 + 플래그 기준)
+- MultiPatternScanner: 트리거 문자 사전 필터를 적용한 다중 패턴 스캐너
+
+[동작 원리]
+- 필수 문자: 패턴이 반드시 포함하는 문자 (이메일의 '@', IP의 '.')
+             → 텍스트에 없으면 해당 패턴 전체를 건너뜀
+- 시작 문자: 매치의 첫 글자가 될 수 있는 문자 집합
+             → 첫 등장 위치부터 스캔 (앞부분 재탐색 없음)
+- 같은 시작 문자 집합을 가진 패턴은 위치 탐색 결과를 공유
+- 숫자 패턴: 숫자/공백/하이픈만으로 이루어진 패턴(주민등록번호, 전화번호 등)은
+             텍스트를 한 번 훑어 만든 숫자 구간(숫자 사이에 공백/하이픈만 있는 구간)
+             중 필요한 숫자 개수를 채우는 구간에서만 실행
+- 매치 자체는 패턴별 finditer 그대로 → 기존 결과와 완전히 동일
+- 사전 필터 / 숫자 구간 처리 중 오류가 나면 해당 패턴만 필터 없이 finditer 로 다시 탐색
+
+참고: 모든 패턴을 하나의 대체(alternation) 정규식으로 묶는 방식은
+CPython re 엔진에서 패턴별 접두 문자 최적화가 사라져 오히려 느려진다.
+"""
+import re
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from utils.logger import logger
+
+try:
+    from re import _parser as _sre_parse, _constants as _sre
+except ImportError:  # Python 3.10 이하
+    import sre_parse as _sre_parse
+    import sre_constants as _sre
+
+
+_CATEGORY_CLASSES = {
+    _sre.CATEGORY_DIGIT: r'\d',
+    _sre.CATEGORY_SPACE: r'\s',
+    _sre.CATEGORY_WORD: r'\w',
+}
+
+_ZERO_WIDTH = (_sre.AT, _sre.ASSERT, _sre.ASSERT_NOT)
+_REPEATS = tuple(
+    getattr(_sre, name) for name in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+    if hasattr(_sre, name)
+)
+
+
+# 숫자 구간: 숫자로 시작/끝나고 사이에 공백/하이픈만 있는 최대 구간 (최소 숫자 개수 지정)
+_DIGIT_SPAN_TEMPLATE = r'\d(?:[\s-]*\d){%d,}'
+
+# 숫자 구간이 텍스트에서 차지하는 비율이 이 값 이상이면 구간 분할 이득이 없어 전체 스캔
+# (공백으로 구분된 숫자 표처럼 텍스트 대부분이 하나의 숫자 구간인 경우)
+DENSE_SPAN_RATIO = 0.5
+
+
+class _Unsupported(Exception):
+    """분석할 수 없는 정규식 구문 (필터 없이 항상 실행)"""
+
+
+def _scoped_ignore_case(av, ignore_case: bool) -> bool:
+    """SUBPATTERN 의 범위 지정 플래그((?i:...), (?-i:...))를 적용한 대소문자 무시 여부"""
+    add_flags, del_flags = av[1], av[2]
+    if add_flags & re.IGNORECASE:
+        return True
+    if del_flags & re.IGNORECASE:
+        return False
+    return ignore_case
+
+
+def _char_item(code: int, ignore_case: bool) -> Set[Tuple[str, bool]]:
+    """단일 문자를 문자 클래스 항목으로 변환"""
+    return {(re.escape(chr(code)), ignore_case)}
+
+
+def _class_items(items, ignore_case: bool) -> Set[Tuple[str, bool]]:
+    """IN 연산자 항목을 문자 클래스 항목으로 변환"""
+    result = set()
+    for op, av in items:
+        if op is _sre.LITERAL:
+            result |= _char_item(av, ignore_case)
+        elif op is _sre.RANGE:
+            result.add((f'{re.escape(chr(av[0]))}-{re.escape(chr(av[1]))}', ignore_case))
+        elif op is _sre.CATEGORY and av in _CATEGORY_CLASSES:
+            result.add((_CATEGORY_CLASSES[av], ignore_case))
+        else:
+            raise _Unsupported(op)
+    return result
+
+
+def _first_chars(items, ignore_case: bool) -> Tuple[Set[Tuple[str, bool]], bool]:
+    """
+    매치의 첫 글자가 될 수 있는 문자 클래스 항목 계산
+
+    대소문자 무시 구간의 항목은 (?i:[...]) 로 묶어 re 와 같은 대소문자 대응
+    (유니코드 특수 대응 포함)을 그대로 쓴다.
+
+    Returns:
+        ({(문자 클래스 항목, 대소문자 무시 여부)}, 빈 문자열 매치 가능 여부)
+    """
+    first = set()
+    for op, av in items:
+        if op in _ZERO_WIDTH:
+            continue
+        if op is _sre.LITERAL:
+            return first | _char_item(av, ignore_case), False
+        if op is _sre.IN:
+            return first | _class_items(av, ignore_case), False
+        if op is _sre.SUBPATTERN:
+            sub, nullable = _first_chars(av[-1], _scoped_ignore_case(av, ignore_case))
+        elif op is _sre.BRANCH:
+            sub, nullable = set(), False
+            for branch in av[1]:
+                branch_first, branch_nullable = _first_chars(branch, ignore_case)
+                sub |= branch_first
+                nullable = nullable or branch_nullable
+        elif op in _REPEATS:
+            sub, nullable = _first_chars(av[2], ignore_case)
+            nullable = nullable or av[0] == 0
+        else:
+            raise _Unsupported(op)
+        first |= sub
+        if not nullable:
+            return first, False
+    return first, True
+
+
+def _required_literals(items, ignore_case: bool) -> Set[str]:
+    """매치에 반드시 포함되는 리터럴 문자 (대소문자 무시 구간의 문자는 제외)"""
+    required = set()
+    for op, av in items:
+        if op is _sre.LITERAL:
+            if not ignore_case:
+                required.add(chr(av))
+        elif op is _sre.SUBPATTERN:
+            required |= _required_literals(av[-1], _scoped_ignore_case(av, ignore_case))
+        elif op in _REPEATS and av[0] > 0:
+            required |= _required_literals(av[2], ignore_case)
+    return required
+
+
+def _is_digit_item(op, av) -> bool:
+    """숫자 한 글자에만 매치되는 항목인지"""
+    if op is _sre.LITERAL:
+        return chr(av).isdigit()
+    if op is _sre.IN:
+        return all(
+            (item_op is _sre.LITERAL and chr(item_av).isdigit())
+            or (item_op is _sre.RANGE and chr(item_av[0]).isdigit() and chr(item_av[1]).isdigit())
+            or (item_op is _sre.CATEGORY and item_av == _sre.CATEGORY_DIGIT)
+            for item_op, item_av in av
+        )
+    return False
+
+
+def _is_separator_item(op, av) -> bool:
+    """공백 또는 하이픈 한 글자에만 매치되는 항목인지"""
+    if op is _sre.LITERAL:
+        return av == ord('-')
+    if op is _sre.IN:
+        return all(
+            (item_op is _sre.LITERAL and item_av == ord('-'))
+            or (item_op is _sre.CATEGORY and item_av == _sre.CATEGORY_SPACE)
+            for item_op, item_av in av
+        )
+    return False
+
+
+def _min_digits(items) -> int:
+    """
+    숫자/공백/하이픈으로만 이루어진 구문의 최소 숫자 개수
+
+    Raises:
+        _Unsupported: 다른 문자에 매치될 수 있는 구문
+    """
+    total = 0
+    for op, av in items:
+        if _is_digit_item(op, av):
+            total += 1
+        elif _is_separator_item(op, av):
+            continue
+        elif op is _sre.SUBPATTERN:
+            total += _min_digits(av[-1])
+        elif op is _sre.BRANCH:
+            total += min(_min_digits(branch) for branch in av[1])
+        elif op in _REPEATS:
+            total += av[0] * _min_digits(av[2])
+        else:
+            raise _Unsupported(op)
+    return total
+
+
+def _is_digit_boundary(op, av, direction: int) -> bool:
+    """(?<!\d) / (?!\d) 형태의 경계 검사인지"""
+    if op is not _sre.ASSERT_NOT or av[0] != direction:
+        return False
+    body = list(av[1])
+    return len(body) == 1 and _is_digit_item(*body[0])
+
+
+def _starts_with_digit(op, av) -> bool:
+    """첫 글자가 반드시 숫자인 항목인지"""
+    if _is_digit_item(op, av):
+        return True
+    if op in _REPEATS:
+        body = list(av[2])
+        return av[0] > 0 and len(body) == 1 and _is_digit_item(*body[0])
+    return False
+
+
+def _numeric_profile(pattern: str, flags: int) -> Optional[int]:
+    """
+    숫자 패턴 분석
+
+    숫자로 시작하고 숫자로 끝나며 그 사이에 숫자/공백/하이픈만 매치하는 패턴
+    (앞뒤 경계는 (?<!\d), (?!\d) 만 허용)이면 매치에 필요한 최소 숫자 개수를 반환한다.
+    이런 패턴의 매치는 항상 하나의 숫자 구간 안에 있으므로 구간 단위로 실행해도
+    전체 텍스트 finditer 와 결과가 같다.
+
+    Returns:
+        최소 숫자 개수 또는 None (숫자 패턴 아님)
+    """
+    try:
+        items = list(_sre_parse.parse(pattern, flags).data)
+        if items and _is_digit_boundary(*items[0], -1):
+            items = items[1:]
+        if items and _is_digit_boundary(*items[-1], 1):
+            items = items[:-1]
+        if not items or not _starts_with_digit(*items[0]) or not _starts_with_digit(*items[-1]):
+            return None
+        minimum = _min_digits(items)
+    except Exception:
+        return None
+    return minimum if minimum > 0 else None
+
+
+def _analyze(pattern: str, flags: int) -> Tuple[Optional[str], Set[str]]:
+    """
+    패턴의 사전 필터 정보 계산
+
+    Returns:
+        (시작 문자 클래스 정규식 또는 None, 필수 리터럴 문자 집합)
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+        ignore_case = bool(parsed.state.flags & re.IGNORECASE)
+        first, nullable = _first_chars(parsed.data, ignore_case)
+        required = _required_literals(parsed.data, ignore_case)
+    except Exception:
+        return None, set()
+    if nullable or not first:
+        return None, required
+
+    classes = []
+    exact = sorted(item for item, folded in first if not folded)
+    folded = sorted(item for item, folded in first if folded)
+    if exact:
+        classes.append('[' + ''.join(exact) + ']')
+    if folded:
+        classes.append('(?i:[' + ''.join(folded) + '])')
+    return '|'.join(classes), required
+
+
+class MultiPatternScanner:
+    """트리거 문자 사전 필터를 적용한 다중 패턴 스캐너"""
+
+    def __init__(self, patterns: List[Tuple[str, str, int]]):
+        """
+        Args:
+            patterns: (이름, 정규식, 플래그) 목록
+
+        Raises:
+            re.error: 유효하지 않은 정규식
+        """
+        self.names = [name for name, _, _ in patterns]
+        self._compiled = []
+        self._triggers: Dict[str, 're.Pattern'] = {}
+        # 숫자 패턴별 최소 숫자 개수 (숫자 패턴이 아니면 None)
+        self._min_digits: List[Optional[int]] = []
+
+        for name, pattern, flags in patterns:
+            compiled = pattern_registry.compile(pattern, flags)
+            trigger, required = _analyze(pattern, flags)
+            if trigger is not None and trigger not in self._triggers:
+                self._triggers[trigger] = pattern_registry.compile(trigger)
+            self._compiled.append((compiled, trigger, tuple(sorted(required))))
+            self._min_digits.append(_numeric_profile(pattern, flags))
+
+        numeric = [n for n in self._min_digits if n is not None]
+        self._digit_span_regex = (
+            pattern_registry.compile(_DIGIT_SPAN_TEMPLATE % (min(numeric) - 1))
+            if numeric else None
+        )
+
+    def _start_position(self, text: str, trigger: Optional[str],
+                        required: Tuple[str, ...], cache: Dict) -> int:
+        """패턴 스캔 시작 위치 (-1이면 매치 불가)"""
+        for ch in required:
+            if ch not in text:
+                return -1
+        if trigger is None:
+            return 0
+        if trigger not in cache:
+            match = self._triggers[trigger].search(text)
+            cache[trigger] = match.start() if match else -1
+        return cache[trigger]
+
+    def _digit_spans(self, text: str, cache: Dict) -> Optional[List[Tuple[int, int, int]]]:
+        """
+        숫자 구간 목록 (텍스트당 1회 계산)
+
+        Returns:
+            [(시작, 끝, 숫자 개수 상한), ...] 또는 None (숫자가 많아 전체 스캔이 유리한 경우)
+        """
+        if 'digit_spans' not in cache:
+            spans = []
+            covered = 0
+            for match in self._digit_span_regex.finditer(text):
+                span = match.group()
+                spans.append((
+                    match.start(), match.end(),
+                    len(span) - span.count(' ') - span.count('-')
+                ))
+                covered += len(span)
+            cache['digit_spans'] = None if covered >= len(text) * DENSE_SPAN_RATIO else spans
+        return cache['digit_spans']
+
+    def _iter_numeric(self, compiled, text: str, pos: int, min_digits: int,
+                      spans: List[Tuple[int, int, int]]):
+        """숫자 개수 조건을 채우는 숫자 구간에서만 finditer"""
+        for start, end, digits in spans:
+            if end <= pos or digits < min_digits:
+                continue
+            yield from compiled.finditer(text, max(start, pos), end)
+
+    def scan(self, text: str, positions: Optional[List[int]] = None,
+             limit: Optional[int] = None) -> Iterator[Tuple[int, int, int]]:
+        """
+        모든 패턴의 매치 반환
+
+        Args:
+            text: 대상 텍스트
+            positions: 패턴별 탐색 시작 위치 (스트리밍 탐지 시 이어서 탐색)
+            limit: 이 위치 이후에 시작하는 매치는 반환하지 않음
+
+        Returns:
+            (패턴 인덱스, 시작, 끝) 이터레이터 - 패턴별로는 finditer 순서 유지
+        """
+        cache = {}
+        for index, (compiled, _, _) in enumerate(self._compiled):
+            pos = positions[index] if positions is not None else 0
+            try:
+                spans = list(self._scan_pattern(index, text, pos, limit, cache))
+            except Exception as e:
+                # 사전 필터 오류로 매치를 놓치지 않도록 필터 없이 다시 탐색
+                logger.error(f"패턴 매칭 오류 ({self.names[index]}): {str(e)} - 전체 탐색으로 대체")
+                try:
+                    spans = list(self._bounded(compiled.finditer(text, pos), limit))
+                except Exception as e:
+                    logger.error(f"패턴 매칭 오류 ({self.names[index]}): {str(e)}")
+                    continue
+            for start, end in spans:
+                yield index, start, end
+
+    def _scan_pattern(self, index: int, text: str, pos: int, limit: Optional[int],
+                      cache: Dict) -> Iterator[Tuple[int, int]]:
+        """패턴 1개의 매치 범위 (사전 필터 / 숫자 구간 적용)"""
+        compiled, trigger, required = self._compiled[index]
+        start = self._start_position(text, trigger, required, cache)
+        if start < 0:
+            return
+        pos = max(pos, start)
+
+        matches = None
+        min_digits = self._min_digits[index]
+        if min_digits is not None:
+            spans = self._digit_spans(text, cache)
+            if spans is not None:
+                matches = self._iter_numeric(compiled, text, pos, min_digits, spans)
+        if matches is None:
+            matches = compiled.finditer(text, pos)
+        yield from self._bounded(matches, limit)
+
+    @staticmethod
+    def _bounded(matches: Iterable['re.Match'], limit: Optional[int]) -> Iterator[Tuple[int, int]]:
+        """limit 이전에 시작하는 매치 범위 (빈 매치는 탐지 결과로 의미가 없으므로 제외)"""
+        for match in matches:
+            if limit is not None and match.start() >= limit:
+                break
+            if match.end() > match.start():
+                yield match.start(), match.end()
+
+    def scan_by_name(self, text: str) -> Dict[str, List[Tuple[int, int]]]:
+        """
+        패턴 이름별 매치 목록 반환
+
+        Returns:
+            {이름: [(시작, 끝), ...]} - 패턴 등록 순서, 각 목록은 시작 위치 순
+        """
+        results = {name: [] for name in self.names}
+        for index, start, end in self.scan(text):
+            results[self.names[index]].append((start, end))
+        return results
+
+
+class PatternRegistry:
+    """
+    컴파일된 정규식 캐시 (모든 분석기 인스턴스가 공유)
+
+    re 모듈 내부 캐시는 크기가 작아 패턴이 많으면 재컴파일이 발생하므로
+    (패턴 문자열, 플래그) 기준으로 직접 보관한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._compiled: Dict[Tuple[str, int], 're.Pattern'] = {}
+        self._scanners: Dict[Tuple, MultiPatternScanner] = {}
+
+    def compile(self, pattern: str, flags: int = 0) -> 're.Pattern':
+        """
+        컴파일된 패턴 반환 (최초 1회만 컴파일)
+
+        Raises:
+            re.error: 유효하지 않은 정규식
+        """
+        key = (pattern, flags)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = re.compile(pattern, flags)
+            with self._lock:
+                compiled = self._compiled.setdefault(key, compiled)
+        return compiled
+
+    def scanner(self, patterns: Tuple[Tuple[str, str, int], ...]) -> MultiPatternScanner:
+        """
+        패턴 구성별 다중 패턴 스캐너 반환 (구성이 같으면 재사용)
+
+        Args:
+            patterns: (이름, 정규식, 플래그) 튜플
+        """
+        scanner = self._scanners.get(patterns)
+        if scanner is None:
+            scanner = MultiPatternScanner(list(patterns))
+            with self._lock:
+                scanner = self._scanners.setdefault(patterns, scanner)
+        return scanner
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._compiled.clear()
+            self._scanners.clear()
+
+
+# 프로세스 전역 레지스트리
+pattern_registry = PatternRegistry()
@@ -0,0 +1,158 @@
+"""
+단계 기반 진행률 / 상태 메시지 보고
+
+진행률을 고정 값과 지연(sleep)으로 흉내 내지 않고, 문서별 실제 처리 단계가 끝날 때
+계산한다. 단계마다 예상 소요 비중(가중치)을 두고, 완료된 단계의 가중치 합을
+전체(문서 수 × 가중치 합) 대비 비율로 보고한다.
+
+[단계] (ANALYSIS_STAGES)
+extract(텍스트 추출) → regex(정규식 탐지) → keywords(키워드 탐지) → llm(LLM 분석)
+→ score(결과 통합 / 위험도 확정)
+
+[전송 제한]
+상태 메시지와 진행률은 min_interval 에 한 번만 전송한다. 그 사이에 들어온 값은
+마지막 값만 남겨 두었다가 간격이 지나면 전송하므로(trailing) 마지막 상태가
+화면에 남는다. 여러 스레드(LLM 디스패처 등)에서 동시에 호출해도 된다.
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from utils.constants import PROGRESS_MIN_INTERVAL
+
+STAGE_EXTRACT = 'extract'
+STAGE_REGEX = 'regex'
+STAGE_KEYWORDS = 'keywords'
+STAGE_LLM = 'llm'
+STAGE_SCORE = 'score'
+
+# (단계, 가중치) - 가중치는 문서 1건 처리 시간 중 대략적인 비중
+ANALYSIS_STAGES: Tuple[Tuple[str, int], ...] = (
+    (STAGE_EXTRACT, 15),
+    (STAGE_REGEX, 15),
+    (STAGE_KEYWORDS, 10),
+    (STAGE_LLM, 50),
+    (STAGE_SCORE, 10),
+)
+
+
+class ProgressReporter:
+    """단계 완료 기반 진행률 + 전송 제한 상태 메시지 (스레드 안전)"""
+
+    def __init__(self, on_progress: Callable[[float], None],
+                 on_status: Optional[Callable[[str], None]] = None,
+                 units: int = 1, min_interval: float = PROGRESS_MIN_INTERVAL,
+                 stages: Sequence[Tuple[str, int]] = ANALYSIS_STAGES):
+        """
+        Args:
+            on_progress: 진행률 전송 (0.0 ~ 100.0)
+            on_status: 상태 메시지 전송
+            units: 처리할 문서 수
+            min_interval: 전송 최소 간격 (초)
+            stages: (단계, 가중치) 목록
+        """
+        self.on_progress = on_progress
+        self.on_status = on_status
+        self.min_interval = min_interval
+        self._weights: Dict[str, int] = dict(stages)
+        self._total = max(1, units) * sum(self._weights.values())
+        self._done: Dict[Tuple[int, str], float] = {}
+        self._completed = 0.0
+
+        self._lock = threading.Lock()
+        self._last_sent = 0.0
+        self._pending_status: Optional[str] = None
+        self._pending_progress: Optional[float] = None
+        self._sent_progress = -1.0
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    @property
+    def percent(self) -> float:
+        """현재 진행률 (0.0 ~ 100.0)"""
+        with self._lock:
+            return self._percent()
+
+    def _percent(self) -> float:
+        return min(100.0, self._completed * 100 / self._total)
+
+    def stage(self, name: str, fraction: float = 1.0, unit: int = 0):
+        """
+        단계 진행 기록 (진행률은 줄어들지 않음)
+
+        Args:
+            name: 단계 이름 (ANALYSIS_STAGES)
+            fraction: 단계 완료 비율 (0.0 ~ 1.0, 기본 완료)
+            unit: 문서 번호 (0 부터)
+        """
+        weight = self._weights.get(name)
+        if weight is None:
+            return
+        fraction = max(0.0, min(1.0, fraction))
+        with self._lock:
+            previous = self._done.get((unit, name), 0.0)
+            if fraction <= previous:
+                return
+            self._done[(unit, name)] = fraction
+            self._completed += (fraction - previous) * weight
+            self._pending_progress = self._percent()
+            self._send_or_schedule()
+
+    def complete_unit(self, unit: int = 0):
+        """문서 1건의 남은 단계를 모두 완료 처리 (실패 / 건너뛴 단계 포함)"""
+        for name in self._weights:
+            self.stage(name, 1.0, unit)
+
+    def status(self, message: str):
+        """상태 메시지 (전송 간격 안에 들어온 메시지는 마지막 것만 전송)"""
+        if self.on_status is None:
+            return
+        with self._lock:
+            self._pending_status = message
+            self._send_or_schedule()
+
+    def flush(self):
+        """보류 중인 진행률 / 상태 메시지 즉시 전송"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._send()
+
+    def discard(self):
+        """보류 중인 진행률 / 상태 메시지를 버리고 이후 전송 중단 (취소 시)"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending_status = None
+            self._pending_progress = None
+            self._closed = True
+
+    def _send_or_schedule(self):
+        """간격이 지났으면 전송, 아니면 남은 시간 뒤 전송 예약 (잠금 보유 상태에서 호출)"""
+        elapsed = time.monotonic() - self._last_sent
+        if elapsed >= self.min_interval:
+            self._send()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.min_interval - elapsed, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+            self._send()
+
+    def _send(self):
+        """보류 값 전송 (잠금 보유 상태에서 호출)"""
+        if self._closed:
+            return
+        self._last_sent = time.monotonic()
+        status, self._pending_status = self._pending_status, None
+        progress, self._pending_progress = self._pending_progress, None
+        if status is not None:
+            self.on_status(status)
+        if progress is not None and progress != self._sent_progress:
+            self._sent_progress = progress
+            self.on_progress(progress)
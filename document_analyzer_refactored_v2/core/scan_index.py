@@ -0,0 +1,134 @@
+"""
+증분 재검사 색인 (파일 지문 → 분석 결과)
+
+같은 폴더를 주기적으로 다시 일괄 분석할 때, 지난번 이후 바뀌지 않은 파일은 추출 / 분석하지
+않고 저장된 결과를 쓴다. 작업 기록(BatchJournal)과 같은 추가 전용 형식이지만 작업이 끝나도
+지우지 않고 여러 작업이 함께 쓴다.
+
+[키]
+파일 경로 → (크기, 수정 시각 ns, 내용 해시) + 결과 위치. 색인은 모델 이름, 커스텀 탐지기 설정,
+결과에 영향을 주는 LLM 설정(검증 모드 / 토큰 예산 / 라우팅 모델 - llm_settings)별로 따로 두므로
+설정을 바꾸면 모든 파일을 다시 분석한다.
+LLM 을 쓰는 분석에서 LLM 실패로 규칙 기반 결과를 쓴 파일은 기록하지 않는다 (다음 분석에서 다시 분석).
+
+[변경 확인] (FileResultStore.finished_entry)
+stat 만으로 판단하고 (크기가 다르면 변경, 크기 / 수정 시각이 같으면 동일),
+크기는 같고 수정 시각만 다를 때만 내용 해시를 계산한다. 내용이 같으면 수정 시각을
+갱신해 두어 다음 검사에서는 다시 해시하지 않는다.
+
+[압축]
+파일이 바뀔 때마다 줄이 추가되므로, 기록 줄 수가 살아 있는 항목 수의 COMPACT_RATIO 배를
+넘으면 최신 항목만 새 파일로 옮겨 적는다.
+"""
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+from core.batch_journal import FileResultStore, STATUS_DONE
+from utils.constants import SCAN_INDEX_DIR
+from utils.logger import logger
+
+# 압축 기준 (기록 줄 수 / 살아 있는 항목 수)
+COMPACT_RATIO = 2
+# 압축하지 않는 최소 기록 줄 수
+COMPACT_MIN_LINES = 1000
+
+
+def llm_settings(llm_verify: bool, llm_token_budget: int,
+                 router_models: Optional[Sequence[str]] = None) -> Dict:
+    """
+    색인 키에 넣을 LLM 설정
+
+    Args:
+        llm_verify: LLM 검증 모드 사용 여부
+        llm_token_budget: 문서당 LLM 토큰 예산
+        router_models: 모델 라우팅 대상 (빠른 모델, 정확한 모델) - 라우팅을 끄면 None
+    """
+    return {
+        'llm_verify': llm_verify,
+        'llm_token_budget': llm_token_budget,
+        'router_models': list(router_models) if router_models else None,
+    }
+
+
+class ScanIndex(FileResultStore):
+    """모델 / 탐지기 / LLM 설정별 증분 재검사 색인"""
+
+    def __init__(self, model_name: str, custom_patterns: Optional[Dict] = None,
+                 index_dir: str = SCAN_INDEX_DIR, llm_settings: Optional[Dict] = None):
+        """
+        Args:
+            model_name: 분석 모델
+            custom_patterns: 커스텀 탐지기 설정 (Config.get_custom_patterns)
+            index_dir: 색인 디렉토리
+            llm_settings: 결과에 영향을 주는 LLM 설정 (llm_settings(), LLM 을 쓰지 않으면 None)
+        """
+        digest = hashlib.sha256(model_name.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(json.dumps(custom_patterns or {}, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+        if llm_settings:
+            digest.update(b'\0')
+            digest.update(json.dumps(llm_settings, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+        super().__init__(Path(index_dir) / digest.hexdigest()[:32])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    def compact(self, force: bool = False) -> bool:
+        """
+        지난 항목을 버리고 파일별 최신 완료 항목만 다시 기록
+
+        Args:
+            force: 기준과 관계없이 압축
+
+        Returns:
+            압축 여부
+        """
+        with self._lock:
+            entries = self._load()
+            live = {path: e for path, e in entries.items() if e['status'] == STATUS_DONE}
+            if not force and (self._lines < COMPACT_MIN_LINES
+                              or self._lines < len(live) * COMPACT_RATIO):
+                return False
+
+            journal_tmp = self.path / (self.JOURNAL_FILE + '.tmp')
+            results_tmp = self.path / (self.RESULTS_FILE + '.tmp')
+            results_replaced = False
+            try:
+                with open(self.path / self.RESULTS_FILE, 'rb') as src, \
+                        open(results_tmp, 'wb') as results, \
+                        open(journal_tmp, 'w', encoding='utf-8') as journal:
+                    for path, entry in live.items():
+                        src.seek(entry['offset'])
+                        data = src.read(entry['length'])
+                        live[path] = entry = dict(entry, offset=results.tell())
+                        results.write(data)
+                        journal.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                os.replace(results_tmp, self.path / self.RESULTS_FILE)
+                results_replaced = True
+                os.replace(journal_tmp, self.path / self.JOURNAL_FILE)
+            except OSError as e:
+                logger.warning(f"증분 색인 압축 실패: {str(e)}")
+                if results_replaced:
+                    # 기존 기록 줄의 결과 위치가 맞지 않으므로 색인 폐기 (다음 분석 때 다시 구축)
+                    shutil.rmtree(self.path, ignore_errors=True)
+                    self._entries = None
+                for tmp in (journal_tmp, results_tmp):
+                    if tmp.exists():
+                        tmp.unlink()
+                return False
+
+            logger.info(f"증분 색인 압축: 기록 {self._lines}줄 → {len(live)}줄")
+            self._entries = live
+            self._lines = len(live)
+            self._torn = False
+            return True
+
+
+def clear_scan_indexes(index_dir: str = SCAN_INDEX_DIR):
+    """모든 증분 재검사 색인 삭제"""
+    shutil.rmtree(index_dir, ignore_errors=True)
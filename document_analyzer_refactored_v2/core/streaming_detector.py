@@ -0,0 +1,279 @@
+"""
+스트리밍 탐지 (대용량 텍스트)
+
+텍스트 전체를 하나의 문자열로 만들지 않고, 생성기에서 받은 청크를 버퍼에 이어 붙이며
+정규식 / 민감정보 키워드 탐지를 수행한다. 결과 위치는 문서 전체 기준 절대 위치로,
+전체 문자열 탐지(detect_sensitive_info_regex / detect_sensitive_keywords)와 동일하다.
+
+[겹침 여유분(margin)]
+버퍼 끝에서 margin 이내의 구간은 다음 청크가 도착할 때까지 확정하지 않는다.
+margin = 최대 매치 길이 + 가장 큰 문맥 범위(정규식 100자 / 키워드 150자 / 개인정보 지표 500자)
+
+- 정규식: 패턴별로 마지막 탐색 위치를 이어서 finditer → 전체 문자열과 같은 매치 집합
+- 우선순위 충돌: 후보의 채택 여부는 겹치는 상위 우선순위 후보에만 의존하므로,
+  겹치는 후보가 모두 확정된 후보부터 순서대로 결정
+- 키워드: 열린 클러스터를 청크 사이에 이어가며, 닫힌 클러스터만 개인 연결 확인
+
+[제약]
+- 매치 하나의 길이가 max_match_length 를 넘으면 (예: 수천 자의 공백을 사이에 둔 번호)
+  전체 문자열 탐지와 결과가 달라질 수 있다.
+- 키워드 클러스터가 이어지는 동안에는 클러스터 시작 부분부터 버퍼에 보관한다.
+- 소문자 변환 시 길이가 바뀌는 문자는 변환하지 않는다 (키워드 위치를 원문 위치와 일치시킴).
+"""
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.detection_result import DetectionResult
+from core.interval_index import IntervalIndex
+from utils.logger import logger
+
+
+# 청크 크기 기본값 (글자 수)
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# 매치 하나의 최대 길이 기본값 (글자 수)
+DEFAULT_MAX_MATCH_LENGTH = 1000
+
+
+def _lower_preserving_length(text: str) -> str:
+    """길이가 유지되는 소문자 변환"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return ''.join(
+        low if len(low) == 1 else ch
+        for ch, low in ((ch, ch.lower()) for ch in text)
+    )
+
+
+class StreamingDetector:
+    """청크 단위 스트리밍 탐지기"""
+
+    def __init__(self, analyzer, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_match_length: int = DEFAULT_MAX_MATCH_LENGTH):
+        """
+        Args:
+            analyzer: LocalLLMAnalyzer (패턴/검증/개인 연결 로직 공유)
+            chunk_size: 한 번에 처리할 최소 글자 수
+            max_match_length: 매치 하나의 최대 길이 (겹침 여유분 계산용)
+        """
+        self.analyzer = analyzer
+        self.margin = max_match_length + max(
+            analyzer.REGEX_CONTEXT_WINDOW,
+            analyzer.KEYWORD_CONTEXT_WINDOW,
+            analyzer.PERSONAL_INDICATOR_WINDOW
+        )
+        # 문서 머리 부분(개인정보 문서 여부 판단)이 첫 처리 구간에 포함되도록 보장
+        self.chunk_size = max(chunk_size, self.margin + analyzer.PERSONAL_INDICATOR_WINDOW)
+
+    def detect(self, chunks: Iterable[str]) -> DetectionResult:
+        """
+        청크 생성기를 끝까지 읽어 탐지 결과 반환
+
+        Returns:
+            DetectionResult (text 는 None - 전체 텍스트를 보관하지 않음)
+        """
+        regex_detected = []
+        keyword_detected = []
+        for item in self.iter_detect(chunks):
+            if item['method'] == 'regex':
+                regex_detected.append(item)
+            else:
+                keyword_detected.append(item)
+        regex_detected.sort(key=lambda x: x['start'])
+        return DetectionResult(None, regex_detected, keyword_detected)
+
+    def iter_detect(self, chunks: Iterable[str]) -> Iterator[Dict]:
+        """
+        탐지 항목을 확정되는 대로 반환
+
+        정규식 항목은 확정 순서(우선순위 순)로, 키워드 항목은 클러스터 순서로 나온다.
+        """
+        state = _StreamState(self.analyzer)
+        pieces = []
+        pending_size = 0
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+            pieces.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= self.chunk_size:
+                state.append(''.join(pieces))
+                pieces = []
+                pending_size = 0
+                yield from state.process(self.margin, final=False)
+
+        if pieces:
+            state.append(''.join(pieces))
+        yield from state.process(self.margin, final=True)
+
+
+class _StreamState:
+    """스트리밍 탐지 진행 상태"""
+
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+        self.scanner = analyzer._get_scanner()
+        self.type_names = self.scanner.names
+
+        self.buffer = ''        # 보관 중인 원문
+        self.lower = ''         # 보관 중인 소문자 변환 텍스트
+        self.base = 0           # buffer[0] 의 문서 내 위치
+        self.committed = 0      # 확정 처리된 위치
+
+        # 정규식 단계
+        self.resume = [0] * len(self.type_names)                  # 패턴별 다음 탐색 위치
+        self.pending: List[Tuple[int, int, int]] = []             # 미확정 후보 (유형 순번, 시작, 끝)
+        self.accepted = IntervalIndex()                           # 채택된 범위 (최근 구간)
+
+        # 키워드 단계
+        self.keyword_resume = 0
+        self.open_cluster: List[Dict] = []
+        self.personal_document: Optional[bool] = None
+
+    @property
+    def end(self) -> int:
+        """수신한 텍스트의 끝 위치"""
+        return self.base + len(self.buffer)
+
+    def append(self, text: str):
+        """청크 추가"""
+        self.buffer += text
+        self.lower += _lower_preserving_length(text)
+
+    def process(self, margin: int, final: bool) -> Iterator[Dict]:
+        """버퍼 끝 margin 이전 구간 확정 (final 이면 전체)"""
+        commit = self.end if final else self.end - margin
+        if commit <= self.committed and not final:
+            return
+
+        if self.personal_document is None:
+            self.personal_document = self.analyzer._is_personal_document(self.buffer)
+
+        yield from self._process_regex(commit, final)
+        yield from self._process_keywords(commit, final)
+
+        self.committed = commit
+        self._trim(commit)
+
+    # ------------------------------------------------------------
+    # 정규식 단계
+    # ------------------------------------------------------------
+    def _process_regex(self, commit: int, final: bool) -> Iterator[Dict]:
+        """정규식 후보 수집 및 우선순위 충돌 해결"""
+        base = self.base
+        positions = [pos - base for pos in self.resume]
+        limit = None if final else commit - base
+
+        for index, start, end in self.scanner.scan(self.buffer, positions, limit):
+            self.pending.append((index, start + base, end + base))
+            self.resume[index] = end + base
+        if not final:
+            self.resume = [max(pos, commit) for pos in self.resume]
+
+        # 우선순위 순서대로 확정 가능한 후보부터 결정
+        self.pending.sort()
+        undecided = []
+        for index, start, end in self.pending:
+            info_type = self.type_names[index]
+            overlap = self.accepted.find_overlap(start, end)
+            if overlap:
+                logger.debug(
+                    f"중복 제외: {info_type} '{self.buffer[start - base:end - base].strip()}' "
+                    f"(이미 {overlap[2]}로 탐지됨)"
+                )
+                continue
+
+            # 아직 모르는 후보 또는 미확정 상위 후보와 겹칠 수 있으면 보류
+            if (not final and end > commit) or any(
+                u_index < index and u_start < end and start < u_end
+                for u_index, u_start, u_end in undecided
+            ):
+                undecided.append((index, start, end))
+                continue
+
+            item = self.analyzer._make_regex_item(
+                self.buffer, info_type, start - base, end - base, base
+            )
+            if item:
+                self.accepted.add(start, end, info_type)
+                yield item
+
+        self.pending = undecided
+
+    # ------------------------------------------------------------
+    # 키워드 단계
+    # ------------------------------------------------------------
+    def _process_keywords(self, commit: int, final: bool) -> Iterator[Dict]:
+        """키워드 수집, 클러스터링 및 개인 연결 확인"""
+        analyzer = self.analyzer
+        base = self.base
+        gap = analyzer.KEYWORD_CLUSTER_GAP
+
+        matches = analyzer._find_keyword_matches(
+            self.buffer, self.lower, self.keyword_resume - base, base
+        )
+        self.keyword_resume = commit
+
+        closed = []
+        for match in matches:
+            if not final and match['start'] >= commit:
+                break
+            if self.open_cluster and match['start'] - self.open_cluster[-1]['end'] <= gap:
+                self.open_cluster.append(match)
+            else:
+                if self.open_cluster:
+                    closed.append(self.open_cluster)
+                self.open_cluster = [match]
+
+        # 이후 키워드가 이어 붙을 수 없으면 클러스터 종료
+        if self.open_cluster and (final or commit - self.open_cluster[-1]['end'] > gap):
+            closed.append(self.open_cluster)
+            self.open_cluster = []
+
+        if not closed:
+            return
+
+        connection_index = analyzer._build_personal_connection_index(
+            self.buffer, self.personal_document
+        )
+        for cluster in closed:
+            item = analyzer._make_keyword_item(self.buffer, cluster, connection_index, base)
+            if item:
+                yield item
+
+    # ------------------------------------------------------------
+    # 버퍼 정리
+    # ------------------------------------------------------------
+    def _trim(self, commit: int):
+        """더 이상 필요 없는 앞부분 제거"""
+        analyzer = self.analyzer
+        # 이후에 시작하는 후보/클러스터의 앞쪽 문맥 범위만큼 보관
+        keep_from = commit - max(
+            analyzer.REGEX_CONTEXT_WINDOW,
+            analyzer.KEYWORD_CONTEXT_WINDOW,
+            analyzer.PERSONAL_INDICATOR_WINDOW
+        )
+        if self.pending:
+            keep_from = min(
+                keep_from,
+                min(start for _, start, _ in self.pending) - analyzer.REGEX_CONTEXT_WINDOW
+            )
+        if self.open_cluster:
+            keep_from = min(
+                keep_from,
+                self.open_cluster[0]['start'] - analyzer.PERSONAL_INDICATOR_WINDOW
+            )
+        keep_from = max(keep_from, 0)
+
+        if keep_from > self.base:
+            cut = keep_from - self.base
+            self.buffer = self.buffer[cut:]
+            self.lower = self.lower[cut:]
+            self.base = keep_from
+            # 이후 후보와 겹칠 수 있는 범위만 유지
+            self.accepted = IntervalIndex(
+                (start, end, label)
+                for start, end, label in self.accepted.items()
+                if end > keep_from
+            )
@@ -0,0 +1,54 @@
+"""
+값 위치 색인 (LLM 탐지 값 → 문서 내 위치)
+
+LLM 이 보고한 값은 위치 정보가 없으므로 문서에서 찾아야 한다. 값마다 text.find 로
+찾으면 값 수 × 문서 길이만큼 훑고 첫 번째 등장만 찾게 되므로, 문서당 한 번
+모든 값을 다중 키워드 매처(KeywordMatcher)로 동시에 찾아 정규화 값 → 등장 위치
+목록을 만든다. 이후 값 하나의 위치 조회는 dict 조회 한 번이다.
+
+[정규화]
+앞뒤 공백 제거 + 소문자 변환 (문서 위치가 바뀌지 않도록 길이가 유지되는 변환만 사용)
+"""
+from typing import Dict, Iterable, List, Optional
+
+from core.keyword_matcher import KeywordMatcher
+from core.streaming_detector import _lower_preserving_length
+
+
+def normalize_value(value: str) -> str:
+    """값 정규화 (색인 / 중복 비교 키)"""
+    return _lower_preserving_length(value.strip())
+
+
+class ValueIndex:
+    """문서 1건의 정규화 값 → 등장 시작 위치 색인"""
+
+    def __init__(self, text: str, values: Iterable[str], text_lower: Optional[str] = None):
+        """
+        Args:
+            text: 문서 텍스트
+            values: 찾을 값 목록
+            text_lower: 길이 유지 소문자 변환된 텍스트 (이미 있으면 재사용)
+        """
+        keys = sorted({normalize_value(v) for v in values if v and v.strip()})
+        self._offsets: Dict[str, List[int]] = {key: [] for key in keys}
+        if not keys:
+            return
+
+        if text_lower is None:
+            text_lower = _lower_preserving_length(text)
+
+        # 같은 값의 겹치는 등장은 앞의 것만 사용 (마스킹 범위가 겹치지 않도록)
+        next_free: Dict[str, int] = {}
+        matcher = KeywordMatcher({'value': keys})
+        for start, (_, _, key) in matcher.find_all(text_lower):
+            if start >= next_free.get(key, 0):
+                self._offsets[key].append(start)
+                next_free[key] = start + len(key)
+
+    def offsets(self, value: str) -> List[int]:
+        """값의 모든 등장 시작 위치 (위치 순, 없으면 빈 목록)"""
+        return self._offsets.get(normalize_value(value), [])
+
+    def __contains__(self, value: str) -> bool:
+        return bool(self.offsets(value))
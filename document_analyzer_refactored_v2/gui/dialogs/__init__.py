@@ -6,10 +6,17 @@ from pathlib import Path
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox,
     QDialogButtonBox, QTableWidget, QTableWidgetItem, QPushButton,
-    QListWidget, QLineEdit, QTextBrowser, QMessageBox
+    QListWidget, QListWidgetItem, QLineEdit, QTextBrowser, QMessageBox,
+    QComboBox, QSpinBox
 )
 from PyQt5.QtCore import Qt
 from core import Config, AnalysisHistory, LocalLLMAnalyzer
+from core.custom_detectors import CustomDetector
+from core.llm_cache import get_llm_cache
+from core.scan_index import clear_scan_indexes
+from utils.constants import (
+    LEGAL_CATEGORY_DESCRIPTIONS, LLM_CHUNK_TOKENS, AVAILABLE_MODELS, OLLAMA_KEEP_ALIVE
+)
 
 # Ollama 설치 가이드 다이얼로그 import
 from .ollama_setup_dialog import OllamaSetupDialog
@@ -144,6 +151,103 @@ class SettingsDialog(QDialog):
         self.check_auto_save.setChecked(config.get_auto_save())
         layout.addWidget(self.check_auto_save)
         
+        # 대용량 문서 병렬 탐지 (다중 프로세스)
+        parallel_layout = QHBoxLayout()
+        self.check_parallel = QCheckBox("대용량 문서 병렬 탐지")
+        self.check_parallel.setChecked(config.get_parallel_detection())
+        parallel_layout.addWidget(self.check_parallel)
+        
+        # 0 = CPU 코어 수
+        self.spin_workers = QSpinBox()
+        self.spin_workers.setRange(0, 256)
+        self.spin_workers.setValue(config.get_detection_workers())
+        self.spin_workers.setSpecialValueText("프로세스: 자동")
+        self.spin_workers.setPrefix("프로세스: ")
+        parallel_layout.addWidget(self.spin_workers)
+        
+        layout.addLayout(parallel_layout)
+        
+        # 일괄 분석 동시 LLM 요청 수 (Ollama 서버 OLLAMA_NUM_PARALLEL 과 맞춤)
+        llm_layout = QHBoxLayout()
+        llm_layout.addWidget(QLabel("일괄 분석 동시 LLM 요청"))
+        self.spin_llm_concurrency = QSpinBox()
+        self.spin_llm_concurrency.setRange(1, 32)
+        self.spin_llm_concurrency.setValue(config.get_llm_concurrency())
+        self.spin_llm_concurrency.setSuffix("개")
+        llm_layout.addWidget(self.spin_llm_concurrency)
+        
+        # 문서당 LLM 토큰 예산 (긴 문서는 구간으로 나누어 예산 안에서 분석)
+        llm_layout.addWidget(QLabel("문서당 토큰 예산"))
+        self.spin_token_budget = QSpinBox()
+        self.spin_token_budget.setRange(LLM_CHUNK_TOKENS, 200000)
+        self.spin_token_budget.setSingleStep(LLM_CHUNK_TOKENS)
+        self.spin_token_budget.setValue(config.get_llm_token_budget())
+        llm_layout.addWidget(self.spin_token_budget)
+        llm_layout.addStretch()
+        
+        layout.addLayout(llm_layout)
+        
+        # LLM 분석 결과 캐시 (같은 문서 재분석 시 모델 호출 생략)
+        cache_layout = QHBoxLayout()
+        self.check_llm_cache = QCheckBox("LLM 분석 결과 캐시")
+        self.check_llm_cache.setChecked(config.get_llm_cache_enabled())
+        cache_layout.addWidget(self.check_llm_cache)
+        
+        btn_clear_cache = QPushButton("캐시 비우기")
+        btn_clear_cache.clicked.connect(self.clear_llm_cache)
+        cache_layout.addWidget(btn_clear_cache)
+        cache_layout.addStretch()
+        
+        layout.addLayout(cache_layout)
+        
+        # 일괄 분석 증분 재검사 (지난 분석 이후 바뀌지 않은 파일은 이전 결과 사용)
+        scan_layout = QHBoxLayout()
+        self.check_incremental_scan = QCheckBox("일괄 분석 증분 재검사 (바뀐 파일만 분석)")
+        self.check_incremental_scan.setChecked(config.get_incremental_scan())
+        scan_layout.addWidget(self.check_incremental_scan)
+        
+        btn_clear_scan_index = QPushButton("색인 비우기")
+        btn_clear_scan_index.clicked.connect(self.clear_scan_index)
+        scan_layout.addWidget(btn_clear_scan_index)
+        scan_layout.addStretch()
+        
+        layout.addLayout(scan_layout)
+        
+        # LLM 검증 모드 (규칙 기반 탐지 후보 주변만 보내 확인/오탐/추가 판정)
+        self.check_llm_verify = QCheckBox("LLM 검증 모드 (탐지 후보 주변만 전송)")
+        self.check_llm_verify.setChecked(config.get_llm_verify_mode())
+        layout.addWidget(self.check_llm_verify)
+        
+        # 문서별 모델 라우팅 (깨끗하거나 확실한 문서는 빠른 모델, 애매한 문서는 정확한 모델)
+        router_layout = QHBoxLayout()
+        self.check_model_routing = QCheckBox("문서별 모델 라우팅")
+        self.check_model_routing.setChecked(config.get_model_routing())
+        router_layout.addWidget(self.check_model_routing)
+        
+        fast_model, accurate_model = config.get_router_models()
+        router_layout.addWidget(QLabel("빠른 모델"))
+        self.combo_fast_model = self._create_model_combo(fast_model)
+        router_layout.addWidget(self.combo_fast_model)
+        router_layout.addWidget(QLabel("정확한 모델"))
+        self.combo_accurate_model = self._create_model_combo(accurate_model)
+        router_layout.addWidget(self.combo_accurate_model)
+        router_layout.addStretch()
+        
+        layout.addLayout(router_layout)
+        
+        # 모델 메모리 유지 시간 (Ollama keep_alive, 유휴 후 첫 분석의 모델 적재 대기 방지)
+        keep_alive_layout = QHBoxLayout()
+        keep_alive_layout.addWidget(QLabel("모델 메모리 유지 시간"))
+        self.combo_keep_alive = QComboBox()
+        self.combo_keep_alive.setEditable(True)
+        self.combo_keep_alive.addItems(["5m", "30m", "1h", "-1"])
+        self.combo_keep_alive.setCurrentText(config.get_ollama_keep_alive())
+        self.combo_keep_alive.setToolTip("예: 30m, 1h, 600 (초), -1 (무기한)")
+        keep_alive_layout.addWidget(self.combo_keep_alive)
+        keep_alive_layout.addStretch()
+        
+        layout.addLayout(keep_alive_layout)
+        
         layout.addWidget(QLabel("\n커스텀 민감정보 패턴:"))
         
         pattern_layout = QHBoxLayout()
@@ -155,11 +259,40 @@ class SettingsDialog(QDialog):
         self.input_pattern_regex.setPlaceholderText("정규식 패턴")
         pattern_layout.addWidget(self.input_pattern_regex)
         
+        layout.addLayout(pattern_layout)
+        
+        # 탐지기 옵션: 법적 분류 / 우선순위 / 가중치
+        option_layout = QHBoxLayout()
+        self.combo_legal_category = QComboBox()
+        self.combo_legal_category.addItems(list(LEGAL_CATEGORY_DESCRIPTIONS.keys()))
+        self.combo_legal_category.setCurrentText("일반개인정보")
+        option_layout.addWidget(self.combo_legal_category)
+        
+        # -1 = 자동 (내장 유형 뒤)
+        self.spin_priority = QSpinBox()
+        self.spin_priority.setRange(-1, 99)
+        self.spin_priority.setValue(-1)
+        self.spin_priority.setSpecialValueText("우선순위: 자동")
+        self.spin_priority.setPrefix("우선순위: ")
+        option_layout.addWidget(self.spin_priority)
+        
+        # -1 = 법적 분류 기본 가중치
+        self.spin_weight = QSpinBox()
+        self.spin_weight.setRange(-1, 100)
+        self.spin_weight.setValue(-1)
+        self.spin_weight.setSpecialValueText("가중치: 기본")
+        self.spin_weight.setPrefix("가중치: ")
+        option_layout.addWidget(self.spin_weight)
+        
         btn_add_pattern = QPushButton("추가")
         btn_add_pattern.clicked.connect(self.add_custom_pattern)
-        pattern_layout.addWidget(btn_add_pattern)
+        option_layout.addWidget(btn_add_pattern)
         
-        layout.addLayout(pattern_layout)
+        btn_remove_pattern = QPushButton("삭제")
+        btn_remove_pattern.clicked.connect(self.remove_custom_pattern)
+        option_layout.addWidget(btn_remove_pattern)
+        
+        layout.addLayout(option_layout)
         
         self.pattern_list = QListWidget()
         self.load_custom_patterns()
@@ -205,9 +338,19 @@ class SettingsDialog(QDialog):
     
     def load_custom_patterns(self):
         """커스텀 패턴 로드"""
-        patterns = self.config.get_custom_patterns()
-        for name, pattern in patterns.items():
-            self.pattern_list.addItem(f"{name}: {pattern}")
+        for detector in self.analyzer.custom_detectors.values():
+            self._add_pattern_item(detector)
+    
+    def _add_pattern_item(self, detector: CustomDetector):
+        """패턴 목록에 탐지기 추가 (같은 이름이면 교체)"""
+        for i in range(self.pattern_list.count()):
+            if self.pattern_list.item(i).data(Qt.ItemDataRole.UserRole)[0] == detector.name:
+                self.pattern_list.takeItem(i)
+                break
+        
+        item = QListWidgetItem(detector.describe())
+        item.setData(Qt.ItemDataRole.UserRole, (detector.name, detector.to_config()))
+        self.pattern_list.addItem(item)
     
     def add_custom_pattern(self):
         """커스텀 패턴 추가"""
@@ -218,21 +361,79 @@ class SettingsDialog(QDialog):
             QMessageBox.warning(self, '경고', '이름과 패턴을 모두 입력하세요.')
             return
         
-        if self.analyzer.add_custom_pattern(name, pattern):
-            self.pattern_list.addItem(f"{name}: {pattern}")
+        priority = self.spin_priority.value()
+        weight = self.spin_weight.value()
+        
+        if self.analyzer.add_custom_pattern(
+            name, pattern,
+            priority=None if priority < 0 else priority,
+            legal_category=self.combo_legal_category.currentText(),
+            weight=None if weight < 0 else weight
+        ):
+            self._add_pattern_item(self.analyzer.custom_detectors[name])
             self.input_pattern_name.clear()
             self.input_pattern_regex.clear()
             QMessageBox.information(self, '성공', '패턴이 추가되었습니다.')
         else:
             QMessageBox.warning(self, '오류', '유효하지 않은 정규식 패턴입니다.')
     
+    def remove_custom_pattern(self):
+        """선택한 커스텀 패턴 삭제"""
+        row = self.pattern_list.currentRow()
+        if row < 0:
+            return
+        
+        name = self.pattern_list.item(row).data(Qt.ItemDataRole.UserRole)[0]
+        self.analyzer.remove_detector(name)
+        self.pattern_list.takeItem(row)
+    
+    def clear_llm_cache(self):
+        """LLM 분석 결과 캐시 삭제"""
+        cache = get_llm_cache()
+        count = len(cache)
+        cache.clear()
+        QMessageBox.information(self, '완료', f'LLM 캐시 {count}개 항목을 삭제했습니다.')
+
+    def clear_scan_index(self):
+        """증분 재검사 색인 삭제 (다음 일괄 분석은 모든 파일 분석)"""
+        clear_scan_indexes()
+        QMessageBox.information(self, '완료', '증분 재검사 색인을 삭제했습니다.')
+
+    @staticmethod
+    def _create_model_combo(current_model: str) -> QComboBox:
+        """모델 선택 콤보박스 (실제 모델명은 데이터로 저장)"""
+        combo = QComboBox()
+        for model_name in AVAILABLE_MODELS:
+            combo.addItem(model_name, model_name)
+        index = combo.findData(current_model)
+        combo.setCurrentIndex(max(index, 0))
+        return combo
+
+    def _store_settings(self):
+        """화면의 설정 값 저장 (apply_settings / save_settings 공통, 커스텀 패턴 제외)"""
+        self.config.set_dark_mode(self.check_dark.isChecked())
+        self.config.set_auto_save(self.check_auto_save.isChecked())
+        self.config.set_parallel_detection(self.check_parallel.isChecked())
+        self.config.set_detection_workers(self.spin_workers.value())
+        self.config.set_llm_concurrency(self.spin_llm_concurrency.value())
+        self.config.set_llm_token_budget(self.spin_token_budget.value())
+        self.config.set_llm_cache_enabled(self.check_llm_cache.isChecked())
+        self.config.set_incremental_scan(self.check_incremental_scan.isChecked())
+        self.config.set_llm_verify_mode(self.check_llm_verify.isChecked())
+        self.config.set_model_routing(self.check_model_routing.isChecked())
+        self.config.set_router_models(
+            self.combo_fast_model.currentData(), self.combo_accurate_model.currentData()
+        )
+        self.config.set_ollama_keep_alive(
+            self.combo_keep_alive.currentText().strip() or OLLAMA_KEEP_ALIVE
+        )
+
     def apply_settings(self):
         """설정 즉시 적용 (저장하지 않고 미리보기)"""
         # 다크모드 설정 저장 및 즉시 적용
         dark_mode_changed = self.config.get_dark_mode() != self.check_dark.isChecked()
         
-        self.config.set_dark_mode(self.check_dark.isChecked())
-        self.config.set_auto_save(self.check_auto_save.isChecked())
+        self._store_settings()
         
         # 부모 윈도우의 테마 적용
         if dark_mode_changed and self.parent():
@@ -241,15 +442,12 @@ class SettingsDialog(QDialog):
     
     def save_settings(self):
         """설정 저장 및 닫기"""
-        self.config.set_dark_mode(self.check_dark.isChecked())
-        self.config.set_auto_save(self.check_auto_save.isChecked())
+        self._store_settings()
         
         patterns = {}
         for i in range(self.pattern_list.count()):
-            item_text = self.pattern_list.item(i).text()
-            if ': ' in item_text:
-                name, pattern = item_text.split(': ', 1)
-                patterns[name] = pattern
+            name, detector_config = self.pattern_list.item(i).data(Qt.ItemDataRole.UserRole)
+            patterns[name] = detector_config
         
         self.config.set_custom_patterns(patterns)
         
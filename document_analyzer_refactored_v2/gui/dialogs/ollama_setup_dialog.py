@@ -9,7 +9,7 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont, QPixmap
-import requests
+from core.ollama_client import get_ollama_client
 
 
 class OllamaSetupDialog(QDialog):
@@ -205,8 +205,8 @@ class OllamaSetupDialog(QDialog):
     def check_ollama_status(self):
         """Ollama 설치 상태 확인"""
         try:
-            response = requests.get("http://localhost:11434/api/tags", timeout=2)
-            if response.status_code == 200:
+            # 설치 진행 중 확인이므로 캐시를 쓰지 않고 새로 조회 (결과는 공유 캐시에 반영)
+            if get_ollama_client().probe(timeout=2, max_age=0).running:
                 self.status_label.setText("✅ Ollama가 정상적으로 설치되어 있습니다!")
                 self.status_label.setStyleSheet("""
                     QLabel {
@@ -6,6 +6,7 @@ import json
 import csv
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QTextEdit, QFileDialog, QProgressBar, QComboBox,
@@ -15,10 +16,13 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import QTimer, Qt
 from PyQt5.QtGui import QFont, QTextCharFormat, QColor, QTextCursor, QDragEnterEvent, QDropEvent
-import requests
 
 from core import Config, AnalysisHistory, LocalLLMAnalyzer
-from threads import AnalysisThread, BatchAnalysisThread
+from core.batch_journal import BatchJournal
+from core.ollama_client import get_ollama_client
+from core.model_router import ModelRouter
+from core.scan_index import ScanIndex, llm_settings
+from threads import AnalysisThread, BatchAnalysisThread, ModelWarmupThread
 from gui.widgets import DropLabel
 from gui.dialogs import ExportDialog, HistoryDialog, SettingsDialog, AboutDialog, OllamaSetupDialog
 from utils.constants import AVAILABLE_MODELS, SUPPORTED_EXTENSIONS, RISK_COLORS, HIGHLIGHT_COLORS
@@ -40,6 +44,7 @@ class DocumentAnalyzerGUI(QMainWindow):
         self.batch_files = []
         self.batch_results = {}  # {filename: {result, detected, text, file_path}}
         self.batch_thread = None
+        self.warmup_threads = set()
         
         self.setAcceptDrops(True)
         
@@ -193,6 +198,8 @@ class DocumentAnalyzerGUI(QMainWindow):
             # 마지막 모델이 없으면 첫 번째 모델 선택
             self.combo_model.setCurrentIndex(0)
         
+        # 모델을 바꾸면 미리 적재 (첫 분석이 적재 시간 때문에 타임아웃되지 않도록)
+        self.combo_model.currentIndexChanged.connect(self.warm_up_selected_model)
         layout.addWidget(self.combo_model)
         
         self.btn_analyze = QPushButton("🔍 분석 시작")
@@ -554,27 +561,41 @@ class DocumentAnalyzerGUI(QMainWindow):
     
     def check_ollama_status(self):
         """Ollama 상태 확인"""
-        try:
-            response = requests.get("http://localhost:11434/api/tags", timeout=2)
-            if response.status_code == 200:
-                self.ollama_status.setText("✅ Ollama: 연결됨")
-                self.ollama_status.setStyleSheet("color: green;")
-            else:
-                self.ollama_status.setText("⚠️ Ollama: 오류")
-                self.ollama_status.setStyleSheet("color: orange;")
-        except:
+        # 분석 스레드와 같은 상태 캐시 사용 (TTL 이내면 서버에 요청하지 않음)
+        status = get_ollama_client().probe(timeout=2)
+        if status.running:
+            self.ollama_status.setText("✅ Ollama: 연결됨")
+            self.ollama_status.setStyleSheet("color: green;")
+        elif status.status_code is not None:
+            self.ollama_status.setText("⚠️ Ollama: 오류")
+            self.ollama_status.setStyleSheet("color: orange;")
+        else:
             self.ollama_status.setText("❌ Ollama: 연결 안됨")
             self.ollama_status.setStyleSheet("color: red;")
     
+    def warm_up_selected_model(self):
+        """선택한 모델을 백그라운드에서 적재"""
+        model = self.combo_model.currentData()
+        if not model:
+            return
+        thread = ModelWarmupThread(model, self.config.get_ollama_keep_alive())
+        thread.model_loaded.connect(self.model_warmup_finished)
+        thread.finished.connect(lambda: self.warmup_threads.discard(thread))
+        self.warmup_threads.add(thread)
+        thread.start()
+    
+    def model_warmup_finished(self, model: str, success: bool):
+        """모델 적재 완료"""
+        if success:
+            self.status_label.setText(f"모델 적재 완료: {model}")
+        else:
+            self.status_label.setText(f"모델 적재 실패: {model}")
+    
     def check_initial_ollama_setup(self):
         """애플리케이션 시작 시 Ollama 설치 확인"""
-        try:
-            response = requests.get("http://localhost:11434/api/tags", timeout=3)
-            if response.status_code == 200:
-                # Ollama가 설치되어 있고 실행 중
-                return
-        except:
-            pass
+        if get_ollama_client().probe(timeout=3).running:
+            # Ollama가 설치되어 있고 실행 중
+            return
         
         # Ollama가 설치되지 않았거나 실행되지 않는 경우
         # 설정에서 "다시 묻지 않기"가 설정되어 있는지 확인
@@ -635,7 +656,15 @@ class DocumentAnalyzerGUI(QMainWindow):
             # 실제 모델명 가져오기 (itemData에 저장된 값)
             model = self.combo_model.currentData()
             self.config.set_last_model(model)
-            self.analysis_thread = AnalysisThread(self.current_file, model)
+            self.analysis_thread = AnalysisThread(
+                self.current_file, model, self.config.get_custom_patterns(),
+                parallel_workers=self.config.get_parallel_workers(),
+                llm_token_budget=self.config.get_llm_token_budget(),
+                use_llm_cache=self.config.get_llm_cache_enabled(),
+                llm_verify=self.config.get_llm_verify_mode(),
+                model_router=self._create_model_router(),
+                keep_alive=self.config.get_ollama_keep_alive()
+            )
             self.analysis_thread.progress.connect(self.update_progress)
             self.analysis_thread.finished.connect(self.analysis_finished)
             self.analysis_thread.error.connect(self.analysis_error)
@@ -648,6 +677,13 @@ class DocumentAnalyzerGUI(QMainWindow):
             self.restore_ui_state()
             QMessageBox.critical(self, '오류', f'분석 시작 중 오류가 발생했습니다:\n{str(e)}')
     
+    def _create_model_router(self):
+        """설정에 따른 모델 라우터 (라우팅을 끄면 None - 선택한 모델만 사용)"""
+        if not self.config.get_model_routing():
+            return None
+        fast_model, accurate_model = self.config.get_router_models()
+        return ModelRouter(fast_model, accurate_model)
+    
     def update_progress(self, value: int):
         """진행률 업데이트"""
         self.progress_bar.setValue(value)
@@ -667,7 +703,7 @@ class DocumentAnalyzerGUI(QMainWindow):
         
         # 이력 저장 (분석 결과, 탐지 항목, 문서 텍스트, LLM 모델 포함)
         filename = Path(self.current_file).name
-        current_model = self.combo_model.currentData()
+        current_model = analysis_result.get('llm_model', self.combo_model.currentData())
         self.history.add_record(filename, analysis_result, len(detected_items), detected_items, text, current_model)
         
         # 자동 저장
@@ -828,7 +864,10 @@ class DocumentAnalyzerGUI(QMainWindow):
     
     def show_settings(self):
         """설정 표시"""
-        analyzer = LocalLLMAnalyzer(self.combo_model.currentText())
+        analyzer = LocalLLMAnalyzer(
+            self.combo_model.currentText(),
+            custom_patterns=self.config.get_custom_patterns()
+        )
         dialog = SettingsDialog(self, self.config, analyzer)
         dialog.exec()
     
@@ -1235,6 +1274,10 @@ class DocumentAnalyzerGUI(QMainWindow):
         if not self.batch_files:
             return
         
+        model = self.combo_model.currentData()
+        journal = self._open_batch_journal(model)
+        model_router = self._create_model_router()
+        
         self.btn_start_batch.setVisible(False)
         self.btn_cancel_batch.setVisible(True)
         self.batch_progress_bar.setValue(0)
@@ -1243,8 +1286,18 @@ class DocumentAnalyzerGUI(QMainWindow):
         self.status_message_label.setVisible(True)
         self.status_message_label.setText("🚀 일괄 분석 시작...")
         
-        model = self.combo_model.currentData()
-        self.batch_thread = BatchAnalysisThread(self.batch_files, model)
+        self.batch_thread = BatchAnalysisThread(
+            self.batch_files, model, self.config.get_custom_patterns(),
+            parallel_workers=self.config.get_parallel_workers(),
+            llm_concurrency=self.config.get_llm_concurrency(),
+            llm_token_budget=self.config.get_llm_token_budget(),
+            use_llm_cache=self.config.get_llm_cache_enabled(),
+            llm_verify=self.config.get_llm_verify_mode(),
+            model_router=model_router,
+            keep_alive=self.config.get_ollama_keep_alive(),
+            journal=journal,
+            scan_index=self._open_scan_index(model, model_router)
+        )
         self.batch_thread.file_progress.connect(self.update_batch_progress)
         self.batch_thread.detailed_progress.connect(self.update_detailed_batch_progress)  # 세밀한 진행률 연결
         self.batch_thread.file_finished.connect(self.batch_file_finished)
@@ -1252,10 +1305,35 @@ class DocumentAnalyzerGUI(QMainWindow):
         self.batch_thread.status_message.connect(self.update_status_message)  # 상태 메시지 시그널 연결
         self.batch_thread.start()
     
+    def _open_scan_index(self, model: str, model_router) -> Optional[ScanIndex]:
+        """증분 재검사 색인 (모델 / 탐지기 / LLM 설정별, 사용하지 않으면 None)"""
+        if not self.config.get_incremental_scan():
+            return None
+        router_models = (model_router.fast_model, model_router.accurate_model) if model_router else None
+        return ScanIndex(model, self.config.get_custom_patterns(), llm_settings=llm_settings(
+            self.config.get_llm_verify_mode(), self.config.get_llm_token_budget(), router_models
+        ))
+    
+    def _open_batch_journal(self, model: str) -> BatchJournal:
+        """같은 파일 목록 / 모델의 중단된 작업 기록이 있으면 이어서 분석할지 확인"""
+        journal = BatchJournal(self.batch_files, model)
+        completed = journal.completed_count()
+        if completed:
+            reply = QMessageBox.question(
+                self,
+                '이어서 분석',
+                f'중단된 일괄 분석 기록이 있습니다 ({completed}/{len(self.batch_files)}개 완료).\n\n'
+                '완료된 파일은 건너뛰고 이어서 분석하시겠습니까?\n'
+                '※ "아니오"를 선택하면 처음부터 다시 분석합니다.',
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.Yes
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                journal.remove()
+        return journal
+    
     def update_batch_progress(self, current: int, total: int, filename: str):
-        """일괄 분석 진행"""
-        progress = int((current / total) * 100)
-        self.batch_progress_bar.setValue(progress)
+        """일괄 분석 진행 (진행률 막대는 단계 기반 detailed_progress 가 담당)"""
         self.label_batch_status.setText(f"분석 중: {filename} ({current}/{total})")
     
     def update_detailed_batch_progress(self, progress: float):
@@ -1280,7 +1358,7 @@ class DocumentAnalyzerGUI(QMainWindow):
         self.batch_table.setItem(row, 1, QTableWidgetItem(result.get('risk_level', '-')))
         self.batch_table.setItem(row, 2, QTableWidgetItem(str(result.get('risk_score', 0))))
         self.batch_table.setItem(row, 3, QTableWidgetItem(str(len(detected))))
-        self.batch_table.setItem(row, 4, QTableWidgetItem("✅ 완료"))
+        self.batch_table.setItem(row, 4, QTableWidgetItem("↩️ 이전 결과" if result.get('resumed') else "✅ 완료"))
         
         # "보기" 버튼 추가
         btn_view = QPushButton("보기")
@@ -1311,8 +1389,10 @@ class DocumentAnalyzerGUI(QMainWindow):
         self.batch_table.setCellWidget(row, 5, btn_view)
         
         # 이력 저장 (분석 결과, 탐지 항목, 문서 텍스트, LLM 모델 포함)
-        current_model = self.combo_model.currentData()
-        self.history.add_record(filename, result, len(detected), detected, text, current_model)
+        # 이전 작업에서 복원한 결과는 그때 이미 저장됨
+        if not result.get('resumed'):
+            current_model = result.get('llm_model', self.combo_model.currentData())
+            self.history.add_record(filename, result, len(detected), detected, text, current_model)
     
     def batch_all_finished(self):
         """일괄 분석 완료"""
@@ -4,6 +4,7 @@
 엔트리 포인트
 """
 import sys
+import multiprocessing
 from PyQt5.QtWidgets import QApplication
 from gui import DocumentAnalyzerGUI
 
@@ -28,4 +29,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # 병렬 탐지 작업 프로세스 (PyInstaller 실행 파일 포함)
+    multiprocessing.freeze_support()
     main()
@@ -3,5 +3,6 @@
 """
 from .analysis_thread import AnalysisThread
 from .batch_thread import BatchAnalysisThread
+from .warmup_thread import ModelWarmupThread
 
-__all__ = ['AnalysisThread', 'BatchAnalysisThread']
+__all__ = ['AnalysisThread', 'BatchAnalysisThread', 'ModelWarmupThread']
@@ -1,9 +1,12 @@
 """
 단일 파일 분석 스레드
 """
-import time
+from typing import Dict, Optional
 from PyQt5.QtCore import QThread, pyqtSignal
 from core import DocumentProcessor, LocalLLMAnalyzer
+from core.model_router import ModelRouter
+from core.progress import ProgressReporter, STAGE_EXTRACT, STAGE_LLM, STAGE_SCORE
+from utils.constants import LLM_TOKEN_BUDGET, OLLAMA_KEEP_ALIVE
 
 
 class AnalysisThread(QThread):
@@ -14,10 +17,21 @@ class AnalysisThread(QThread):
     error = pyqtSignal(str)
     status_message = pyqtSignal(str)  # 상태 메시지 시그널 추가
     
-    def __init__(self, file_path: str, model_name: str):
+    def __init__(self, file_path: str, model_name: str, custom_patterns: Optional[Dict] = None,
+                 parallel_workers: int = 0, llm_token_budget: int = LLM_TOKEN_BUDGET,
+                 use_llm_cache: bool = True, llm_verify: bool = True,
+                 model_router: Optional[ModelRouter] = None,
+                 keep_alive: str = OLLAMA_KEEP_ALIVE):
         super().__init__()
         self.file_path = file_path
         self.model_name = model_name
+        self.custom_patterns = custom_patterns or {}
+        self.parallel_workers = parallel_workers
+        self.llm_token_budget = llm_token_budget
+        self.use_llm_cache = use_llm_cache
+        self.llm_verify = llm_verify
+        self.model_router = model_router
+        self.keep_alive = keep_alive
         self._is_cancelled = False
     
     def cancel(self):
@@ -25,85 +39,79 @@ class AnalysisThread(QThread):
         self._is_cancelled = True
     
     def run(self):
-        """스레드 실행"""
+        """
+        스레드 실행
+        
+        진행률은 실제 처리 단계(추출 → 정규식 → 키워드 → LLM → 통합) 완료 기준으로
+        계산하고, 진행률 / 상태 메시지는 ProgressReporter 가 전송 간격을 제한한다.
+        """
+        reporter = ProgressReporter(
+            lambda percent: self.progress.emit(int(percent)), self.status_message.emit
+        )
         try:
-            if self._is_cancelled:
-                return
-            
-            # 시작
-            self.status_message.emit("🚀 분석 준비 중...")
-            self.progress.emit(5)
-            time.sleep(0.8)  # 사용자가 볼 수 있도록 딜레이
-            
             if self._is_cancelled:
                 return
             
             # 텍스트 추출
-            self.status_message.emit("📄 문서에서 텍스트 추출 중...")
-            self.progress.emit(15)
-            time.sleep(0.5)
+            reporter.status("📄 문서에서 텍스트 추출 중...")
             processor = DocumentProcessor()
-            text = processor.extract_text(self.file_path)
-            self.progress.emit(25)
-            time.sleep(0.5)
+            text, boundaries = processor.extract_text_with_boundaries(self.file_path)
+            reporter.stage(STAGE_EXTRACT)
             
             if self._is_cancelled:
                 return
             
             # 분석기 초기화
-            self.status_message.emit("🔧 분석기 초기화 중...")
-            self.progress.emit(35)
-            time.sleep(0.5)
-            analyzer = LocalLLMAnalyzer(self.model_name, status_callback=self._status_callback)
-            self.progress.emit(45)
-            time.sleep(0.3)
+            analyzer = LocalLLMAnalyzer(
+                self.model_name,
+                status_callback=reporter.status,
+                custom_patterns=self.custom_patterns,
+                parallel_workers=self.parallel_workers,
+                llm_token_budget=self.llm_token_budget,
+                use_llm_cache=self.use_llm_cache,
+                llm_verify=self.llm_verify,
+                model_router=self.model_router,
+                keep_alive=self.keep_alive,
+                stage_callback=reporter.stage
+            )
             
             # Ollama 연결 확인
-            self.status_message.emit("🔗 Ollama 서버 연결 확인 중...")
-            self.progress.emit(50)
-            time.sleep(0.5)
+            reporter.status("🔗 Ollama 서버 연결 확인 중...")
             connected, msg = analyzer.check_ollama_connection()
             if not connected:
-                self.status_message.emit("❌ Ollama 연결 실패")
+                reporter.status("❌ Ollama 연결 실패")
+                reporter.flush()
                 self.error.emit(f"Ollama 연결 실패: {msg}")
                 return
             
             if self._is_cancelled:
                 return
             
-            # 분석 실행
-            self.status_message.emit("🔍 규칙 기반 분석 시작...")
-            self.progress.emit(60)
-            time.sleep(0.5)
-            analysis_result, detected_items = analyzer.comprehensive_analysis(text)
-            
+            # 분석 실행 (comprehensive_analysis 단계별 호출 - 단계 사이에서 취소 확인)
+            detection, rule_based_analysis = analyzer.prepare_analysis(text, boundaries)
             if self._is_cancelled:
                 return
             
-            # 분석 완료 후 진행률을 서서히 100%까지 증가
-            self.status_message.emit("📊 분석 결과 정리 중...")
-            for i in range(85, 96, 2):
-                if self._is_cancelled:
-                    return
-                self.progress.emit(i)
-                time.sleep(0.2)
+            llm_analysis = analyzer.run_llm_analysis(text, detection)
+            reporter.stage(STAGE_LLM)
+            if self._is_cancelled:
+                return
             
-            self.status_message.emit("✅ 분석 완료")
-            for i in range(96, 101):
-                if self._is_cancelled:
-                    return
-                self.progress.emit(i)
-                time.sleep(0.1)
+            reporter.status("📊 분석 결과 정리 중...")
+            analysis_result, detected_items = analyzer.finish_analysis(
+                text, detection, rule_based_analysis, llm_analysis
+            )
+            reporter.stage(STAGE_SCORE)
             
-            time.sleep(0.5)  # 완료 메시지를 볼 수 있도록
+            reporter.status("✅ 분석 완료")
+            reporter.flush()
             self.finished.emit(analysis_result, detected_items, text)
             
         except Exception as e:
             if not self._is_cancelled:
-                self.status_message.emit("❌ 분석 중 오류 발생")
+                reporter.status("❌ 분석 중 오류 발생")
+                reporter.flush()
                 self.error.emit(f"분석 오류: {str(e)}")
-    
-    def _status_callback(self, message: str):
-        """분석기에서 오는 상태 메시지 처리"""
-        self.status_message.emit(message)
-        time.sleep(0.3)  # 각 상태 메시지마다 딜레이
+        finally:
+            if self._is_cancelled:
+                reporter.discard()
@@ -1,11 +1,21 @@
 """
 일괄 파일 분석 스레드
 """
-import time
+import threading
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 from PyQt5.QtCore import QThread, pyqtSignal
-from core import DocumentProcessor, LocalLLMAnalyzer
+from core import LocalLLMAnalyzer
+from core.batch_journal import BatchJournal
+from core.batch_pipeline import BatchItem, BatchPipeline
+from core.llm_dispatcher import LLMDispatcher
+from core.model_router import ModelRouter
+from core.scan_index import ScanIndex
+from core.progress import ProgressReporter
+from utils.constants import (
+    OLLAMA_NUM_PARALLEL, LLM_TOKEN_BUDGET, OLLAMA_KEEP_ALIVE,
+    BATCH_EXTRACT_WORKERS, BATCH_DETECT_WORKERS
+)
 from utils.logger import logger
 
 
@@ -18,101 +28,192 @@ class BatchAnalysisThread(QThread):
     all_finished = pyqtSignal()
     status_message = pyqtSignal(str)  # 상태 메시지 시그널 추가
     
-    def __init__(self, file_paths: List[str], model_name: str):
+    def __init__(self, file_paths: List[str], model_name: str,
+                 custom_patterns: Optional[Dict] = None,
+                 parallel_workers: int = 0,
+                 llm_concurrency: int = OLLAMA_NUM_PARALLEL,
+                 llm_token_budget: int = LLM_TOKEN_BUDGET,
+                 use_llm_cache: bool = True, llm_verify: bool = True,
+                 model_router: Optional[ModelRouter] = None,
+                 keep_alive: str = OLLAMA_KEEP_ALIVE,
+                 extract_workers: int = BATCH_EXTRACT_WORKERS,
+                 detect_workers: int = BATCH_DETECT_WORKERS,
+                 journal: Optional[BatchJournal] = None,
+                 scan_index: Optional[ScanIndex] = None):
         super().__init__()
         self.file_paths = file_paths
         self.model_name = model_name
+        self.custom_patterns = custom_patterns or {}
+        self.parallel_workers = parallel_workers
+        self.llm_concurrency = llm_concurrency
+        self.llm_token_budget = llm_token_budget
+        self.use_llm_cache = use_llm_cache
+        self.llm_verify = llm_verify
+        self.model_router = model_router
+        self.keep_alive = keep_alive
+        self.extract_workers = extract_workers
+        self.detect_workers = detect_workers
+        self.journal = journal
+        self.scan_index = scan_index
         self._is_cancelled = False
+        self._pipeline: Optional[BatchPipeline] = None
     
     def cancel(self):
         """일괄 분석 취소"""
         self._is_cancelled = True
+        if self._pipeline is not None:
+            self._pipeline.cancel()
     
     def run(self):
-        """스레드 실행"""
-        self.status_message.emit("🚀 일괄 분석 준비 중...")
-        time.sleep(0.8)
+        """
+        스레드 실행
         
-        self.status_message.emit("🔧 일괄 분석 초기화 중...")
-        time.sleep(0.5)
-        processor = DocumentProcessor()
-        analyzer = LocalLLMAnalyzer(self.model_name, status_callback=self._status_callback)
+        텍스트 추출 / 규칙 기반 탐지는 작업 프로세스 풀에서, LLM 호출은 LLMDispatcher 로
+        최대 llm_concurrency 개를 동시에 요청한다 (BatchPipeline).
+        결과(file_finished)는 LLM 분석이 끝난 순서대로 전송한다.
+        모델 적재(warm-up)는 시작하자마자 별도 스레드에서 진행해 첫 파일 추출/탐지와 겹친다.
+        진행률은 파일별 처리 단계 완료 기준이며 ProgressReporter 가 전송 간격을 제한한다.
+        작업 기록(journal)이 있으면 이미 끝난 파일은 저장된 결과를 먼저 전송하고 건너뛰며,
+        파일이 끝날 때마다 결과를 기록한다. 전체가 끝나면 작업 기록을 삭제한다.
+        증분 재검사 색인(scan_index)이 있으면 지난 분석 이후 바뀌지 않은 파일도 건너뛴다.
+        """
+        total = len(self.file_paths)
+        reporter = ProgressReporter(
+            self.detailed_progress.emit, self.status_message.emit, units=total
+        )
+        reporter.status("🔧 일괄 분석 초기화 중...")
         
-        for i, file_path in enumerate(self.file_paths, 1):
-            # 취소 확인
+        # 이전 작업에서 끝났거나 바뀌지 않은 파일은 저장된 결과 전송
+        # (units: 분석할 파일의 전체 목록 내 순서)
+        finished = 0
+        units = []
+        for unit, file_path in enumerate(self.file_paths):
+            if self._restore_file(reporter, unit, file_path, finished + 1, total):
+                finished += 1
+            else:
+                units.append(unit)
+        if finished:
+            logger.info(f"이전 결과 {finished}개 파일 사용, {len(units)}개 파일 분석")
+        
+        dispatcher = LLMDispatcher(self.llm_concurrency)
+        analyzer = LocalLLMAnalyzer(
+            self.model_name,
+            status_callback=reporter.status,
+            custom_patterns=self.custom_patterns,
+            parallel_workers=self.parallel_workers,
+            llm_token_budget=self.llm_token_budget,
+            use_llm_cache=self.use_llm_cache,
+            llm_verify=self.llm_verify,
+            model_router=self.model_router,
+            keep_alive=self.keep_alive
+        )
+        # 첫 파일의 LLM 요청은 적재가 끝날 때까지 기다림 (생성 타임아웃과 별도)
+        threading.Thread(
+            target=analyzer.warm_up_models, name='llm-warmup', daemon=True
+        ).start()
+        
+        pipeline = self._pipeline = BatchPipeline(
+            analyzer, dispatcher,
+            extract_workers=self.extract_workers,
+            detect_workers=self.detect_workers,
+            on_stage=lambda index, stage: reporter.stage(stage, unit=units[index])
+        )
+        # run() 시작 전에 취소된 경우
+        if self._is_cancelled:
+            pipeline.cancel()
+        
+        try:
+            for item in pipeline.run([self.file_paths[unit] for unit in units]):
+                if self._is_cancelled:
+                    break
+                finished += 1
+                self._record_file(item)
+                self._emit_file(reporter, item, units[item.index], finished, total)
             if self._is_cancelled:
                 logger.info("일괄 분석이 취소되었습니다.")
-                return
-            
-            try:
-                filename = Path(file_path).name
-                self.file_progress.emit(i, len(self.file_paths), filename)
-                
-                # 파일별 세밀한 진행률 계산 (각 파일당 4단계)
-                base_progress = ((i - 1) / len(self.file_paths)) * 100
-                step_size = (1 / len(self.file_paths)) * 100 / 4  # 4단계로 나누기
-                
-                # 1단계: 처리 시작
-                self.detailed_progress.emit(base_progress + step_size * 0.5)
-                self.status_message.emit(f"📄 [{i}/{len(self.file_paths)}] {filename} 처리 시작...")
-                time.sleep(0.3)
-                
-                # 취소 확인
-                if self._is_cancelled:
-                    return
-                
-                # 2단계: 텍스트 추출
-                self.detailed_progress.emit(base_progress + step_size * 1.5)
-                self.status_message.emit(f"📄 [{i}/{len(self.file_paths)}] {filename} - 텍스트 추출 중...")
-                time.sleep(0.2)
-                text = processor.extract_text(file_path)
-                
-                # 취소 확인
-                if self._is_cancelled:
-                    return
-                
-                # 3단계: 분석 시작
-                self.detailed_progress.emit(base_progress + step_size * 2.5)
-                self.status_message.emit(f"🔍 [{i}/{len(self.file_paths)}] {filename} - 분석 중...")
-                time.sleep(0.2)
-                result, detected = analyzer.comprehensive_analysis(text)
-                
-                # 4단계: 분석 완료
-                self.detailed_progress.emit(base_progress + step_size * 4)
-                
-                # 취소 확인
-                if self._is_cancelled:
-                    return
-                
-                # 결과 전송 (텍스트와 파일 경로 포함)
-                self.status_message.emit(f"✅ [{i}/{len(self.file_paths)}] {filename} - 분석 완료")
-                time.sleep(0.4)
-                self.file_finished.emit(filename, result, detected, text, file_path)
-                
-            except Exception as e:
-                logger.error(f"파일 처리 실패 {file_path}: {str(e)}")
-                self.status_message.emit(f"❌ [{i}/{len(self.file_paths)}] {filename} - 분석 실패: {str(e)}")
-                time.sleep(0.5)
-                # 실패한 경우에도 빈 결과 전송 (취소되지 않은 경우만)
-                if not self._is_cancelled:
-                    self.file_finished.emit(
-                        Path(file_path).name, 
-                        {"risk_level": "오류", "risk_score": 0, "reasoning": str(e), "recommendations": []},
-                        [],
-                        "",
-                        file_path
-                    )
-                continue
+        finally:
+            dispatcher.shutdown(cancel_pending=self._is_cancelled)
+            if self._is_cancelled:
+                reporter.discard()
+            # 라우팅 기준 조정용 모델별 지연 시간 (프로세스 누적)
+            latency = analyzer.model_stats.summary()
+            if latency:
+                logger.info(f"모델별 LLM 지연 시간:\n{latency}")
+            if self.scan_index is not None:
+                self.scan_index.compact()
         
         # 전체 완료 (취소되지 않은 경우만)
         if not self._is_cancelled:
-            self.status_message.emit("📊 일괄 분석 결과 정리 중...")
-            time.sleep(0.8)
-            self.status_message.emit(f"🎉 일괄 분석 완료 - 총 {len(self.file_paths)}개 파일 처리")
-            time.sleep(0.5)
+            if self.journal is not None:
+                self.journal.remove()
+            reporter.status(f"🎉 일괄 분석 완료 - 총 {total}개 파일 처리")
+            reporter.flush()
             self.all_finished.emit()
     
-    def _status_callback(self, message: str):
-        """분석기에서 오는 상태 메시지 처리"""
-        self.status_message.emit(message)
-        time.sleep(0.2)  # 각 상태 메시지마다 딜레이
+    def _restore_file(self, reporter: ProgressReporter, unit: int, file_path: str,
+                      finished: int, total: int) -> bool:
+        """작업 기록에 완료되었거나 증분 색인 기록 이후 바뀌지 않은 파일이면 저장된 결과 전송"""
+        if self._is_cancelled:
+            return False
+        for store, message in ((self.journal, "이전 작업 결과 사용"),
+                               (self.scan_index, "변경 없음 - 이전 결과 사용")):
+            if store is None:
+                continue
+            entry = store.finished_entry(file_path)
+            if entry is None:
+                continue
+            try:
+                result, detected, text = store.load_result(entry)
+                break
+            except Exception as e:
+                logger.warning(f"{file_path}: {str(e)}")
+        else:
+            return False
+        
+        # 이전 분석에서 이력에 저장된 결과임을 표시
+        result['resumed'] = True
+        filename = Path(file_path).name
+        self.file_progress.emit(finished, total, filename)
+        reporter.status(f"↩️ [{finished}/{total}] {filename} - {message}")
+        self.file_finished.emit(filename, result, detected, text, file_path)
+        reporter.complete_unit(unit)
+        return True
+    
+    def _record_file(self, item: BatchItem):
+        """
+        파일 1건 결과를 작업 기록 / 증분 색인에 추가
+        
+        LLM 실패로 규칙 기반 결과를 쓴 파일은 색인에 남기지 않고 작업 기록에는 실패로 기록한다
+        (이어서 분석하거나 다음에 분석할 때 LLM 재시도)
+        """
+        if item.error is None and not item.llm_fallback:
+            for store in (self.journal, self.scan_index):
+                if store is not None:
+                    store.record_done(item.file_path, item.fingerprint, item.result, item.detected, item.text)
+        elif self.journal is not None:
+            error = str(item.error) if item.error is not None else "LLM 분석 실패 - 규칙 기반 결과 사용"
+            self.journal.record_failed(item.file_path, error)
+    
+    def _emit_file(self, reporter: ProgressReporter, item: BatchItem, unit: int,
+                   finished: int, total: int):
+        """파일 1건 결과 전송 (unit: 전체 목록 내 순서, finished: 지금까지 완료한 파일 수)"""
+        filename = Path(item.file_path).name
+        self.file_progress.emit(finished, total, filename)
+        
+        if item.error is None:
+            # 결과 전송 (텍스트와 파일 경로 포함)
+            reporter.status(f"✅ [{finished}/{total}] {filename} - 분석 완료")
+            self.file_finished.emit(filename, item.result, item.detected, item.text, item.file_path)
+        else:
+            reporter.status(f"❌ [{finished}/{total}] {filename} - 분석 실패: {str(item.error)}")
+            # 실패한 경우에도 빈 결과 전송
+            self.file_finished.emit(
+                filename,
+                {"risk_level": "오류", "risk_score": 0, "reasoning": str(item.error), "recommendations": []},
+                [],
+                "",
+                item.file_path
+            )
+        
+        # 실패로 건너뛴 단계까지 완료 처리
+        reporter.complete_unit(unit)
@@ -0,0 +1,25 @@
+"""
+모델 적재(warm-up) 스레드
+"""
+from PyQt5.QtCore import QThread, pyqtSignal
+from core.ollama_client import get_ollama_client
+from utils.constants import OLLAMA_KEEP_ALIVE
+
+
+class ModelWarmupThread(QThread):
+    """모델 선택 시 미리 메모리에 적재 (첫 분석의 적재 대기 제거)"""
+    
+    model_loaded = pyqtSignal(str, bool)  # model_name, success
+    
+    def __init__(self, model_name: str, keep_alive: str = OLLAMA_KEEP_ALIVE):
+        super().__init__()
+        self.model_name = model_name
+        self.keep_alive = keep_alive
+    
+    def run(self):
+        """스레드 실행 (서버가 없거나 모델이 설치되지 않았으면 건너뜀)"""
+        client = get_ollama_client()
+        status = client.probe(timeout=2)
+        if not status.running or not status.has_model(self.model_name):
+            return
+        self.model_loaded.emit(self.model_name, client.load_model(self.model_name, self.keep_alive))
@@ -16,9 +16,35 @@ import re
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
 SUPPORTED_EXTENSIONS = ['.pdf', '.docx', '.txt', '.hwp', '.hwpx']
 
-OLLAMA_URL = "http://localhost:11434/api/generate"
-OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
-OLLAMA_TIMEOUT = 30
+OLLAMA_BASE_URL = "http://localhost:11434"  # API 주소는 OllamaClient 가 이 주소로 만듦 (/api/generate, /api/tags)
+OLLAMA_TIMEOUT = 30  # 응답 대기 한도 (초, 스트리밍 시 토큰 간 대기 한도)
+OLLAMA_STREAM = True  # LLM 응답 스트리밍 (토큰 단위 수신 + 증분 JSON 파싱)
+OLLAMA_STREAM_MAX_TIME = 180  # 스트리밍 응답 전체 최대 시간 (초)
+OLLAMA_POOL_SIZE = 4  # Ollama 서버당 유지할 최대 연결 수 (동시 LLM 요청 수)
+OLLAMA_HEALTH_TTL = 30  # 서버 상태/모델 목록 캐시 유지 시간 (초, 연결 성공 시)
+OLLAMA_HEALTH_FAILURE_TTL = 5  # 연결 실패 상태 캐시 유지 시간 (초)
+OLLAMA_KEEP_ALIVE = "30m"  # 마지막 요청 후 모델을 메모리에 유지할 시간 (Ollama keep_alive 형식, -1 은 무기한)
+OLLAMA_LOAD_TIMEOUT = 300  # 모델 적재(warm-up) 대기 한도 (초, 생성 타임아웃과 별도)
+OLLAMA_NUM_PARALLEL = 4  # 일괄 분석 동시 LLM 요청 수 (Ollama 서버의 OLLAMA_NUM_PARALLEL 과 맞춤)
+BATCH_PREFETCH = 2  # 일괄 분석 시 LLM 대기 중 미리 추출/탐지해 둘 파일 수
+BATCH_EXTRACT_WORKERS = 0  # 일괄 분석 텍스트 추출 프로세스 수 (0 이면 CPU 코어 수의 절반)
+BATCH_DETECT_WORKERS = 0  # 일괄 분석 규칙 기반 탐지 프로세스 수 (0 이면 남은 CPU 코어 수)
+BATCH_QUEUE_SIZE = 4  # 일괄 분석 추출 → 탐지 단계 대기열 크기 (역압)
+STREAM_TEXT_MIN_SIZE = MAX_FILE_SIZE  # 일괄 분석 시 이 크기(바이트)를 넘는 TXT 는 스트리밍 탐지 (텍스트를 메모리에 올리지 않음, LLM 분석 생략)
+BATCH_JOURNAL_DIR = 'batch_jobs'  # 일괄 분석 작업 기록 디렉토리 (이어서 분석하기)
+SCAN_INDEX_DIR = 'scan_index'  # 증분 재검사 색인 디렉토리 (바뀌지 않은 파일의 이전 결과)
+PROGRESS_MIN_INTERVAL = 0.1  # 진행률 / 상태 메시지 UI 전송 최소 간격 (초)
+LLM_CHUNK_TOKENS = 2000  # LLM 구간 분석 시 구간당 최대 토큰 수 (문서 본문 추정치)
+LLM_TOKEN_BUDGET = 16000  # 문서당 LLM 에 보낼 최대 토큰 수 (구간 수 상한 = 예산 / 구간 크기)
+LLM_VERIFY_MODE = True  # 규칙 기반 탐지 후보가 있으면 후보 주변만 보내는 LLM 검증 프롬프트 사용
+LLM_CACHE_DIR = 'llm_cache'  # LLM 분석 결과 디스크 캐시 디렉토리
+LLM_CACHE_MAX_BYTES = 64 * 1024 * 1024  # LLM 캐시 최대 크기 (초과 시 오래 사용하지 않은 항목부터 삭제)
+LLM_FAST_MODEL = "gemma3:1b"  # 모델 라우팅: 깨끗하거나 규칙 기반으로 확실한 문서
+LLM_ACCURATE_MODEL = "qwen2.5:7b"  # 모델 라우팅: 판단이 애매한 문서
+LLM_ROUTE_MAX_ACCURATE_TOKENS = 8000  # 정확한 모델에 보낼 문서당 프롬프트 토큰 합계 상한
+LLM_ROUTE_AMBIGUOUS_RATIO = 0.3  # 애매한 후보(키워드 / 낮은 신뢰도) 비율이 이 이상이면 정확한 모델
+LLM_ROUTE_KEYWORD_MIN = 3  # 민감정보 키워드 탐지 항목이 이 이상이면 정확한 모델
+LLM_LATENCY_SAMPLES = 200  # 모델별 지연 시간 통계에 보관할 최근 요청 수
 
 AVAILABLE_MODELS = {
     "llama3.2:3b": "빠르고 안정적, 가장 무난한 선택",
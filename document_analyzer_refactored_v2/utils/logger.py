@@ -2,8 +2,18 @@
 로깅 설정 모듈
 """
 import logging
+import os
 from pathlib import Path
 
+# 로그 수준 환경 변수 (spawn 으로 시작한 작업 프로세스도 같은 수준을 쓰도록 환경 변수로 전달)
+LOG_LEVEL_ENV = 'DOCUMENT_ANALYZER_LOG_LEVEL'
+
+
+def _env_log_level() -> int:
+    """환경 변수의 로그 수준 (없거나 잘못된 값이면 INFO)"""
+    level = getattr(logging, os.environ.get(LOG_LEVEL_ENV, '').upper(), None)
+    return level if isinstance(level, int) else logging.INFO
+
 
 def setup_logger(name: str = __name__, log_file: str = 'document_analyzer.log') -> logging.Logger:
     """로거 설정 및 반환"""
@@ -13,7 +23,7 @@ def setup_logger(name: str = __name__, log_file: str = 'document_analyzer.log')
     if logger.handlers:
         return logger
     
-    logger.setLevel(logging.INFO)
+    logger.setLevel(_env_log_level())
     
     # 파일 핸들러
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
@@ -36,5 +46,11 @@ def setup_logger(name: str = __name__, log_file: str = 'document_analyzer.log')
     return logger
 
 
+def set_log_level(level: int):
+    """기본 로거 수준 변경 (이후 시작하는 작업 프로세스에도 적용)"""
+    os.environ[LOG_LEVEL_ENV] = logging.getLevelName(level)
+    logger.setLevel(level)
+
+
 # 기본 로거
 logger = setup_logger('DocumentAnalyzer')